@@ -11,6 +11,7 @@ from pvlib import (  # noqa: F401
     irradiance,
     ivtools,
     location,
+    mismatch,
     modelchain,
     pvsystem,
     scaling,
@@ -0,0 +1,208 @@
+"""
+Compiled element-wise kernels for the sky diffuse transposition models in
+:py:mod:`pvlib.irradiance`.
+
+Every kernel operates on 1-D, C-contiguous float64 arrays of equal length.
+See :py:mod:`pvlib._kernels`; use the ``how='numba'`` option of the
+functions in :py:mod:`pvlib.irradiance`.
+"""
+
+import math
+
+import numpy as np
+from numba import prange
+
+from pvlib._kernels import jcompile
+
+COSD_85 = math.cos(math.radians(85.))
+
+
+@jcompile
+def isotropic(surface_tilt, dhi):
+    n = dhi.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        out[i] = dhi[i] * (1 + math.cos(math.radians(surface_tilt[i]))) * 0.5
+    return out
+
+
+@jcompile
+def klucher(surface_tilt, surface_azimuth, dhi, ghi, solar_zenith,
+            solar_azimuth):
+    n = dhi.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        tilt = math.radians(surface_tilt[i])
+        zen = math.radians(solar_zenith[i])
+        cos_tt = (math.cos(tilt) * math.cos(zen) + math.sin(tilt) *
+                  math.sin(zen) *
+                  math.cos(math.radians(solar_azimuth[i] -
+                                        surface_azimuth[i])))
+        if cos_tt > 1:
+            cos_tt = 1.
+        if cos_tt < 0:
+            cos_tt = 0.
+        F = 1 - (dhi[i] / ghi[i]) ** 2
+        if math.isnan(F):
+            F = 0.
+        term1 = 0.5 * (1 + math.cos(tilt))
+        term2 = 1 + F * math.sin(0.5 * tilt) ** 3
+        term3 = 1 + F * cos_tt ** 2 * math.sin(zen) ** 3
+        out[i] = dhi[i] * term1 * term2 * term3
+    return out
+
+
+@jcompile
+def haydavies(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
+              solar_zenith, solar_azimuth):
+    n = dhi.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        tilt = math.radians(surface_tilt[i])
+        zen = math.radians(solar_zenith[i])
+        cos_zen = math.cos(zen)
+        cos_tt = (math.cos(tilt) * cos_zen + math.sin(tilt) * math.sin(zen) *
+                  math.cos(math.radians(solar_azimuth[i] -
+                                        surface_azimuth[i])))
+        if cos_tt > 1:
+            cos_tt = 1.
+        if cos_tt < 0:
+            cos_tt = 0.
+        # GH 432
+        Rb = cos_tt / (cos_zen if not cos_zen < 0.01745 else 0.01745)
+        AI = dni[i] / dni_extra[i]
+        sky = dhi[i] * (AI * Rb + (1 - AI) * 0.5 * (1 + math.cos(tilt)))
+        if sky < 0:
+            sky = 0.
+        out[i] = sky
+    return out
+
+
+@jcompile
+def haydavies_projection_ratio(surface_tilt, dhi, dni, dni_extra,
+                               projection_ratio):
+    n = dhi.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        AI = dni[i] / dni_extra[i]
+        term2 = 0.5 * (1 + math.cos(math.radians(surface_tilt[i])))
+        sky = dhi[i] * (AI * projection_ratio[i] + (1 - AI) * term2)
+        if sky < 0:
+            sky = 0.
+        out[i] = sky
+    return out
+
+
+@jcompile
+def reindl(surface_tilt, surface_azimuth, dhi, dni, ghi, dni_extra,
+           solar_zenith, solar_azimuth):
+    n = dhi.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        tilt = math.radians(surface_tilt[i])
+        zen = math.radians(solar_zenith[i])
+        cos_zen = math.cos(zen)
+        cos_tt = (math.cos(tilt) * cos_zen + math.sin(tilt) * math.sin(zen) *
+                  math.cos(math.radians(solar_azimuth[i] -
+                                        surface_azimuth[i])))
+        if cos_tt > 1:
+            cos_tt = 1.
+        if cos_tt < 0:
+            cos_tt = 0.
+        # GH 432
+        Rb = cos_tt / (cos_zen if not cos_zen < 0.01745 else 0.01745)
+        AI = dni[i] / dni_extra[i]
+        HB = dni[i] * cos_zen
+        if HB < 0:
+            HB = 0.
+        if ghi[i] == 0:
+            hb_to_ghi = 0.
+        else:
+            hb_to_ghi = HB / ghi[i]
+        term2 = 0.5 * (1 + math.cos(tilt))
+        term3 = 1 + math.sqrt(hb_to_ghi) * math.sin(0.5 * tilt) ** 3
+        sky = dhi[i] * (AI * Rb + (1 - AI) * term2 * term3)
+        if sky < 0:
+            sky = 0.
+        out[i] = sky
+    return out
+
+
+@jcompile
+def king(surface_tilt, dhi, ghi, solar_zenith):
+    n = dhi.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        cos_tilt = math.cos(math.radians(surface_tilt[i]))
+        sky = (dhi[i] * (1 + cos_tilt) / 2 + ghi[i] *
+               (0.012 * solar_zenith[i] - 0.04) * (1 - cos_tilt) / 2)
+        if sky < 0:
+            sky = 0.
+        out[i] = sky
+    return out
+
+
+@jcompile
+def perez(surface_tilt, surface_azimuth, dhi, dni, dni_extra, solar_zenith,
+          solar_azimuth, airmass, F1c, F2c, bins):
+    n = dhi.shape[0]
+    sky_diffuse = np.empty(n)
+    iso = np.empty(n)
+    circ = np.empty(n)
+    hor = np.empty(n)
+    kappa = 1.041  # for solar_zenith in radians
+    nbins = bins.shape[0]
+    for i in prange(n):
+        tilt = math.radians(surface_tilt[i])
+        z = math.radians(solar_zenith[i])
+        delta = dhi[i] * airmass[i] / dni_extra[i]
+        eps = (((dhi[i] + dni[i]) / dhi[i] + kappa * z ** 3) /
+               (1 + kappa * z ** 3))
+
+        # equivalent to np.digitize(eps, bins) - 1. invalid eps (nan or
+        # below the first bin edge) yields nan coefficients
+        ebin = -1
+        if not math.isnan(eps):
+            for j in range(nbins):
+                if eps >= bins[j]:
+                    ebin = j
+        if ebin < 0:
+            F1 = np.nan
+            F2 = np.nan
+        else:
+            F1 = F1c[ebin, 0] + F1c[ebin, 1] * delta + F1c[ebin, 2] * z
+            if F1 < 0:
+                F1 = 0.
+            F2 = F2c[ebin, 0] + F2c[ebin, 1] * delta + F2c[ebin, 2] * z
+
+        cos_zen = math.cos(z)
+        A = (math.cos(tilt) * cos_zen + math.sin(tilt) * math.sin(z) *
+             math.cos(math.radians(solar_azimuth[i] - surface_azimuth[i])))
+        if A > 1:
+            A = 1.
+        if A < 0:
+            A = 0.
+        B = cos_zen
+        if B < COSD_85:
+            B = COSD_85
+
+        term1 = 0.5 * (1 - F1) * (1 + math.cos(tilt))
+        term2 = F1 * A / B
+        term3 = F2 * math.sin(tilt)
+
+        sky = dhi[i] * (term1 + term2 + term3)
+        if sky < 0:
+            sky = 0.
+        if math.isnan(airmass[i]):
+            sky = 0.
+        sky_diffuse[i] = sky
+
+        if sky == 0:
+            iso[i] = 0.
+            circ[i] = 0.
+            hor[i] = 0.
+        else:
+            iso[i] = dhi[i] * term1
+            circ[i] = dhi[i] * term2
+            hor[i] = dhi[i] * term3
+    return sky_diffuse, iso, circ, hor
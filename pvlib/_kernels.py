@@ -0,0 +1,21 @@
+"""
+Shared numba decorators for the compiled kernels of pvlib.
+
+The ``pvlib._*_kernels`` modules contain element-wise kernels compiled with
+numba in nopython mode. They are not part of the public API; use the
+``how='numba'`` option of the functions that call them instead, which is
+checked by :py:func:`pvlib.tools._use_kernels`. Importing this module, and
+so any of the kernel modules, raises ``ImportError`` if numba is not
+available.
+"""
+
+from numba import njit
+
+
+# error_model='numpy' makes division by zero return inf/nan instead of
+# raising ZeroDivisionError, matching the numpy implementations
+jcompile = njit(parallel=True, error_model='numpy', nogil=True)
+"""Decorator of the multithreaded driver loops of the kernels."""
+
+jscalar = njit(error_model='numpy', nogil=True)
+"""Decorator of the scalar functions called by the driver loops."""
@@ -0,0 +1,132 @@
+"""
+Compiled element-wise kernel for :py:func:`pvlib.modelchain.pvwatts_chain`.
+
+The kernel operates on 2-D, C-contiguous float64 arrays whose dimensions
+are either the full output dimension or 1, i.e. arrays that broadcast
+against the output without being expanded in memory. See
+:py:mod:`pvlib._kernels`; use the ``how='numba'`` option of
+:py:func:`pvlib.modelchain.pvwatts_chain`.
+"""
+
+import math
+
+import numpy as np
+from numba import prange
+
+from pvlib._kernels import jcompile, jscalar
+
+SIN_ZEROANG = math.sin(math.radians(1e-06))
+COS_ZEROANG = math.cos(math.radians(1e-06))
+
+
+@jscalar
+def at(x, i, j):
+    """Element (i, j) of x, broadcasting dimensions of length 1."""
+    return x[i if x.shape[0] > 1 else 0, j if x.shape[1] > 1 else 0]
+
+
+@jscalar
+def physical_iam(cos_aoi, n, K, L):
+    """
+    :py:func:`pvlib.iam.physical` of the cosine of one angle of incidence.
+
+    The sines and cosines of the refraction angle and of its sum and
+    difference with the angle of incidence follow from ``cos_aoi`` by
+    trigonometric identities, which avoids evaluating inverse and
+    tangent functions.
+    """
+    if cos_aoi < 0:
+        return 0.
+    sin_aoi = math.sqrt(1 - cos_aoi * cos_aoi)
+    if sin_aoi == 0:
+        # iam.physical replaces angles of 0 with 1e-06 degrees
+        sin_aoi = SIN_ZEROANG
+        cos_aoi = COS_ZEROANG
+    sin_r = sin_aoi / n
+    cos_r = math.sqrt(1 - sin_r * sin_r)
+    sin_diff = sin_r * cos_aoi - cos_r * sin_aoi
+    sin_sum = sin_r * cos_aoi + cos_r * sin_aoi
+    cos_diff = cos_r * cos_aoi + sin_r * sin_aoi
+    cos_sum = cos_r * cos_aoi - sin_r * sin_aoi
+    rho_zero = ((1 - n) / (1 + n)) ** 2
+    rho_para = (sin_diff * cos_sum / (cos_diff * sin_sum)) ** 2
+    rho_perp = (sin_diff / sin_sum) ** 2
+    iam = ((1 - (rho_para + rho_perp) / 2) / (1 - rho_zero) *
+           math.exp(-K * L / cos_r) / math.exp(-K * L))
+    if iam < 0:
+        iam = 0.
+    return iam
+
+
+@jscalar
+def pvwatts_inverter(pdc, pdc0, eta_inv_nom, eta_inv_ref):
+    """:py:func:`pvlib.inverter.pvwatts` of one DC power, nan as 0."""
+    pac0 = eta_inv_nom * pdc0
+    zeta = pdc / pdc0
+    if pdc == 0:
+        eta = eta_inv_nom / eta_inv_ref * (-0.0162 * zeta + 0.9858)
+    else:
+        eta = eta_inv_nom / eta_inv_ref * (
+            -0.0162 * zeta - 0.0059 / zeta + 0.9858)
+    ac = eta * pdc
+    if math.isnan(ac):
+        return 0.
+    if ac > pac0:
+        ac = pac0
+    if ac < 0:
+        ac = 0.
+    return ac
+
+
+@jcompile
+def pvwatts(cos_tilt, sin_tilt, surface_azimuth, cos_zenith, sin_zenith,
+            solar_azimuth, dni, ghi, dhi, F1, F2, cos_zenith_85, temp_air,
+            wind_speed, albedo, pdc0, gamma_pdc, temp_ref, n, K, L, a, b,
+            deltaT, irrad_ref, loss_factor, inverter_pdc0, eta_inv_nom,
+            eta_inv_ref, rows, columns):
+    dc = np.empty((rows, columns))
+    ac = np.empty((rows, columns))
+    for k in prange(rows * columns):
+        i = k // columns
+        j = k % columns
+        cos_t = at(cos_tilt, i, j)
+        sin_t = at(sin_tilt, i, j)
+        projection = (cos_t * at(cos_zenith, i, j) +
+                      sin_t * at(sin_zenith, i, j) *
+                      math.cos(math.radians(at(solar_azimuth, i, j) -
+                                            at(surface_azimuth, i, j))))
+        if projection > 1:
+            projection = 1.
+        if projection < -1:
+            projection = -1.
+
+        poa_direct = at(dni, i, j) * projection
+        if poa_direct < 0:
+            poa_direct = 0.
+        f1 = at(F1, i, j)
+        sky = at(dhi, i, j) * (
+            0.5 * (1 - f1) * (1 + cos_t) +
+            f1 * (0. if projection < 0 else projection) /
+            at(cos_zenith_85, i, j) +
+            at(F2, i, j) * sin_t)
+        if sky < 0:
+            sky = 0.
+        ground = at(ghi, i, j) * at(albedo, i, j) * (1 - cos_t) * 0.5
+        poa_diffuse = sky + ground
+        poa_global = poa_direct + poa_diffuse
+
+        effective_irradiance = (
+            poa_direct * physical_iam(projection, at(n, i, j), at(K, i, j),
+                                      at(L, i, j)) + poa_diffuse)
+        temp_cell = (poa_global * math.exp(at(a, i, j) + at(b, i, j) *
+                                           at(wind_speed, i, j)) +
+                     at(temp_air, i, j) +
+                     poa_global / at(irrad_ref, i, j) * at(deltaT, i, j))
+        p_dc = (effective_irradiance * 0.001 * at(pdc0, i, j) *
+                (1 + at(gamma_pdc, i, j) *
+                 (temp_cell - at(temp_ref, i, j))) * at(loss_factor, i, j))
+        dc[i, j] = p_dc
+        ac[i, j] = pvwatts_inverter(p_dc, at(inverter_pdc0, i, j),
+                                    at(eta_inv_nom, i, j),
+                                    at(eta_inv_ref, i, j))
+    return dc, ac
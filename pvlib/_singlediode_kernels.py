@@ -0,0 +1,151 @@
+"""
+Compiled element-wise solvers for the diode voltage in
+:py:mod:`pvlib.singlediode`.
+
+Every solver operates on 1-D, C-contiguous float64 arrays of equal length.
+Each element is solved by Newton's method safeguarded by bisection within
+the same bracket that ``method='brentq'`` uses. See
+:py:mod:`pvlib._kernels`; use the ``how='numba'`` option of the functions
+in :py:mod:`pvlib.singlediode`.
+"""
+
+import math
+
+import numpy as np
+from numba import prange
+
+from pvlib._kernels import jcompile, jscalar
+
+# residuals: current for v_from_i, dP/dV for mpp and voltage for i_from_v,
+# as in pvlib.singlediode
+I_RESIDUAL, MPP_RESIDUAL, V_RESIDUAL = 0, 1, 2
+
+# the default tolerances of scipy.optimize.brentq
+XTOL = 2e-12
+RTOL = 4 * np.finfo(float).eps
+MAXITER = 100
+
+
+@jscalar
+def bishop88(diode_voltage, photocurrent, saturation_current,
+             resistance_series, resistance_shunt, nNsVth, d2mutau, NsVbi,
+             breakdown_factor, breakdown_voltage, breakdown_exp, residual):
+    """
+    Residual of ``residual`` type and its derivative with respect to diode
+    voltage, following :py:func:`pvlib.singlediode.bishop88`.
+    """
+    if d2mutau > 0:
+        v_recomb = NsVbi - diode_voltage
+        i_recomb = photocurrent * d2mutau / v_recomb
+        grad_i_recomb = i_recomb / v_recomb
+        grad_2i_recomb = 2 * grad_i_recomb / v_recomb
+    else:
+        i_recomb = 0.
+        grad_i_recomb = 0.
+        grad_2i_recomb = 0.
+    v_star = diode_voltage / nNsVth
+    g_sh = 1.0 / resistance_shunt
+    if breakdown_factor > 0:
+        brk_term = 1 - diode_voltage / breakdown_voltage
+        brk_pwr = brk_term ** -breakdown_exp
+        i_breakdown = breakdown_factor * diode_voltage * g_sh * brk_pwr
+        brk_pwr_1 = brk_term ** (-breakdown_exp - 1)
+        brk_pwr_2 = brk_term ** (-breakdown_exp - 2)
+        brk_fctr = breakdown_factor * g_sh
+        grad_i_brk = brk_fctr * (brk_pwr + diode_voltage *
+                                 -breakdown_exp * brk_pwr_1)
+        grad2i_brk = (brk_fctr * -breakdown_exp *
+                      (2 * brk_pwr_1 + diode_voltage *
+                       (-breakdown_exp - 1) * brk_pwr_2))
+    else:
+        i_breakdown = 0.
+        grad_i_brk = 0.
+        grad2i_brk = 0.
+    expm1_v_star = math.expm1(v_star)
+    i = (photocurrent - saturation_current * expm1_v_star -
+         diode_voltage * g_sh - i_recomb - i_breakdown)
+    v = diode_voltage - i * resistance_series
+    g_diode = saturation_current * (expm1_v_star + 1) / nNsVth
+    grad_i = -g_diode - g_sh - grad_i_recomb - grad_i_brk
+    grad_v = 1.0 - grad_i * resistance_series
+    if residual == V_RESIDUAL:
+        return v, grad_v
+    if residual == I_RESIDUAL:
+        return i, grad_i
+    grad = grad_i / grad_v
+    grad_p = v * grad + i
+    grad2i = -g_diode / nNsVth - grad_2i_recomb - grad2i_brk
+    grad2v = -grad2i * resistance_series
+    grad2p = (grad_v * grad +
+              v * (grad2i / grad_v - grad_i * grad2v / grad_v ** 2) +
+              grad_i)
+    return grad_p, grad2p
+
+
+@jscalar
+def rtsafe(target, lower, upper, photocurrent, saturation_current,
+           resistance_series, resistance_shunt, nNsVth, d2mutau, NsVbi,
+           breakdown_factor, breakdown_voltage, breakdown_exp, residual):
+    """
+    Diode voltage in [lower, upper] where the residual equals ``target``,
+    by Newton's method safeguarded by bisection. Returns nan if the root is
+    not bracketed or the iteration does not converge.
+    """
+    args = (photocurrent, saturation_current, resistance_series,
+            resistance_shunt, nNsVth, d2mutau, NsVbi, breakdown_factor,
+            breakdown_voltage, breakdown_exp, residual)
+    f_lower = bishop88(lower, *args)[0] - target
+    f_upper = bishop88(upper, *args)[0] - target
+    if f_lower == 0:
+        return lower
+    if f_upper == 0:
+        return upper
+    if not f_lower * f_upper < 0:  # also catches nan
+        return np.nan
+    # orient the bracket so that f(x_neg) < 0 < f(x_pos)
+    if f_lower < 0:
+        x_neg, x_pos = lower, upper
+    else:
+        x_neg, x_pos = upper, lower
+    x = 0.5 * (lower + upper)
+    dx_old = abs(upper - lower)
+    dx = dx_old
+    f, df = bishop88(x, *args)
+    f -= target
+    for _ in range(MAXITER):
+        if (((x - x_pos) * df - f) * ((x - x_neg) * df - f) > 0 or
+                abs(2 * f) > abs(dx_old * df)):
+            # Newton step out of the bracket or too slow, bisect instead
+            dx_old = dx
+            dx = 0.5 * (x_pos - x_neg)
+            x = x_neg + dx
+        else:
+            dx_old = dx
+            dx = f / df
+            x -= dx
+        if abs(dx) < XTOL + RTOL * abs(x):
+            return x
+        f, df = bishop88(x, *args)
+        f -= target
+        if f == 0:
+            return x
+        if f < 0:
+            x_neg = x
+        else:
+            x_pos = x
+    return np.nan
+
+
+@jcompile
+def solve(target, upper, photocurrent, saturation_current,
+          resistance_series, resistance_shunt, nNsVth, d2mutau, NsVbi,
+          breakdown_factor, breakdown_voltage, breakdown_exp, residual):
+    n = target.shape[0]
+    out = np.empty(n)
+    for i in prange(n):
+        out[i] = rtsafe(target[i], 0., upper[i], photocurrent[i],
+                        saturation_current[i], resistance_series[i],
+                        resistance_shunt[i], nNsVth[i], d2mutau[i], NsVbi[i],
+                        breakdown_factor, breakdown_voltage, breakdown_exp,
+                        residual)
+    return out
@@ -44,9 +44,8 @@ def _sandia_limits(power_ac, p_dc, Paco, Pnt, Pso):
     below_limit = p_dc < Pso
     try:
         power_ac[below_limit] = min_ac_power
-    except TypeError:  # power_ac is a float
-        if below_limit:
-            power_ac = min_ac_power
+    except TypeError:  # power_ac is a float, or Pnt is an array
+        power_ac = np.where(below_limit, min_ac_power, power_ac)[()]
     return power_ac
 
 
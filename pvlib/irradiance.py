@@ -5,8 +5,9 @@ irradiance, and total irradiance under various conditions.
 """
 
 import datetime
-from collections import OrderedDict
-from functools import partial
+from collections import OrderedDict, deque
+from functools import lru_cache, partial
+import warnings
 
 import numpy as np
 import pandas as pd
@@ -87,16 +88,16 @@ def get_extra_radiation(datetime_or_doy, solar_constant=1366.1,
     to_doy, to_datetimeindex, to_output = \
         _handle_extra_radiation_types(datetime_or_doy, epoch_year)
 
-    # consider putting asce and spencer methods in their own functions
     method = method.lower()
-    if method == 'asce':
-        B = solarposition._calculate_simple_day_angle(to_doy(datetime_or_doy),
-                                                      offset=0)
-        RoverR0sqrd = 1 + 0.033 * np.cos(B)
-    elif method == 'spencer':
-        B = solarposition._calculate_simple_day_angle(to_doy(datetime_or_doy))
-        RoverR0sqrd = (1.00011 + 0.034221 * np.cos(B) + 0.00128 * np.sin(B) +
-                       0.000719 * np.cos(2 * B) + 7.7e-05 * np.sin(2 * B))
+    if method in ('asce', 'spencer'):
+        doy = to_doy(datetime_or_doy)
+        doy_array = np.asarray(doy)
+        if (np.issubdtype(doy_array.dtype, np.integer) and doy_array.size
+                and doy_array.min() >= 0 and doy_array.max() <= 366):
+            # integer days of year, e.g. from datetimes, are looked up
+            RoverR0sqrd = _earthsun_distance_table(method)[doy_array]
+        else:
+            RoverR0sqrd = _earthsun_distance_factor(doy, method)
     elif method == 'pyephem':
         times = to_datetimeindex(datetime_or_doy)
         RoverR0sqrd = solarposition.pyephem_earthsun_distance(times) ** (-2)
@@ -114,6 +115,32 @@ def get_extra_radiation(datetime_or_doy, solar_constant=1366.1,
     return Ea
 
 
+def _earthsun_distance_factor(doy, method):
+    """
+    Calculate (R0/R)^2 from day of year for the 'asce' and 'spencer'
+    methods of :py:func:`get_extra_radiation`.
+    """
+    if method == 'asce':
+        B = solarposition._calculate_simple_day_angle(doy, offset=0)
+        RoverR0sqrd = 1 + 0.033 * np.cos(B)
+    else:
+        B = solarposition._calculate_simple_day_angle(doy)
+        RoverR0sqrd = (1.00011 + 0.034221 * np.cos(B) + 0.00128 * np.sin(B) +
+                       0.000719 * np.cos(2 * B) + 7.7e-05 * np.sin(2 * B))
+    return RoverR0sqrd
+
+
+@lru_cache(maxsize=None)
+def _earthsun_distance_table(method):
+    """
+    Table of (R0/R)^2 for the integer days of year 0 to 366, indexed by
+    day of year. The table is computed once per method.
+    """
+    table = _earthsun_distance_factor(np.arange(367), method)
+    table.flags.writeable = False
+    return table
+
+
 def _handle_extra_radiation_types(datetime_or_doy, epoch_year):
     # This block will set the functions that can be used to convert the
     # inputs to either day of year or pandas DatetimeIndex, and the
@@ -306,7 +333,8 @@ def get_total_irradiance(surface_tilt, surface_azimuth,
                          dni, ghi, dhi, dni_extra=None, airmass=None,
                          albedo=.25, surface_type=None,
                          model='isotropic',
-                         model_perez='allsitescomposite1990', **kwargs):
+                         model_perez='allsitescomposite1990', how='numpy',
+                         **kwargs):
     r"""
     Determine total in-plane irradiance and its beam, sky diffuse and ground
     reflected components, using the specified sky diffuse irradiance model.
@@ -353,6 +381,11 @@ def get_total_irradiance(surface_tilt, surface_azimuth,
         ``'haydavies'``, ``'reindl'``, ``'king'``, ``'perez'``.
     model_perez : str, default 'allsitescomposite1990'
         Used only if ``model='perez'``. See :py:func:`~pvlib.irradiance.perez`.
+    how : str, default 'numpy'
+        Options are ``'numpy'`` or ``'numba'``. ``'numba'`` evaluates the
+        model with a compiled, multithreaded kernel on float64 arrays and
+        falls back to ``'numpy'`` with a warning if numba is not installed.
+        Series inputs must share the same index.
 
     Returns
     -------
@@ -374,7 +407,7 @@ def get_total_irradiance(surface_tilt, surface_azimuth,
     poa_sky_diffuse = get_sky_diffuse(
         surface_tilt, surface_azimuth, solar_zenith, solar_azimuth,
         dni, ghi, dhi, dni_extra=dni_extra, airmass=airmass, model=model,
-        model_perez=model_perez)
+        model_perez=model_perez, how=how)
 
     poa_ground_diffuse = get_ground_diffuse(surface_tilt, ghi, albedo,
                                             surface_type)
@@ -387,7 +420,7 @@ def get_sky_diffuse(surface_tilt, surface_azimuth,
                     solar_zenith, solar_azimuth,
                     dni, ghi, dhi, dni_extra=None, airmass=None,
                     model='isotropic',
-                    model_perez='allsitescomposite1990'):
+                    model_perez='allsitescomposite1990', how='numpy'):
     r"""
     Determine in-plane sky diffuse irradiance component
     using the specified sky diffuse irradiance model.
@@ -425,6 +458,11 @@ def get_sky_diffuse(surface_tilt, surface_azimuth,
         ``'haydavies'``, ``'reindl'``, ``'king'``, ``'perez'``.
     model_perez : str, default 'allsitescomposite1990'
         Used only if ``model='perez'``. See :py:func:`~pvlib.irradiance.perez`.
+    how : str, default 'numpy'
+        Options are ``'numpy'`` or ``'numba'``. ``'numba'`` evaluates the
+        model with a compiled, multithreaded kernel on float64 arrays and
+        falls back to ``'numpy'`` with a warning if numba is not installed.
+        Series inputs must share the same index.
 
     Returns
     -------
@@ -454,24 +492,24 @@ def get_sky_diffuse(surface_tilt, surface_azimuth,
         raise ValueError(f'dni_extra is required for model {model}')
 
     if model == 'isotropic':
-        sky = isotropic(surface_tilt, dhi)
+        sky = isotropic(surface_tilt, dhi, how=how)
     elif model == 'klucher':
         sky = klucher(surface_tilt, surface_azimuth, dhi, ghi,
-                      solar_zenith, solar_azimuth)
+                      solar_zenith, solar_azimuth, how=how)
     elif model == 'haydavies':
         sky = haydavies(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
-                        solar_zenith, solar_azimuth)
+                        solar_zenith, solar_azimuth, how=how)
     elif model == 'reindl':
         sky = reindl(surface_tilt, surface_azimuth, dhi, dni, ghi, dni_extra,
-                     solar_zenith, solar_azimuth)
+                     solar_zenith, solar_azimuth, how=how)
     elif model == 'king':
-        sky = king(surface_tilt, dhi, ghi, solar_zenith)
+        sky = king(surface_tilt, dhi, ghi, solar_zenith, how=how)
     elif model == 'perez':
         if airmass is None:
             airmass = atmosphere.get_relative_airmass(solar_zenith)
         sky = perez(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
                     solar_zenith, solar_azimuth, airmass,
-                    model=model_perez)
+                    model=model_perez, how=how)
     else:
         raise ValueError(f'invalid model selection {model}')
 
@@ -603,7 +641,65 @@ def get_ground_diffuse(surface_tilt, ghi, albedo=.25, surface_type=None):
     return diffuse_irrad
 
 
-def isotropic(surface_tilt, dhi):
+def _series_name(args, projection_args=()):
+    """
+    Name of the Series returned by the numpy implementation of a model.
+
+    Following pandas, the result of arithmetic between Series keeps a
+    name only if all operands share it. ``args`` are the inputs that
+    enter the result as Series, ``projection_args`` are the angles
+    passed to :py:func:`aoi_projection`, which names its output
+    ``'aoi_projection'``.
+    """
+    names = {a.name for a in args if isinstance(a, pd.Series)}
+    if any(isinstance(a, pd.Series) for a in projection_args):
+        names.add('aoi_projection')
+    return names.pop() if len(names) == 1 else None
+
+
+def _call_kernel(name, args, constants=(), series_name=None):
+    """
+    Evaluate a compiled kernel element-wise.
+
+    ``args`` are broadcast against each other and passed to the kernel as
+    contiguous 1-D float64 arrays, ``constants`` are passed unchanged. The
+    output(s) are reshaped to the broadcast shape and returned as Series
+    named ``series_name`` if any of ``args`` is a Series.
+
+    Raises
+    ------
+    ValueError
+        If Series in ``args`` do not share the same index.
+    """
+    from pvlib import _irradiance_kernels
+
+    index = None
+    for arg in args:
+        if isinstance(arg, pd.Series):
+            if index is None:
+                index = arg.index
+            elif not arg.index.equals(index):
+                raise ValueError("Series inputs must have the same index "
+                                 "with how='numba'")
+
+    arrays = [np.asarray(a, dtype=np.float64) for a in args]
+    shape = np.broadcast(*arrays).shape
+    arrays = [np.ascontiguousarray(np.broadcast_to(a, shape)).ravel()
+              for a in arrays]
+    out = getattr(_irradiance_kernels, name)(*arrays, *constants)
+
+    def restore(x):
+        x = x.reshape(shape)
+        if index is not None:
+            return pd.Series(x, index=index, name=series_name)
+        return x[()]
+
+    if isinstance(out, tuple):
+        return tuple(restore(x) for x in out)
+    return restore(out)
+
+
+def isotropic(surface_tilt, dhi, how='numpy'):
     r'''
     Determine diffuse irradiance from the sky on a tilted surface using
     the isotropic sky model.
@@ -628,6 +724,12 @@ def isotropic(surface_tilt, dhi):
     dhi : numeric
         Diffuse horizontal irradiance in W/m^2. DHI must be >=0.
 
+    how : str, default 'numpy'
+        Options are ``'numpy'`` or ``'numba'``. ``'numba'`` evaluates the
+        model with a compiled, multithreaded kernel on float64 arrays and
+        falls back to ``'numpy'`` with a warning if numba is not installed.
+        Series inputs must share the same index.
+
     Returns
     -------
     diffuse : numeric
@@ -643,13 +745,17 @@ def isotropic(surface_tilt, dhi):
        heat collector. Trans. ASME 64, 91.
     '''
 
+    if tools._use_kernels(how, '_irradiance_kernels'):
+        return _call_kernel('isotropic', (surface_tilt, dhi),
+                            series_name=_series_name((surface_tilt, dhi)))
+
     sky_diffuse = dhi * (1 + tools.cosd(surface_tilt)) * 0.5
 
     return sky_diffuse
 
 
 def klucher(surface_tilt, surface_azimuth, dhi, ghi, solar_zenith,
-            solar_azimuth):
+            solar_azimuth, how='numpy'):
     r'''
     Determine diffuse irradiance from the sky on a tilted surface
     using Klucher's 1979 model
@@ -699,6 +805,12 @@ def klucher(surface_tilt, surface_azimuth, dhi, ghi, solar_zenith,
         and <=360. The Azimuth convention is defined as degrees east of
         north (e.g. North = 0, East = 90, West = 270).
 
+    how : str, default 'numpy'
+        Options are ``'numpy'`` or ``'numba'``. ``'numba'`` evaluates the
+        model with a compiled, multithreaded kernel on float64 arrays and
+        falls back to ``'numpy'`` with a warning if numba is not installed.
+        Series inputs must share the same index.
+
     Returns
     -------
     diffuse : numeric
@@ -714,6 +826,15 @@ def klucher(surface_tilt, surface_azimuth, dhi, ghi, solar_zenith,
        tilted surfaces. Solar Energy 23 (2), 111-114.
     '''
 
+    if tools._use_kernels(how, '_irradiance_kernels'):
+        projection_args = (surface_tilt, surface_azimuth, solar_zenith,
+                           solar_azimuth)
+        return _call_kernel(
+            'klucher', (surface_tilt, surface_azimuth, dhi, ghi,
+                        solar_zenith, solar_azimuth),
+            series_name=_series_name((surface_tilt, dhi, ghi, solar_zenith),
+                                     projection_args))
+
     # zenith angle with respect to panel normal.
     cos_tt = aoi_projection(surface_tilt, surface_azimuth,
                             solar_zenith, solar_azimuth)
@@ -739,7 +860,8 @@ def klucher(surface_tilt, surface_azimuth, dhi, ghi, solar_zenith,
 
 
 def haydavies(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
-              solar_zenith=None, solar_azimuth=None, projection_ratio=None):
+              solar_zenith=None, solar_azimuth=None, projection_ratio=None,
+              how='numpy'):
     r'''
     Determine diffuse irradiance from the sky on a tilted surface using
     Hay & Davies' 1980 model
@@ -790,6 +912,12 @@ def haydavies(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
         projection. Must supply ``solar_zenith`` and ``solar_azimuth``
         or supply ``projection_ratio``.
 
+    how : str, default 'numpy'
+        Options are ``'numpy'`` or ``'numba'``. ``'numba'`` evaluates the
+        model with a compiled, multithreaded kernel on float64 arrays and
+        falls back to ``'numpy'`` with a warning if numba is not installed.
+        Series inputs must share the same index.
+
     Returns
     --------
     sky_diffuse : numeric
@@ -813,6 +941,20 @@ def haydavies(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
        Ministry of Supply and Services, Canada.
     '''
 
+    if tools._use_kernels(how, '_irradiance_kernels'):
+        if projection_ratio is None:
+            projection_args = (surface_tilt, surface_azimuth, solar_zenith,
+                               solar_azimuth)
+            return _call_kernel(
+                'haydavies', (surface_tilt, surface_azimuth, dhi, dni,
+                              dni_extra, solar_zenith, solar_azimuth),
+                series_name=_series_name(
+                    (surface_tilt, dhi, dni, dni_extra, solar_zenith),
+                    projection_args))
+        args = (surface_tilt, dhi, dni, dni_extra, projection_ratio)
+        return _call_kernel('haydavies_projection_ratio', args,
+                            series_name=_series_name(args))
+
     # if necessary, calculate ratio of titled and horizontal beam irradiance
     if projection_ratio is None:
         cos_tt = aoi_projection(surface_tilt, surface_azimuth,
@@ -837,7 +979,7 @@ def haydavies(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
 
 
 def reindl(surface_tilt, surface_azimuth, dhi, dni, ghi, dni_extra,
-           solar_zenith, solar_azimuth):
+           solar_zenith, solar_azimuth, how='numpy'):
     r'''
     Determine diffuse irradiance from the sky on a tilted surface using
     Reindl's 1990 model
@@ -886,6 +1028,12 @@ def reindl(surface_tilt, surface_azimuth, dhi, dni, ghi, dni_extra,
         defined as degrees east of north (e.g. North = 0, East = 90,
         West = 270).
 
+    how : str, default 'numpy'
+        Options are ``'numpy'`` or ``'numba'``. ``'numba'`` evaluates the
+        model with a compiled, multithreaded kernel on float64 arrays and
+        falls back to ``'numpy'`` with a warning if numba is not installed.
+        Series inputs must share the same index.
+
     Returns
     -------
     poa_sky_diffuse : numeric
@@ -912,6 +1060,17 @@ def reindl(surface_tilt, surface_azimuth, dhi, dni, ghi, dni_extra,
        hourly tilted surface radiation models. Solar Energy 45(1), 9-17.
     '''
 
+    if tools._use_kernels(how, '_irradiance_kernels'):
+        # ghi only enters the numpy implementation through np.where
+        projection_args = (surface_tilt, surface_azimuth, solar_zenith,
+                           solar_azimuth)
+        return _call_kernel(
+            'reindl', (surface_tilt, surface_azimuth, dhi, dni, ghi,
+                       dni_extra, solar_zenith, solar_azimuth),
+            series_name=_series_name(
+                (surface_tilt, dhi, dni, dni_extra, solar_zenith),
+                projection_args))
+
     cos_tt = aoi_projection(surface_tilt, surface_azimuth,
                             solar_zenith, solar_azimuth)
     cos_tt = np.maximum(cos_tt, 0)  # GH 526
@@ -941,7 +1100,7 @@ def reindl(surface_tilt, surface_azimuth, dhi, dni, ghi, dni_extra,
     return sky_diffuse
 
 
-def king(surface_tilt, dhi, ghi, solar_zenith):
+def king(surface_tilt, dhi, ghi, solar_zenith, how='numpy'):
     '''
     Determine diffuse irradiance from the sky on a tilted surface using
     the King model.
@@ -969,12 +1128,22 @@ def king(surface_tilt, dhi, ghi, solar_zenith):
     solar_zenith : numeric
         Apparent (refraction-corrected) zenith angles in decimal degrees.
 
+    how : str, default 'numpy'
+        Options are ``'numpy'`` or ``'numba'``. ``'numba'`` evaluates the
+        model with a compiled, multithreaded kernel on float64 arrays and
+        falls back to ``'numpy'`` with a warning if numba is not installed.
+        Series inputs must share the same index.
+
     Returns
     --------
     poa_sky_diffuse : numeric
         The diffuse component of the solar radiation.
     '''
 
+    if tools._use_kernels(how, '_irradiance_kernels'):
+        args = (surface_tilt, dhi, ghi, solar_zenith)
+        return _call_kernel('king', args, series_name=_series_name(args))
+
     sky_diffuse = (dhi * (1 + tools.cosd(surface_tilt)) / 2 + ghi *
                    (0.012 * solar_zenith - 0.04) *
                    (1 - tools.cosd(surface_tilt)) / 2)
@@ -985,7 +1154,8 @@ def king(surface_tilt, dhi, ghi, solar_zenith):
 
 def perez(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
           solar_zenith, solar_azimuth, airmass,
-          model='allsitescomposite1990', return_components=False):
+          model='allsitescomposite1990', return_components=False,
+          how='numpy'):
     '''
     Determine diffuse irradiance from the sky on a tilted surface using
     one of the Perez models.
@@ -1056,6 +1226,12 @@ def perez(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
         Flag used to decide whether to return the calculated diffuse components
         or not.
 
+    how : str, default 'numpy'
+        Options are ``'numpy'`` or ``'numba'``. ``'numba'`` evaluates the
+        model with a compiled, multithreaded kernel on float64 arrays and
+        falls back to ``'numpy'`` with a warning if numba is not installed.
+        Series inputs must share the same index.
+
     Returns
     --------
     numeric, OrderedDict, or DataFrame
@@ -1093,52 +1269,37 @@ def perez(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
        Perez Diffuse Radiation Model". SAND88-7030
     '''
 
-    kappa = 1.041  # for solar_zenith in radians
-    z = np.radians(solar_zenith)  # convert to radians
-
-    # delta is the sky's "brightness"
-    delta = dhi * airmass / dni_extra
-
-    # epsilon is the sky's "clearness"
-    with np.errstate(invalid='ignore'):
-        eps = ((dhi + dni) / dhi + kappa * (z ** 3)) / (1 + kappa * (z ** 3))
-
-    # numpy indexing below will not work with a Series
-    if isinstance(eps, pd.Series):
-        eps = eps.values
-
-    # Perez et al define clearness bins according to the following
-    # rules. 1 = overcast ... 8 = clear (these names really only make
-    # sense for small zenith angles, but...) these values will
-    # eventually be used as indicies for coeffecient look ups
-    ebin = np.digitize(eps, (0., 1.065, 1.23, 1.5, 1.95, 2.8, 4.5, 6.2))
-    ebin = np.array(ebin)  # GH 642
-    ebin[np.isnan(eps)] = 0
-
-    # correct for 0 indexing in coeffecient lookup
-    # later, ebin = -1 will yield nan coefficients
-    ebin -= 1
-
-    # The various possible sets of Perez coefficients are contained
-    # in a subfunction to clean up the code.
-    F1c, F2c = _get_perez_coefficients(model)
-
-    # results in invalid eps (ebin = -1) being mapped to nans
-    nans = np.array([np.nan, np.nan, np.nan])
-    F1c = np.vstack((F1c, nans))
-    F2c = np.vstack((F2c, nans))
-
-    F1 = (F1c[ebin, 0] + F1c[ebin, 1] * delta + F1c[ebin, 2] * z)
-    F1 = np.maximum(F1, 0)
+    if tools._use_kernels(how, '_irradiance_kernels'):
+        F1c, F2c = _get_perez_coefficients(model)
+        constants = (np.ascontiguousarray(F1c, dtype=np.float64),
+                     np.ascontiguousarray(F2c, dtype=np.float64),
+                     np.array(_PEREZ_EPS_BINS))
+        # dni only enters the numpy implementation through eps.values
+        series_name = _series_name(
+            (surface_tilt, dhi, dni_extra, solar_zenith, airmass),
+            (surface_tilt, surface_azimuth, solar_zenith, solar_azimuth))
+        sky_diffuse, *components = _call_kernel(
+            'perez', (surface_tilt, surface_azimuth, dhi, dni, dni_extra,
+                      solar_zenith, solar_azimuth, airmass), constants,
+            series_name=series_name)
+        if not return_components:
+            return sky_diffuse
+        diffuse_components = OrderedDict(
+            zip(['sky_diffuse', 'isotropic', 'circumsolar', 'horizon'],
+                [sky_diffuse] + components))
+        if isinstance(sky_diffuse, pd.Series):
+            return pd.DataFrame(diffuse_components)
+        return dict(diffuse_components)
 
-    F2 = (F2c[ebin, 0] + F2c[ebin, 1] * delta + F2c[ebin, 2] * z)
+    F1, F2 = _perez_brightening(dhi, dni, dni_extra, solar_zenith, airmass,
+                                model)
 
     A = aoi_projection(surface_tilt, surface_azimuth,
                        solar_zenith, solar_azimuth)
     A = np.maximum(A, 0)
 
     B = tools.cosd(solar_zenith)
-    B = np.maximum(B, tools.cosd(85))
+    B = np.maximum(B, F1.dtype.type(tools.cosd(85)))
 
     # Calculate Diffuse POA from sky dome
     term1 = 0.5 * (1 - F1) * (1 + tools.cosd(surface_tilt))
@@ -1175,6 +1336,63 @@ def perez(surface_tilt, surface_azimuth, dhi, dni, dni_extra,
         return sky_diffuse
 
 
+# Perez et al define clearness bins according to the following
+# rules. 1 = overcast ... 8 = clear (these names really only make
+# sense for small zenith angles, but...) these values will
+# eventually be used as indicies for coeffecient look ups
+_PEREZ_EPS_BINS = (0., 1.065, 1.23, 1.5, 1.95, 2.8, 4.5, 6.2)
+
+
+def _perez_brightening(dhi, dni, dni_extra, solar_zenith, airmass, model):
+    """
+    Circumsolar and horizon brightening coefficients F1 and F2 of
+    :py:func:`perez`.
+
+    The coefficients depend only on the sky and the sun, not on the
+    orientation of the surface.
+    """
+    kappa = 1.041  # for solar_zenith in radians
+    z = np.radians(solar_zenith)  # convert to radians
+
+    # delta is the sky's "brightness"
+    delta = dhi * airmass / dni_extra
+
+    # epsilon is the sky's "clearness"
+    with np.errstate(invalid='ignore'):
+        eps = ((dhi + dni) / dhi + kappa * (z ** 3)) / (1 + kappa * (z ** 3))
+
+    # numpy indexing below will not work with a Series
+    if isinstance(eps, pd.Series):
+        eps = eps.values
+
+    ebin = np.digitize(eps, _PEREZ_EPS_BINS)
+    ebin = np.array(ebin)  # GH 642
+    ebin[np.isnan(eps)] = 0
+
+    # correct for 0 indexing in coeffecient lookup
+    # later, ebin = -1 will yield nan coefficients
+    ebin -= 1
+
+    # The various possible sets of Perez coefficients are contained
+    # in a subfunction to clean up the code.
+    F1c, F2c = _get_perez_coefficients(model)
+
+    # results in invalid eps (ebin = -1) being mapped to nans. the
+    # coefficients take the dtype of the inputs so that float32 inputs are
+    # not upcast to float64
+    dtype = np.result_type(delta, z)
+    nans = np.array([np.nan, np.nan, np.nan])
+    F1c = np.vstack((F1c, nans)).astype(dtype, copy=False)
+    F2c = np.vstack((F2c, nans)).astype(dtype, copy=False)
+
+    F1 = (F1c[ebin, 0] + F1c[ebin, 1] * delta + F1c[ebin, 2] * z)
+    F1 = np.maximum(F1, 0)
+
+    F2 = (F2c[ebin, 0] + F2c[ebin, 1] * delta + F2c[ebin, 2] * z)
+
+    return F1, F2
+
+
 def clearsky_index(ghi, clearsky_ghi, max_clearsky_index=2.0):
     """
     Calculate the clearsky index.
@@ -1320,7 +1538,8 @@ def _kt_kt_prime_factor(airmass):
 
 
 def disc(ghi, solar_zenith, datetime_or_doy, pressure=101325,
-         min_cos_zenith=0.065, max_zenith=87, max_airmass=12):
+         min_cos_zenith=0.065, max_zenith=87, max_airmass=12,
+         dni_extra=None):
     """
     Estimate Direct Normal Irradiance from Global Horizontal Irradiance
     using the DISC model.
@@ -1368,6 +1587,12 @@ def disc(ghi, solar_zenith, datetime_or_doy, pressure=101325,
         Default value (12) comes from range over which Kn was fit
         to airmass in the original paper.
 
+    dni_extra : None or numeric, default None
+        Extraterrestrial normal irradiance in W/m^2. If None,
+        ``dni_extra`` is calculated from ``datetime_or_doy`` using
+        :py:func:`get_extra_radiation` with ``method='spencer'`` and a
+        solar constant of 1370 W/m^2.
+
     Returns
     -------
     output : OrderedDict or DataFrame
@@ -1395,9 +1620,12 @@ def disc(ghi, solar_zenith, datetime_or_doy, pressure=101325,
     dirint
     """
 
-    # this is the I0 calculation from the reference
-    # SSC uses solar constant = 1367.0 (checked 2018 08 15)
-    I0 = get_extra_radiation(datetime_or_doy, 1370., 'spencer')
+    if dni_extra is None:
+        # this is the I0 calculation from the reference
+        # SSC uses solar constant = 1367.0 (checked 2018 08 15)
+        I0 = get_extra_radiation(datetime_or_doy, 1370., 'spencer')
+    else:
+        I0 = dni_extra
 
     kt = clearness_index(ghi, solar_zenith, I0, min_cos_zenith=min_cos_zenith,
                          max_clearness_index=1)
@@ -1470,7 +1698,8 @@ def _disc_kn(clearness_index, airmass, max_airmass=12):
 
 
 def dirint(ghi, solar_zenith, times, pressure=101325., use_delta_kt_prime=True,
-           temp_dew=None, min_cos_zenith=0.065, max_zenith=87):
+           temp_dew=None, min_cos_zenith=0.065, max_zenith=87,
+           dni_extra=None):
     """
     Determine DNI from GHI using the DIRINT modification of the DISC
     model.
@@ -1522,6 +1751,10 @@ def dirint(ghi, solar_zenith, times, pressure=101325., use_delta_kt_prime=True,
         Maximum value of zenith to allow in DNI calculation. DNI will be
         set to 0 for times with zenith values greater than `max_zenith`.
 
+    dni_extra : None or array-like, default None
+        Extraterrestrial normal irradiance in W/m^2. Passed to
+        :py:func:`disc`; if None, it is calculated from ``times``.
+
     Returns
     -------
     dni : array-like
@@ -1545,7 +1778,8 @@ def dirint(ghi, solar_zenith, times, pressure=101325., use_delta_kt_prime=True,
     """
 
     disc_out = disc(ghi, solar_zenith, times, pressure=pressure,
-                    min_cos_zenith=min_cos_zenith, max_zenith=max_zenith)
+                    min_cos_zenith=min_cos_zenith, max_zenith=max_zenith,
+                    dni_extra=dni_extra)
     airmass = disc_out['airmass']
     kt = disc_out['kt']
 
@@ -1712,9 +1946,152 @@ def _dirint_bins(times, kt_prime, zenith, w, delta_kt_prime):
     return kt_prime_bin, zenith_bin, w_bin, delta_kt_prime_bin
 
 
+class DirintStream:
+    """
+    Apply the DIRINT model to GHI that arrives in consecutive blocks.
+
+    :py:func:`dirint` calculates the stability index delta_kt_prime from
+    the previous and the next value of kt_prime. A DirintStream carries
+    kt_prime across block boundaries so that the concatenated output of
+    :py:meth:`update` and :py:meth:`flush` is identical to calling
+    :py:func:`dirint` on the complete time series.
+
+    Because delta_kt_prime depends on the next value, the DNI of the last
+    time of each block is returned by the following call to
+    :py:meth:`update`, or by :py:meth:`flush` at the end of the series.
+    With ``use_delta_kt_prime=False`` all DNI values are returned
+    immediately.
+
+    Parameters
+    ----------
+    use_delta_kt_prime : bool, default True
+        See :py:func:`dirint`.
+
+    min_cos_zenith : numeric, default 0.065
+        See :py:func:`dirint`.
+
+    max_zenith : numeric, default 87
+        See :py:func:`dirint`.
+
+    Examples
+    --------
+    >>> stream = DirintStream()
+    >>> for block in blocks:
+    ...     dni = stream.update(block['ghi'], block['zenith'], block.index)
+    ...     publish(dni)
+    >>> publish(stream.flush())
+
+    See Also
+    --------
+    dirint
+    """
+
+    def __init__(self, use_delta_kt_prime=True, min_cos_zenith=0.065,
+                 max_zenith=87):
+        self.use_delta_kt_prime = use_delta_kt_prime
+        self.min_cos_zenith = min_cos_zenith
+        self.max_zenith = max_zenith
+        # rows not yet returned, preceded by n_context rows that have been
+        # returned and are kept only for their kt_prime
+        self._pending = None
+        self._n_context = 0
+
+    def update(self, ghi, solar_zenith, times, pressure=101325.,
+               temp_dew=None, dni_extra=None):
+        """
+        Add a block of data and return the DNI that can be determined.
+
+        Parameters
+        ----------
+        ghi : array-like
+            Global horizontal irradiance in W/m^2.
+
+        solar_zenith : array-like
+            True (not refraction-corrected) solar_zenith angles in decimal
+            degrees.
+
+        times : DatetimeIndex
+            Must be later than the times of the previous blocks.
+
+        pressure : float or array-like, default 101325.0
+            See :py:func:`dirint`.
+
+        temp_dew : None, float, or array-like, default None
+            See :py:func:`dirint`.
+
+        dni_extra : None or array-like, default None
+            See :py:func:`dirint`.
+
+        Returns
+        -------
+        dni : Series
+            The modeled direct normal irradiance in W/m^2 for the times
+            that are complete.
+
+        Raises
+        ------
+        ValueError
+            If ``times`` does not follow the times of the previous blocks.
+        """
+        disc_out = disc(ghi, solar_zenith, times, pressure=pressure,
+                        min_cos_zenith=self.min_cos_zenith,
+                        max_zenith=self.max_zenith, dni_extra=dni_extra)
+        kt_prime = clearness_index_zenith_independent(
+            disc_out['kt'], disc_out['airmass'], max_clearness_index=1)
+        block = pd.DataFrame({
+            'dni': np.asarray(disc_out['dni']),
+            'kt_prime': np.asarray(kt_prime),
+            'solar_zenith': np.asarray(solar_zenith),
+            'w': np.asarray(_temp_dew_dirint(temp_dew, times)),
+        }, index=times)
+
+        if self._pending is not None:
+            if len(block) and block.index[0] <= self._pending.index[-1]:
+                raise ValueError('times must follow the times of the '
+                                 'previous block')
+            block = pd.concat([self._pending, block])
+        return self._dirint(block, final=False)
+
+    def flush(self):
+        """
+        Return the DNI held back by :py:meth:`update` and reset the stream.
+
+        Returns
+        -------
+        dni : Series
+            The modeled direct normal irradiance in W/m^2 for the last
+            time passed to :py:meth:`update`. Empty if there is none.
+        """
+        if self._pending is None:
+            return pd.Series(dtype=float, name='dni')
+        dni = self._dirint(self._pending, final=True)
+        self._pending = None
+        self._n_context = 0
+        return dni
+
+    def _dirint(self, data, final):
+        delta_kt_prime = _delta_kt_prime_dirint(
+            data['kt_prime'], self.use_delta_kt_prime, data.index)
+        start = self._n_context
+        stop = len(data)
+        if self.use_delta_kt_prime and not final:
+            stop = max(stop - 1, start)
+        out = data.iloc[start:stop]
+        dirint_coeffs = _dirint_coeffs(out.index, out['kt_prime'],
+                                       out['solar_zenith'], out['w'],
+                                       delta_kt_prime.iloc[start:stop])
+        if self.use_delta_kt_prime:
+            # keep the last returned row as the previous value of the rows
+            # that are held back
+            keep = max(stop - 1, 0)
+            self._pending = data.iloc[keep:] if keep < len(data) else None
+            self._n_context = stop - keep
+        return out['dni'] * dirint_coeffs
+
+
 def dirindex(ghi, ghi_clearsky, dni_clearsky, zenith, times, pressure=101325.,
              use_delta_kt_prime=True, temp_dew=None, min_cos_zenith=0.065,
-             max_zenith=87):
+             max_zenith=87, dni_extra=None):
     """
     Determine DNI from GHI using the DIRINDEX model.
 
@@ -1771,6 +2148,10 @@ def dirindex(ghi, ghi_clearsky, dni_clearsky, zenith, times, pressure=101325.,
         Maximum value of zenith to allow in DNI calculation. DNI will be
         set to 0 for times with zenith values greater than `max_zenith`.
 
+    dni_extra : None or array-like, default None
+        Extraterrestrial normal irradiance in W/m^2. If None, it is
+        calculated from ``times`` as in :py:func:`disc`.
+
     Returns
     -------
     dni : array-like
@@ -1788,17 +2169,21 @@ def dirindex(ghi, ghi_clearsky, dni_clearsky, zenith, times, pressure=101325.,
        irradiances: description and validation. Solar Energy, 73(5), 307-317.
     """
 
+    if dni_extra is None:
+        # shared by both dirint calls
+        dni_extra = get_extra_radiation(times, 1370., 'spencer')
+
     dni_dirint = dirint(ghi, zenith, times, pressure=pressure,
                         use_delta_kt_prime=use_delta_kt_prime,
                         temp_dew=temp_dew, min_cos_zenith=min_cos_zenith,
-                        max_zenith=max_zenith)
+                        max_zenith=max_zenith, dni_extra=dni_extra)
 
     dni_dirint_clearsky = dirint(ghi_clearsky, zenith, times,
                                  pressure=pressure,
                                  use_delta_kt_prime=use_delta_kt_prime,
                                  temp_dew=temp_dew,
                                  min_cos_zenith=min_cos_zenith,
-                                 max_zenith=max_zenith)
+                                 max_zenith=max_zenith, dni_extra=dni_extra)
 
     dni_dirindex = dni_clearsky * dni_dirint / dni_dirint_clearsky
 
@@ -1908,20 +2293,23 @@ def gti_dirint(poa_global, aoi, solar_zenith, solar_azimuth, times,
 
     aoi_lt_90 = aoi < 90
 
+    I0 = get_extra_radiation(times, 1370, 'spencer')
+
     # for AOI less than 90 degrees
     ghi, dni, dhi, kt_prime = _gti_dirint_lt_90(
         poa_global, aoi, aoi_lt_90, solar_zenith, solar_azimuth, times,
         surface_tilt, surface_azimuth, pressure=pressure,
         use_delta_kt_prime=use_delta_kt_prime, temp_dew=temp_dew,
         albedo=albedo, model=model, model_perez=model_perez,
-        max_iterations=max_iterations)
+        max_iterations=max_iterations, dni_extra=I0)
 
     # for AOI greater than or equal to 90 degrees
     if calculate_gt_90:
         ghi_gte_90, dni_gte_90, dhi_gte_90 = _gti_dirint_gte_90(
             poa_global, aoi, solar_zenith, solar_azimuth,
             surface_tilt, times, kt_prime,
-            pressure=pressure, temp_dew=temp_dew, albedo=albedo)
+            pressure=pressure, temp_dew=temp_dew, albedo=albedo,
+            dni_extra=I0)
     else:
         ghi_gte_90, dni_gte_90, dhi_gte_90 = np.nan, np.nan, np.nan
 
@@ -1940,13 +2328,16 @@ def _gti_dirint_lt_90(poa_global, aoi, aoi_lt_90, solar_zenith, solar_azimuth,
                       times, surface_tilt, surface_azimuth, pressure=101325.,
                       use_delta_kt_prime=True, temp_dew=None, albedo=.25,
                       model='perez', model_perez='allsitescomposite1990',
-                      max_iterations=30):
+                      max_iterations=30, dni_extra=None):
     """
     GTI-DIRINT model for AOI < 90 degrees. See Marion 2015 Section 2.1.
 
     See gti_dirint signature for parameter details.
     """
-    I0 = get_extra_radiation(times, 1370, 'spencer')
+    if dni_extra is None:
+        I0 = get_extra_radiation(times, 1370, 'spencer')
+    else:
+        I0 = dni_extra
     cos_zenith = tools.cosd(solar_zenith)
     # I0h as in Marion 2015 eqns 1, 3
     I0h = I0 * np.maximum(0.065, cos_zenith)
@@ -2043,7 +2434,6 @@ def _gti_dirint_lt_90(poa_global, aoi, aoi_lt_90, solar_zenith, solar_azimuth,
     else:
         # we are here because we ran out of coeffs to loop over and
         # therefore we have exceeded max_iterations
-        import warnings
         failed_points = best_diff[aoi_lt_90][~best_diff_lte_1_lt_90]
         warnings.warn(
             ('%s points failed to converge after %s iterations. best_diff:\n%s'
@@ -2056,7 +2446,8 @@ def _gti_dirint_lt_90(poa_global, aoi, aoi_lt_90, solar_zenith, solar_azimuth,
 
 def _gti_dirint_gte_90(poa_global, aoi, solar_zenith, solar_azimuth,
                        surface_tilt, times, kt_prime,
-                       pressure=101325., temp_dew=None, albedo=.25):
+                       pressure=101325., temp_dew=None, albedo=.25,
+                       dni_extra=None):
     """
     GTI-DIRINT model for AOI >= 90 degrees. See Marion 2015 Section 2.2.
 
@@ -2066,7 +2457,10 @@ def _gti_dirint_gte_90(poa_global, aoi, solar_zenith, solar_azimuth,
                                                   solar_azimuth, times,
                                                   kt_prime)
 
-    I0 = get_extra_radiation(times, 1370, 'spencer')
+    if dni_extra is None:
+        I0 = get_extra_radiation(times, 1370, 'spencer')
+    else:
+        I0 = dni_extra
     airmass = atmosphere.get_relative_airmass(solar_zenith, model='kasten1966')
     airmass = atmosphere.get_absolute_airmass(airmass, pressure)
     kt = kt_prime_gte_90 * _kt_kt_prime_factor(airmass)
@@ -2135,7 +2529,8 @@ def _gti_dirint_gte_90_kt_prime(aoi, solar_zenith, solar_azimuth, times,
     return kt_prime_gte_90
 
 
-def erbs(ghi, zenith, datetime_or_doy, min_cos_zenith=0.065, max_zenith=87):
+def erbs(ghi, zenith, datetime_or_doy, min_cos_zenith=0.065, max_zenith=87,
+         dni_extra=None):
     r"""
     Estimate DNI and DHI from GHI using the Erbs model.
 
@@ -2171,6 +2566,10 @@ def erbs(ghi, zenith, datetime_or_doy, min_cos_zenith=0.065, max_zenith=87):
     max_zenith : numeric, default 87
         Maximum value of zenith to allow in DNI calculation. DNI will be
         set to 0 for times with zenith values greater than `max_zenith`.
+    dni_extra : None or numeric, default None
+        Extraterrestrial normal irradiance in W/m^2. If None, it is
+        calculated from ``datetime_or_doy`` using
+        :py:func:`get_extra_radiation`.
 
     Returns
     -------
@@ -2195,7 +2594,8 @@ def erbs(ghi, zenith, datetime_or_doy, min_cos_zenith=0.065, max_zenith=87):
     disc
     """
 
-    dni_extra = get_extra_radiation(datetime_or_doy)
+    if dni_extra is None:
+        dni_extra = get_extra_radiation(datetime_or_doy)
 
     kt = clearness_index(ghi, zenith, dni_extra, min_cos_zenith=min_cos_zenith,
                          max_clearness_index=1)
@@ -2915,3 +3315,204 @@ def dni(ghi, dhi, zenith, clearsky_dni=None, clearsky_tolerance=1.1,
             (zenith < zenith_threshold_for_zero_dni) &
             (dni > max_dni)] = max_dni
     return dni
+
+
+def iter_total_irradiance(chunks, latitude, longitude, surface_tilt,
+                          surface_azimuth, altitude=0, decomposition=None,
+                          albedo=.25, surface_type=None, model='isotropic',
+                          model_perez='allsitescomposite1990',
+                          solar_position_method='nrel_numpy',
+                          processes=None):
+    r"""
+    Determine total in-plane irradiance for a time series that is supplied
+    in consecutive blocks of time, e.g. read incrementally from disk.
+
+    For each block the solar position, optionally the decomposition of GHI
+    into DNI and DHI, and the transposition to the plane of array are
+    calculated, and the result is yielded before the next blocks are
+    read, so that only a few blocks are held in memory at any time.
+
+    Parameters
+    ----------
+    chunks : iterable of DataFrame
+        Consecutive, non-overlapping blocks of the time series in time
+        order. Each block must have a localized DatetimeIndex and a
+        ``'ghi'`` column, plus ``'dni'`` and ``'dhi'`` columns if
+        ``decomposition`` is None. Optional columns ``'pressure'`` [Pa],
+        ``'temp_air'`` [C] and ``'temp_dew'`` [C] are used for the
+        solar position and, with ``decomposition='dirint'``, for the
+        decomposition. For example, ``pd.read_csv(..., chunksize=n)``
+        or a generator over the record batches of a Parquet file.
+    latitude : float
+        Latitude in decimal degrees. Positive north of equator, negative
+        to south.
+    longitude : float
+        Longitude in decimal degrees. Positive east of prime meridian,
+        negative to west.
+    surface_tilt : numeric
+        Panel tilt from horizontal. [degree]
+    surface_azimuth : numeric
+        Panel azimuth from north. [degree]
+    altitude : float, default 0
+        Site altitude in meters. Used for the solar position and airmass
+        if the blocks do not have a ``'pressure'`` column.
+    decomposition : None or str, default None
+        If not None, DNI and DHI are estimated from GHI with one of
+        ``'dirint'``, ``'disc'`` or ``'erbs'``.
+    albedo : numeric, default 0.25
+        Surface albedo. [unitless]
+    surface_type : None or str, default None
+        Surface type. See :py:func:`~pvlib.irradiance.get_ground_diffuse` for
+        the list of accepted values.
+    model : str, default 'isotropic'
+        Irradiance model. See
+        :py:func:`~pvlib.irradiance.get_total_irradiance`.
+    model_perez : str, default 'allsitescomposite1990'
+        Used only if ``model='perez'``. See :py:func:`~pvlib.irradiance.perez`.
+    solar_position_method : str, default 'nrel_numpy'
+        Passed to :py:func:`~pvlib.solarposition.get_solarposition`.
+    processes : None or int, default None
+        If None, the blocks are evaluated in the calling process. Otherwise
+        the blocks are evaluated in parallel by a pool of ``processes``
+        worker processes, with at most ``2 * processes`` blocks in flight.
+
+    Yields
+    ------
+    total_irrad : DataFrame
+        Result for each block, in the same order and with the same index
+        as the input blocks. Columns are ``'poa_global', 'poa_direct',
+        'poa_diffuse', 'poa_sky_diffuse', 'poa_ground_diffuse'`` and, if
+        ``decomposition`` is not None, the estimated ``'dni'`` and
+        ``'dhi'``.
+
+    Notes
+    -----
+    Results are identical to evaluating the concatenated time series at
+    once. The stability index of ``'dirint'`` depends on the previous and
+    next samples, so each block is evaluated together with the last row
+    of the preceding block and the first row of the following block.
+
+    Examples
+    --------
+    >>> reader = pd.read_csv('weather.csv', index_col=0, parse_dates=True,
+    ...                      chunksize=525600)
+    >>> results = iter_total_irradiance(reader, 40, -105, 30, 180,
+    ...                                 decomposition='dirint',
+    ...                                 model='perez', processes=4)
+    >>> for i, poa in enumerate(results):
+    ...     poa.to_parquet(f'poa_{i}.parquet')
+
+    See Also
+    --------
+    get_total_irradiance
+    """
+    if decomposition not in (None, 'dirint', 'disc', 'erbs'):
+        raise ValueError(f'invalid decomposition {decomposition}')
+    # number of neighboring samples needed on each side of a block
+    halo = 1 if decomposition == 'dirint' else 0
+
+    kwargs = dict(latitude=latitude, longitude=longitude,
+                  surface_tilt=surface_tilt, surface_azimuth=surface_azimuth,
+                  altitude=altitude, decomposition=decomposition,
+                  albedo=albedo, surface_type=surface_type, model=model,
+                  model_perez=model_perez,
+                  solar_position_method=solar_position_method)
+    padded_chunks = _pad_chunks(chunks, halo)
+
+    if processes is None:
+        for data, start, stop in padded_chunks:
+            yield _total_irradiance_chunk(data, start, stop, **kwargs)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+
+    # fork is unsafe once threads, e.g. of the numba kernels, are running
+    mp_context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(processes, mp_context=mp_context) as executor:
+        pending = deque()
+        for data, start, stop in padded_chunks:
+            pending.append(executor.submit(_total_irradiance_chunk, data,
+                                           start, stop, **kwargs))
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _pad_chunks(chunks, halo):
+    """
+    Attach the last ``halo`` rows of the previous block and the first
+    ``halo`` rows of the next block to each block.
+
+    Yields the padded block and the positions of the original block
+    within it.
+    """
+    previous = None
+    before = None
+    for chunk in chunks:
+        if len(chunk) == 0:
+            continue
+        if previous is not None:
+            yield _pad_chunk(before, previous, chunk.iloc[:halo])
+            before = previous.iloc[len(previous) - halo:]
+        previous = chunk
+    if previous is not None:
+        yield _pad_chunk(before, previous, None)
+
+
+def _pad_chunk(before, chunk, after):
+    start = 0 if before is None else len(before)
+    stop = start + len(chunk)
+    parts = [p for p in (before, chunk, after) if p is not None and len(p)]
+    data = pd.concat(parts) if len(parts) > 1 else chunk
+    return data, start, stop
+
+
+def _total_irradiance_chunk(data, start, stop, latitude, longitude,
+                            surface_tilt, surface_azimuth, altitude,
+                            decomposition, albedo, surface_type, model,
+                            model_perez, solar_position_method):
+    """
+    Evaluate one padded block for :py:func:`iter_total_irradiance`.
+    """
+    times = data.index
+    pressure = data.get('pressure')
+    if pressure is None:
+        pressure = atmosphere.alt2pres(altitude)
+    solpos_kwargs = {}
+    if 'temp_air' in data:
+        solpos_kwargs['temperature'] = data['temp_air']
+    solar_position = solarposition.get_solarposition(
+        times, latitude, longitude, altitude=altitude, pressure=pressure,
+        method=solar_position_method, **solpos_kwargs)
+    zenith = solar_position['zenith']
+
+    ghi = data['ghi']
+    if decomposition is None:
+        dni = data['dni']
+        dhi = data['dhi']
+    else:
+        if decomposition == 'erbs':
+            erbs_out = erbs(ghi, zenith, times)
+            dni, dhi = erbs_out['dni'], erbs_out['dhi']
+        else:
+            if decomposition == 'dirint':
+                dni = dirint(ghi, zenith, times, pressure=pressure,
+                             temp_dew=data.get('temp_dew'))
+            else:
+                dni = disc(ghi, zenith, times, pressure=pressure)['dni']
+            dhi = ghi - dni * tools.cosd(zenith)
+
+    airmass = atmosphere.get_relative_airmass(
+        solar_position['apparent_zenith'])
+    total_irrad = get_total_irradiance(
+        surface_tilt, surface_azimuth, solar_position['apparent_zenith'],
+        solar_position['azimuth'], dni, ghi, dhi,
+        dni_extra=get_extra_radiation(times), airmass=airmass,
+        albedo=albedo, surface_type=surface_type, model=model,
+        model_perez=model_perez)
+    if decomposition is not None:
+        total_irrad['dni'] = dni
+        total_irrad['dhi'] = dhi
+    return total_irrad.iloc[start:stop]
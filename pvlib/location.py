@@ -4,9 +4,11 @@ This module contains the Location class.
 
 # Will Holmgren, University of Arizona, 2014-2016.
 
+from collections import OrderedDict
 import datetime
 import warnings
 
+import numpy as np
 import pandas as pd
 import pytz
 
@@ -280,8 +282,9 @@ class Location:
         ----------
         times : None or DatetimeIndex, default None
             Only used if solar_position is not provided.
-        solar_position : None or DataFrame, default None
-            DataFrame with with columns 'apparent_zenith', 'zenith'.
+        solar_position : None, DataFrame or dict, default None
+            DataFrame or dict of arrays with keys 'apparent_zenith',
+            'zenith'.
         model : str, default 'kastenyoung1989'
             Relative airmass model. See
             :py:func:`pvlib.atmosphere.get_relative_airmass`
@@ -289,8 +292,9 @@ class Location:
 
         Returns
         -------
-        airmass : DataFrame
-            Columns are 'airmass_relative', 'airmass_absolute'
+        airmass : DataFrame or OrderedDict
+            Columns are 'airmass_relative', 'airmass_absolute'. An
+            OrderedDict of arrays if solar_position is a dict.
 
         See also
         --------
@@ -313,10 +317,13 @@ class Location:
         airmass_absolute = atmosphere.get_absolute_airmass(airmass_relative,
                                                            pressure)
 
-        airmass = pd.DataFrame(index=solar_position.index)
+        airmass = OrderedDict()
         airmass['airmass_relative'] = airmass_relative
         airmass['airmass_absolute'] = airmass_absolute
 
+        if isinstance(solar_position, pd.DataFrame):
+            airmass = pd.DataFrame(airmass, index=solar_position.index)
+
         return airmass
 
     def get_sun_rise_set_transit(self, times, method='pyephem', **kwargs):
@@ -357,3 +364,134 @@ class Location:
                              'one of pyephem, spa, geometric'
                              .format(method))
         return result
+
+
+class SolarPositionCache:
+    """
+    Cache of the solar position and airmass of recent time indexes at
+    Locations, to calculate them once per site for the ModelChains of
+    several systems at the same Location.
+
+    An entry is reused if the latitude, longitude and altitude of the
+    Location, the times, and the method, pressure, temperature and other
+    arguments of the solar position calculation are equal to those of the
+    request. The least recently used entry is removed when the cache is
+    full. The cached DataFrames are returned without copying, so they must
+    not be modified.
+
+    Parameters
+    ----------
+    maxsize : int, default 16
+        Number of entries.
+
+    Attributes
+    ----------
+    hits : int
+        Number of requests of solar position that were found in the cache.
+    misses : int
+        Number of requests of solar position that were calculated.
+
+    See also
+    --------
+    pvlib.location.Location.get_solarposition
+    pvlib.location.Location.get_airmass
+    """
+
+    def __init__(self, maxsize=16):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.maxsize = int(maxsize)
+        self.clear()
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        # least recently used first
+        self._entries = []
+        self.hits = 0
+        self.misses = 0
+
+    def get_solarposition(self, location, times, pressure=None,
+                          temperature=12, **kwargs):
+        """
+        Solar position at `location`, from the cache if possible.
+
+        Parameters
+        ----------
+        location : Location
+        times, pressure, temperature, kwargs
+            See :py:meth:`Location.get_solarposition`.
+
+        Returns
+        -------
+        solar_position : DataFrame
+            See :py:meth:`Location.get_solarposition`.
+        """
+        key = (location.latitude, location.longitude, location.altitude)
+        args = dict(kwargs, pressure=pressure, temperature=temperature)
+        for index, entry in enumerate(self._entries):
+            if (entry['key'] == key and _same_times(entry['times'], times)
+                    and _same_args(entry['args'], args)):
+                self._entries.append(self._entries.pop(index))
+                self.hits += 1
+                return entry['solar_position']
+        self.misses += 1
+        solar_position = location.get_solarposition(
+            times, pressure=pressure, temperature=temperature, **kwargs)
+        self._entries.append({'key': key, 'times': times, 'args': args,
+                              'solar_position': solar_position,
+                              'airmass': {}})
+        if len(self._entries) > self.maxsize:
+            del self._entries[0]
+        return solar_position
+
+    def get_airmass(self, location, solar_position, model='kastenyoung1989'):
+        """
+        Airmass at `location`, from the cache if possible.
+
+        Parameters
+        ----------
+        location : Location
+        solar_position : DataFrame
+            Solar position returned by :py:meth:`get_solarposition` for
+            the same `location`. The airmass is calculated without caching
+            for other solar positions.
+        model : str, default 'kastenyoung1989'
+            See :py:meth:`Location.get_airmass`.
+
+        Returns
+        -------
+        airmass : DataFrame
+            See :py:meth:`Location.get_airmass`.
+        """
+        key = (location.latitude, location.longitude, location.altitude)
+        for entry in self._entries:
+            if entry['solar_position'] is solar_position:
+                if entry['key'] != key:
+                    break
+                if model not in entry['airmass']:
+                    entry['airmass'][model] = location.get_airmass(
+                        solar_position=solar_position, model=model)
+                return entry['airmass'][model]
+        return location.get_airmass(solar_position=solar_position,
+                                    model=model)
+
+
+def _same_times(times, other):
+    """True if two time indexes are equal and have the same time zone."""
+    return (len(times) == len(other) and
+            str(getattr(times, 'tz', None)) == str(getattr(other, 'tz', None))
+            and pd.DatetimeIndex(times).equals(pd.DatetimeIndex(other)))
+
+
+def _same_args(args, other):
+    """True if two dicts of scalar or array arguments are equal."""
+    if args.keys() != other.keys():
+        return False
+    for key, value in args.items():
+        if value is other[key]:
+            continue
+        if np.shape(value) != np.shape(other[key]):
+            return False
+        if not np.array_equal(value, other[key]):
+            return False
+    return True
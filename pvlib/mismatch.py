@@ -0,0 +1,306 @@
+"""
+The ``mismatch`` module contains functions that combine the IV curves of
+cells, modules and strings connected in series and in parallel, with bypass
+diodes, to model the effect of mismatch on the output of a PV system.
+
+All functions operate on batches of IV curves: the points of each curve are
+along the last axis, and any leading axes, e.g. time, are broadcast. Memory
+use is proportional to the total number of points, so long time series are
+best processed in blocks of time.
+"""
+
+import numpy as np
+
+from pvlib.singlediode import bishop88, estimate_voc
+
+
+def device_curves(photocurrent, saturation_current, resistance_series,
+                  resistance_shunt, nNsVth, d2mutau=0, NsVbi=np.Inf,
+                  breakdown_factor=0., breakdown_voltage=-5.5,
+                  breakdown_exp=3.28, ivcurve_pnts=100,
+                  reverse_voltage=None):
+    """
+    IV curves of devices in forward and reverse bias.
+
+    The curves are calculated by :py:func:`pvlib.singlediode.bishop88` at
+    diode voltages from ``reverse_voltage`` to the estimated open circuit
+    voltage. A quarter of the points are evenly spaced in reverse bias, the
+    rest are concentrated towards open circuit, like the points of
+    :py:func:`pvlib.pvsystem.singlediode` with ``method='newton'``.
+
+    Parameters
+    ----------
+    photocurrent : numeric
+        photogenerated current (Iph or IL) [A]
+    saturation_current : numeric
+        diode dark or saturation current (Io or Isat) [A]
+    resistance_series : numeric
+        series resistance (Rs) in [Ohm]
+    resistance_shunt : numeric
+        shunt resistance (Rsh) [Ohm]
+    nNsVth : numeric
+        product of diode ideality factor (n), number of series cells (Ns), and
+        thermal voltage (Vth = k_b * T / q_e) in volts [V]
+    d2mutau : numeric, default 0
+        PVsyst parameter for cadmium-telluride (CdTe) and amorphous-silicon
+        (a-Si) modules that accounts for recombination current in the
+        intrinsic layer, see :py:func:`pvlib.singlediode.bishop88` [V]
+    NsVbi : numeric, default np.inf
+        PVsyst parameter for cadmium-telluride (CdTe) and amorphous-silicon
+        (a-Si) modules that is the product of the PV module number of series
+        cells ``Ns`` and the builtin voltage ``Vbi`` of the intrinsic layer.
+        [V].
+    breakdown_factor : float, default 0
+        fraction of ohmic current involved in avalanche breakdown :math:`a`.
+        Default of 0 excludes the reverse bias term from the model. [unitless]
+    breakdown_voltage : float, default -5.50
+        reverse breakdown voltage of the photovoltaic junction :math:`V_{br}`
+        [V]
+    breakdown_exp : float, default 3.28
+        avalanche breakdown exponent :math:`m` [unitless]
+    ivcurve_pnts : int, default 100
+        Number of points on each curve, at least 4.
+    reverse_voltage : numeric, optional
+        Lowest diode voltage of the curves. Default is
+        ``0.95 * breakdown_voltage``. [V]
+
+    Returns
+    -------
+    current : numpy.ndarray
+        Current of the curves, in order of increasing voltage. The shape is
+        the broadcast shape of the inputs with an extra last axis of length
+        ``ivcurve_pnts``. [A]
+    voltage : numpy.ndarray
+        Voltage of the curves, same shape as ``current``. [V]
+
+    See also
+    --------
+    pvlib.singlediode.bishop88
+    combine_series
+    combine_parallel
+    """
+    if ivcurve_pnts < 4:
+        raise ValueError('ivcurve_pnts must be at least 4')
+    if reverse_voltage is None:
+        reverse_voltage = 0.95 * breakdown_voltage
+    args = (photocurrent, saturation_current, resistance_series,
+            resistance_shunt, nNsVth, d2mutau, NsVbi)
+    voc_est = estimate_voc(photocurrent, saturation_current, nNsVth)
+    shape = np.broadcast(voc_est, reverse_voltage, *args).shape
+    args = [np.asarray(arg)[..., np.newaxis] for arg in args]
+
+    n_reverse = ivcurve_pnts // 4
+    reverse = np.linspace(1, 0, n_reverse, endpoint=False)
+    forward = (11. - np.logspace(np.log10(11.), 0.,
+                                 ivcurve_pnts - n_reverse)) / 10.
+    reverse_voltage = np.broadcast_to(reverse_voltage, shape)[..., np.newaxis]
+    voc_est = np.broadcast_to(voc_est, shape)[..., np.newaxis]
+    vd = np.concatenate([reverse_voltage * reverse, voc_est * forward],
+                        axis=-1)
+    current, voltage, _ = bishop88(vd, *args, breakdown_factor,
+                                   breakdown_voltage, breakdown_exp)
+    return current, voltage
+
+
+def combine_series(current, voltage, ivcurve_pnts=None,
+                   bypass_voltage=None):
+    """
+    Combine the IV curves of devices connected in series.
+
+    The voltages of the devices are added at common currents, which are
+    evenly spaced from the lowest to the highest current of all curves.
+    Outside of its range of current, the voltage of a curve is extrapolated
+    linearly from its end segments.
+
+    Parameters
+    ----------
+    current : array-like
+        Current of the curves of the devices, with the points of each curve
+        along the last axis and the devices along the second to last axis,
+        e.g. shape ``(time, device, point)``. [A]
+    voltage : array-like
+        Voltage of the curves of the devices, in order of increasing voltage
+        along the last axis. Broadcast with ``current``. [V]
+    ivcurve_pnts : int, optional
+        Number of points on the combined curves. Default is the number of
+        points on the curves of the devices.
+    bypass_voltage : numeric, optional
+        Forward voltage of a bypass diode across each device. The voltage of
+        a device is not lower than ``-bypass_voltage``. Default is no bypass
+        diodes. [V]
+
+    Returns
+    -------
+    current : numpy.ndarray
+        Current of the combined curves, in order of increasing voltage. The
+        shape is the broadcast shape of the inputs without the device axis
+        and with ``ivcurve_pnts`` points along the last axis. [A]
+    voltage : numpy.ndarray
+        Voltage of the combined curves, same shape as ``current``. [V]
+
+    See also
+    --------
+    device_curves
+    combine_parallel
+    """
+    current, voltage = np.broadcast_arrays(np.asarray(current, dtype=float),
+                                           np.asarray(voltage, dtype=float))
+    if ivcurve_pnts is None:
+        ivcurve_pnts = current.shape[-1]
+    # current decreases with voltage along the curves
+    i_common = _linspace(current.max(axis=(-2, -1)),
+                         current.min(axis=(-2, -1)), ivcurve_pnts)
+    v_devices = _interp(i_common[..., np.newaxis, :], current[..., ::-1],
+                        voltage[..., ::-1])
+    if bypass_voltage is not None:
+        v_devices = np.maximum(
+            v_devices, -np.asarray(bypass_voltage)[..., np.newaxis])
+    return i_common, v_devices.sum(axis=-2)
+
+
+def combine_parallel(current, voltage, ivcurve_pnts=None):
+    """
+    Combine the IV curves of devices connected in parallel.
+
+    The currents of the devices are added at common voltages, which are
+    evenly spaced from the lowest to the highest voltage of all curves.
+    Outside of its range of voltage, the current of a curve is extrapolated
+    linearly from its end segments.
+
+    Parameters
+    ----------
+    current : array-like
+        Current of the curves of the devices, with the points of each curve
+        along the last axis and the devices along the second to last axis,
+        e.g. shape ``(time, device, point)``. [A]
+    voltage : array-like
+        Voltage of the curves of the devices, in order of increasing voltage
+        along the last axis. Broadcast with ``current``. [V]
+    ivcurve_pnts : int, optional
+        Number of points on the combined curves. Default is the number of
+        points on the curves of the devices.
+
+    Returns
+    -------
+    current : numpy.ndarray
+        Current of the combined curves, in order of increasing voltage. The
+        shape is the broadcast shape of the inputs without the device axis
+        and with ``ivcurve_pnts`` points along the last axis. [A]
+    voltage : numpy.ndarray
+        Voltage of the combined curves, same shape as ``current``. [V]
+
+    See also
+    --------
+    device_curves
+    combine_series
+    """
+    current, voltage = np.broadcast_arrays(np.asarray(current, dtype=float),
+                                           np.asarray(voltage, dtype=float))
+    if ivcurve_pnts is None:
+        ivcurve_pnts = current.shape[-1]
+    v_common = _linspace(voltage.min(axis=(-2, -1)),
+                         voltage.max(axis=(-2, -1)), ivcurve_pnts)
+    i_devices = _interp(v_common[..., np.newaxis, :], voltage, current)
+    return i_devices.sum(axis=-2), v_common
+
+
+def max_power_point(current, voltage):
+    """
+    Maximum power point of IV curves.
+
+    The maximum power point is the point of the curve with the highest
+    power, refined by the vertex of the parabola through that point and its
+    neighbours.
+
+    Parameters
+    ----------
+    current : array-like
+        Current of the curves, with the points of each curve along the last
+        axis. [A]
+    voltage : array-like
+        Voltage of the curves, in order of increasing voltage along the last
+        axis. Broadcast with ``current``. [V]
+
+    Returns
+    -------
+    i_mp : numeric
+        Current at the maximum power point. [A]
+    v_mp : numeric
+        Voltage at the maximum power point. [V]
+    p_mp : numeric
+        Power at the maximum power point. [W]
+    """
+    current, voltage = np.broadcast_arrays(np.asarray(current, dtype=float),
+                                           np.asarray(voltage, dtype=float))
+    shape = current.shape
+    n = shape[-1]
+    current = current.reshape(-1, n)
+    voltage = voltage.reshape(-1, n)
+    power = current * voltage
+    rows = np.arange(power.shape[0])
+    k = np.argmax(power, axis=-1)
+    # neighbours of the maximum, shifted inside the curve at its ends
+    k = np.clip(k, 1, n - 2)
+    v0, v1, v2 = (voltage[rows, k + j] for j in (-1, 0, 1))
+    p0, p1, p2 = (power[rows, k + j] for j in (-1, 0, 1))
+    # vertex of the parabola through the three points
+    num = (v1 - v0) ** 2 * (p1 - p2) - (v1 - v2) ** 2 * (p1 - p0)
+    den = (v1 - v0) * (p1 - p2) - (v1 - v2) * (p1 - p0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        v_mp = v1 - 0.5 * num / den
+    # use the highest point if the parabola isn't concave or its vertex is
+    # outside of the three points
+    valid = (den > 0) & (v_mp >= v0) & (v_mp <= v2)
+    v_mp = np.where(valid, v_mp, v1)
+    i_mp = np.where(valid,
+                    _interp(v_mp[:, np.newaxis], voltage, current)[:, 0],
+                    current[rows, k])
+    p_mp = np.where(valid, i_mp * v_mp, p1)
+    return tuple(x.reshape(shape[:-1])[()] for x in (i_mp, v_mp, p_mp))
+
+
+def _linspace(start, stop, num):
+    """:py:func:`numpy.linspace` along a new last axis for array bounds."""
+    start = np.asarray(start)[..., np.newaxis]
+    stop = np.asarray(stop)[..., np.newaxis]
+    return start + (stop - start) * np.linspace(0., 1., num)
+
+
+def _interp(x, xp, fp):
+    """
+    Linear interpolation of each curve along the last axis, like
+    :py:func:`numpy.interp`, with linear extrapolation from the end
+    segments. ``xp`` must be non-decreasing along the last axis; the inputs
+    are broadcast except for their last axis.
+    """
+    shape = np.broadcast(x[..., 0], xp[..., 0], fp[..., 0]).shape
+    m, n = x.shape[-1], xp.shape[-1]
+    x = np.broadcast_to(x, shape + (m,)).reshape(-1, m)
+    xp = np.broadcast_to(xp, shape + (n,)).reshape(-1, n)
+    fp = np.broadcast_to(fp, shape + (n,)).reshape(-1, n)
+    rows = np.arange(xp.shape[0])[:, np.newaxis]
+    # a non-finite value would break the sort order of all curves, so the
+    # curves with any are searched as zeros and return nan
+    invalid = ~(np.isfinite(xp).all(axis=1) & np.isfinite(x).all(axis=1))
+    if invalid.any():
+        xp = np.where(invalid[:, np.newaxis], 0., xp)
+        x = np.where(invalid[:, np.newaxis], 0., x)
+    # scale every curve to [0, 1] and shift it into its own interval, then
+    # one sorted search finds the segments of all curves
+    lower = np.minimum(xp[:, :1], x.min(axis=1, keepdims=True))
+    span = np.maximum(xp[:, -1:], x.max(axis=1, keepdims=True)) - lower
+    span = np.where(span > 0, span, 1.)
+    xp_shifted = (xp - lower) / span + 2 * rows
+    x_shifted = (x - lower) / span + 2 * rows
+    k = np.searchsorted(xp_shifted.ravel(), x_shifted.ravel(), side='right')
+    # flat index of the upper end of the segment, within the same curve
+    k = np.clip(k.reshape(x.shape), n * rows + 1, n * rows + n - 1)
+    xp, fp = xp.ravel(), fp.ravel()
+    x0, x1 = xp.take(k - 1), xp.take(k)
+    f0, f1 = fp.take(k - 1), fp.take(k)
+    dx = x1 - x0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = np.where(dx != 0, (f1 - f0) / dx, 0.)
+    out = f0 + slope * (x - x0)
+    out[invalid] = np.nan
+    return out.reshape(shape + (m,))
@@ -6,15 +6,21 @@ library. With great power comes great responsibility: users should take
 the time to read the source code for the module.
 """
 
+from collections import OrderedDict
 from functools import partial
 import itertools
+import multiprocessing
+import time
 import warnings
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass, field
 from typing import Union, Tuple, Optional, TypeVar
 
-from pvlib import (atmosphere, clearsky, inverter, pvsystem, solarposition,
-                   temperature, tools)
+from pvlib import (atmosphere, clearsky, iam, inverter, pvsystem,
+                   solarposition, temperature, tools)
+from pvlib.singlediode import SingleDiodeTable
+from pvlib.location import Location
 from pvlib.tracking import SingleAxisTracker
 import pvlib.irradiance  # avoid name conflict with full import
 from pvlib.pvsystem import _DC_MODEL_PARAMS
@@ -39,6 +45,28 @@ TEMPERATURE_KEYS = ('module_temperature', 'cell_temperature')
 
 DATA_KEYS = WEATHER_KEYS + POA_KEYS + TEMPERATURE_KEYS
 
+# stages of ModelChain.run_model in order: 0 prepare inputs, 1 aoi model,
+# 2 spectral model, 3 effective irradiance, 4 temperature, 5 dc model,
+# 6 dc ohmic model, 7 losses model and 8 ac model. For each result, the
+# last stage that assigns it and the last stage that reads it
+_RESULT_STAGES = {
+    'weather': (0, 4), 'solar_position': (0, 0), 'airmass': (0, 2),
+    'tracking': (0, 0), 'aoi': (0, 1), 'total_irrad': (0, 4),
+    'aoi_modifier': (1, 3), 'spectral_modifier': (2, 3),
+    'effective_irradiance': (3, 5), 'cell_temperature': (4, 5),
+    'diode_params': (5, 5), 'dc_ohmic_losses': (6, 6), 'losses': (7, 7),
+    'dc': (7, 8), 'ac': (8, 8)}
+
+# names of the stages in ModelChain.results.stage_timings, by stage number
+_STAGE_NAMES = (None, 'aoi_model', 'spectral_model',
+                'effective_irradiance_model', 'temperature_model',
+                'dc_model', 'dc_ohmic_model', 'losses_model', 'ac_model')
+
+# dc models that interpolate a SingleDiodeTable, and the single diode
+# models whose parameters they require
+_DC_TABLE_MODELS = {'desoto_table': 'desoto', 'cec_table': 'cec',
+                    'pvsyst_table': 'pvsyst'}
+
 # these dictionaries contain the default configuration for following
 # established modeling sequences. They can be used in combination with
 # basic_chain and ModelChain. They are used by the ModelChain methods
@@ -260,6 +288,9 @@ class ModelChainResult:
                          'spectral_modifier', 'cell_temperature',
                          'effective_irradiance', 'dc', 'diode_params',
                          'dc_ohmic_losses', 'weather'}
+    _results_format: str = field(default='pandas')
+    _time_series_fields = _per_array_fields | {'solar_position', 'airmass',
+                                               'ac', 'tracking', 'losses'}
 
     # system-level information
     solar_position: Optional[pd.DataFrame] = field(default=None)
@@ -357,6 +388,14 @@ class ModelChainResult:
     """DatetimeIndex containing a copy of the index of the input weather data.
     """
 
+    stage_timings: Optional[pd.DataFrame] = None
+    """DataFrame indexed by the stages of the last run, e.g.
+    ``'solar_position'`` or ``'dc_model'``, with columns ``'seconds'`` (wall
+    time), ``'rows'`` (number of timestamps) and ``'nbytes'`` (size of the
+    results assigned by the stage). Only recorded if the ModelChain's
+    ``stage_timings`` is True.
+    """
+
     def _result_type(self, value):
         """Coerce `value` to the correct type according to
         ``self._singleton_tuples``."""
@@ -370,8 +409,42 @@ class ModelChainResult:
     def __setattr__(self, key, value):
         if key in ModelChainResult._per_array_fields:
             value = self._result_type(value)
+        if (key in ModelChainResult._time_series_fields
+                and self._results_format == 'numpy'):
+            value = _to_numpy(value)
         super().__setattr__(key, value)
 
+    def to_pandas(self, name):
+        """
+        Get a result as pandas objects indexed by ``times``.
+
+        Parameters
+        ----------
+        name : str
+            Name of the result, e.g. ``'ac'`` or ``'total_irrad'``.
+
+        Returns
+        -------
+        Series, DataFrame, float, or tuple of these
+            If ``results_format`` is ``'numpy'``, each array is converted to
+            a Series and each dict of arrays to a DataFrame, without copying
+            the data. Otherwise the result is returned unchanged.
+        """
+        value = getattr(self, name)
+        if self._results_format != 'numpy':
+            return value
+
+        def _build(value):
+            if isinstance(value, dict):
+                return pd.DataFrame(value, index=self.times, copy=False)
+            if isinstance(value, np.ndarray) and value.ndim == 1:
+                return pd.Series(value, index=self.times, copy=False)
+            return value
+
+        if isinstance(value, tuple):
+            return tuple(_build(v) for v in value)
+        return _build(value)
+
 
 class ModelChain:
     """
@@ -410,7 +483,11 @@ class ModelChain:
     dc_model: None, str, or function, default None
         If None, the model will be inferred from the parameters that
         are common to all of system.arrays[i].module_parameters.
-        Valid strings are 'sapm', 'desoto', 'cec', 'pvsyst', 'pvwatts'.
+        Valid strings are 'sapm', 'desoto', 'cec', 'pvsyst', 'pvwatts',
+        and 'desoto_table', 'cec_table', 'pvsyst_table', which interpolate
+        the single diode model in a
+        :py:class:`~pvlib.singlediode.SingleDiodeTable` and solve it
+        directly for points outside of the table, e.g. above 1500 W/m2.
         The ModelChain instance will be passed as the first argument
         to a user-defined function.
 
@@ -451,6 +528,42 @@ class ModelChain:
 
     name: None or str, default None
         Name of ModelChain instance.
+
+    singlediode_cache: None or SingleDiodeCache, default None
+        If given, the 'desoto', 'cec' and 'pvsyst' dc models look up the
+        key points of the IV curve in this
+        :py:class:`~pvlib.singlediode.SingleDiodeCache` and only solve the
+        single diode equation for missing entries. The cache may be shared
+        by several ModelChain instances.
+
+    results_format: str, default 'pandas'
+        If 'numpy', every result that is a Series is stored as an array
+        and every result that is a DataFrame as a dict of arrays, and the
+        model runs on these arrays instead of pandas objects. This is
+        faster for short time series. ``results.times`` is the common
+        index and :py:meth:`ModelChainResult.to_pandas` returns the pandas
+        equivalent of a result.
+
+    cache_stages: bool, default False
+        If True, :py:meth:`run_model` keeps the results of its last call
+        and the next call only runs the models for the timestamps that are
+        new or whose weather changed. The solar position, airmass, tracker
+        position and angle of incidence of the last call are also reused
+        unless the pressure or air temperature at a timestamp changed. The
+        results of the last call are discarded when the location, the
+        system, the models or the outputs change. Requires
+        ``results_format='pandas'``.
+
+    stage_timings: bool, default False
+        If True, the wall time, number of timestamps and size of the
+        results of each stage of a run are recorded in
+        ``results.stage_timings``.
+
+    solar_position_cache: None or SolarPositionCache, default None
+        If given, the solar position and airmass are looked up in this
+        :py:class:`~pvlib.location.SolarPositionCache` and only calculated
+        for new times. The cache may be shared by the ModelChains of several
+        systems at the same Location.
     """
 
     # list of deprecated attributes
@@ -468,10 +581,13 @@ class ModelChain:
                  dc_model=None, ac_model=None, aoi_model=None,
                  spectral_model=None, temperature_model=None,
                  dc_ohmic_model='no_loss',
-                 losses_model='no_loss', name=None):
+                 losses_model='no_loss', name=None, singlediode_cache=None,
+                 results_format='pandas', cache_stages=False,
+                 stage_timings=False, solar_position_cache=None):
 
         self.name = name
         self.system = system
+        self.singlediode_cache = singlediode_cache
 
         self.location = location
         self.clearsky_model = clearsky_model
@@ -489,7 +605,18 @@ class ModelChain:
         self.dc_ohmic_model = dc_ohmic_model
         self.losses_model = losses_model
 
-        self.results = ModelChainResult()
+        if results_format not in ('pandas', 'numpy'):
+            raise ValueError(f"results_format must be 'pandas' or 'numpy', "
+                             f"got {results_format}")
+        self.results = ModelChainResult(_results_format=results_format)
+        if cache_stages and results_format != 'pandas':
+            raise ValueError("cache_stages requires results_format='pandas'")
+        self._stage_cache = _StageCache() if cache_stages else None
+        # thermal state of each Array between the chunks of run_model_chunks
+        self._fuentes_state = None
+        self.stage_timings = stage_timings
+        self._timings = None
+        self.solar_position_cache = solar_position_cache
 
     def __getattr__(self, key):
         if key in ModelChain._deprecated_attrs:
@@ -689,15 +816,19 @@ class ModelChain:
         if model is None:
             self._dc_model, model = self.infer_dc_model()
 
+        # tables are built on first use
+        self._singlediode_tables = None
+
         # Set model and validate parameters
         if isinstance(model, str):
             model = model.lower()
-            if model in _DC_MODEL_PARAMS.keys():
+            params_model = _DC_TABLE_MODELS.get(model, model)
+            if params_model in _DC_MODEL_PARAMS.keys():
                 # validate module parameters
                 module_parameters = tuple(
                     array.module_parameters for array in self.system.arrays)
-                missing_params = (
-                    _DC_MODEL_PARAMS[model] - _common_keys(module_parameters))
+                missing_params = (_DC_MODEL_PARAMS[params_model] -
+                                  _common_keys(module_parameters))
                 if missing_params:  # some parameters are not in module.keys()
                     raise ValueError(model + ' selected for the DC model but '
                                      'one or more Arrays are missing '
@@ -713,6 +844,12 @@ class ModelChain:
                     self._dc_model = self.pvsyst
                 elif model == 'pvwatts':
                     self._dc_model = self.pvwatts_dc
+                elif model == 'desoto_table':
+                    self._dc_model = self.desoto_table
+                elif model == 'cec_table':
+                    self._dc_model = self.cec_table
+                elif model == 'pvsyst_table':
+                    self._dc_model = self.pvsyst_table
             else:
                 raise ValueError(model + ' is not a valid DC power model')
         else:
@@ -761,13 +898,25 @@ class ModelChain:
                                            unwrap=False)
         self.results.diode_params = tuple(itertools.starmap(
             _make_diode_params, params))
-        self.results.dc = tuple(itertools.starmap(
-            self.system.singlediode, params))
+        if self.singlediode_cache is None:
+            self.results.dc = tuple(itertools.starmap(
+                self.system.singlediode, params))
+        else:
+            effective_irradiance, cell_temperature = self._array_weather()
+            self.results.dc = tuple(
+                self.singlediode_cache.evaluate(
+                    self._array_calcparams(calcparams_model_function, index),
+                    dict(array.module_parameters,
+                         calcparams=calcparams_model_function.__name__),
+                    ei, tc)
+                for index, (array, ei, tc) in enumerate(zip(
+                    self.system.arrays, effective_irradiance,
+                    cell_temperature)))
         self.results.dc = self.system.scale_voltage_current_power(
             self.results.dc,
             unwrap=False
         )
-        self.results.dc = tuple(dc.fillna(0) for dc in self.results.dc)
+        self.results.dc = tuple(_fillna(dc, 0) for dc in self.results.dc)
         # If the system has one Array, unwrap the single return value
         # to preserve the original behavior of ModelChain
         if self.system.num_arrays == 1:
@@ -784,6 +933,121 @@ class ModelChain:
     def pvsyst(self):
         return self._singlediode(self.system.calcparams_pvsyst)
 
+    def _array_calcparams(self, calcparams_model_function, index):
+        """
+        ``calcparams(effective_irradiance, temp_cell)`` of the Array at
+        ``index``.
+        """
+        num_arrays = self.system.num_arrays
+
+        def array_calcparams(effective_irradiance, temp_cell):
+            return calcparams_model_function(
+                (effective_irradiance,) * num_arrays,
+                (temp_cell,) * num_arrays, unwrap=False)[index]
+
+        return array_calcparams
+
+    def _array_weather(self):
+        """Effective irradiance and cell temperature as per-Array tuples."""
+        effective_irradiance = self.results.effective_irradiance
+        cell_temperature = self.results.cell_temperature
+        if not isinstance(effective_irradiance, tuple):
+            effective_irradiance = (effective_irradiance,)
+            cell_temperature = (cell_temperature,)
+        return effective_irradiance, cell_temperature
+
+    def _singlediode_table(self, calcparams_model_function):
+        num_arrays = self.system.num_arrays
+        if self._singlediode_tables is None:
+            self._singlediode_tables = tuple(
+                SingleDiodeTable(
+                    self._array_calcparams(calcparams_model_function, index))
+                for index in range(num_arrays))
+        effective_irradiance, cell_temperature = self._array_weather()
+        self.results.dc = tuple(
+            self._evaluate_table(
+                table, self._array_calcparams(calcparams_model_function,
+                                              index), ei, tc)
+            for index, (table, ei, tc) in enumerate(zip(
+                self._singlediode_tables, effective_irradiance,
+                cell_temperature)))
+        self.results.dc = self.system.scale_voltage_current_power(
+            self.results.dc,
+            unwrap=False
+        )
+        self.results.dc = tuple(_fillna(dc, 0) for dc in self.results.dc)
+        # If the system has one Array, unwrap the single return value
+        # to preserve the original behavior of ModelChain
+        if num_arrays == 1:
+            self.results.dc = self.results.dc[0]
+        return self
+
+    @staticmethod
+    def _evaluate_table(table, calcparams, effective_irradiance, temp_cell):
+        """
+        Interpolate the key points in ``table``, and solve the points that
+        are outside of the table, e.g. above 1500 W/m2 by default, with
+        :py:func:`~pvlib.pvsystem.singlediode`.
+        """
+        dc = table.evaluate(effective_irradiance, temp_cell)
+        g, t = np.broadcast_arrays(
+            np.asarray(effective_irradiance, dtype=np.float64),
+            np.asarray(temp_cell, dtype=np.float64))
+        # the table is finite at every node, so nan marks points outside
+        outside = (np.isnan(np.asarray(dc['p_mp'])) & np.isfinite(g) &
+                   np.isfinite(t))
+        if not outside.any():
+            return dc
+        solved = pvsystem.singlediode(
+            *calcparams(g[outside], t[outside]), method=table.method)
+        for key in table.KEY_POINTS:
+            values = np.array(dc[key], dtype=np.float64)
+            values[outside] = solved[key]
+            if isinstance(dc, pd.DataFrame):
+                dc[key] = values
+            else:
+                dc[key] = values[()]
+        return dc
+
+    def desoto_table(self):
+        """Calculate DC power by interpolating a
+        :py:class:`~pvlib.singlediode.SingleDiodeTable` of the De Soto model.
+
+        One table is built for each Array from
+        :py:meth:`~pvlib.pvsystem.PVSystem.calcparams_desoto` when the
+        model is first run and reused afterwards. Results are stored in
+        ModelChain.results.dc; ModelChain.results.diode_params is not
+        calculated. Points outside of the irradiance and temperature range
+        of the table are solved by the single diode model, as
+        :py:meth:`desoto` does.
+
+        Returns
+        -------
+        self
+
+        See also
+        --------
+        pvlib.singlediode.SingleDiodeTable
+        pvlib.modelchain.ModelChain.desoto
+        """
+        return self._singlediode_table(self.system.calcparams_desoto)
+
+    def cec_table(self):
+        """Calculate DC power by interpolating a
+        :py:class:`~pvlib.singlediode.SingleDiodeTable` of the CEC model.
+
+        See :py:meth:`desoto_table` for details.
+        """
+        return self._singlediode_table(self.system.calcparams_cec)
+
+    def pvsyst_table(self):
+        """Calculate DC power by interpolating a
+        :py:class:`~pvlib.singlediode.SingleDiodeTable` of the PVsyst model.
+
+        See :py:meth:`desoto_table` for details.
+        """
+        return self._singlediode_table(self.system.calcparams_pvsyst)
+
     def pvwatts_dc(self):
         """Calculate DC power using the PVWatts model.
 
@@ -805,9 +1069,21 @@ class ModelChain:
             self.results.cell_temperature,
             unwrap=False
         )
-        p_mp = tuple(pd.DataFrame(s, columns=['p_mp']) for s in dc)
-        scaled = self.system.scale_voltage_current_power(p_mp)
-        self.results.dc = _tuple_from_dfs(scaled, "p_mp")
+        # scale dicts rather than one-column DataFrames, which is much
+        # faster for systems with many Arrays
+        scaled = self.system.scale_voltage_current_power(
+            tuple({'p_mp': s} for s in dc))
+
+        def _named(p_mp):
+            if isinstance(p_mp, pd.Series):
+                return p_mp.rename('p_mp')
+            return p_mp
+
+        dc = _tuple_from_dfs(scaled, 'p_mp')
+        if isinstance(dc, tuple):
+            self.results.dc = tuple(_named(p_mp) for p_mp in dc)
+        else:
+            self.results.dc = _named(dc)
         return self
 
     @property
@@ -868,7 +1144,7 @@ class ModelChain:
 
     def pvwatts_inverter(self):
         ac = self.system.get_ac('pvwatts', self.results.dc)
-        self.results.ac = ac.fillna(0)
+        self.results.ac = _fillna(ac, 0)
         return self
 
     @property
@@ -1113,7 +1389,33 @@ class ModelChain:
         return self._set_celltemp('faiman')
 
     def fuentes_temp(self):
-        return self._set_celltemp('fuentes')
+        if self._fuentes_state is None:
+            return self._set_celltemp('fuentes')
+        # continue the thermal history of each Array from the previous chunk
+        poa = self.system._validate_per_array(_irrad_for_celltemp(
+            self.results.total_irrad, self.results.effective_irradiance))
+        temp_air = self.system._validate_per_array(
+            _tuple_from_dfs(self.results.weather, 'temp_air'),
+            system_wide=True)
+        wind_speed = self.system._validate_per_array(
+            _tuple_from_dfs(self.results.weather, 'wind_speed'),
+            system_wide=True)
+        if self._fuentes_state[0] is None and len(self.results.times) < 2:
+            raise ValueError('the first chunk must have at least two rows '
+                             'for the fuentes temperature model, which '
+                             'infers the first time step from the second')
+        cell_temperature = []
+        for index, array in enumerate(self.system.arrays):
+            _, required, optional = array._cell_temperature_model('fuentes')
+            tcell, self._fuentes_state[index] = temperature._fuentes(
+                poa[index], temp_air[index], wind_speed[index], *required,
+                state=self._fuentes_state[index], **optional)
+            cell_temperature.append(tcell)
+        if self.system.num_arrays == 1:
+            self.results.cell_temperature = cell_temperature[0]
+        else:
+            self.results.cell_temperature = tuple(cell_temperature)
+        return self
 
     def noct_sam_temp(self):
         return self._set_celltemp('noct_sam')
@@ -1185,11 +1487,18 @@ class ModelChain:
 
     def pvwatts_losses(self):
         self.results.losses = (100 - self.system.pvwatts_losses()) / 100.
+
+        def _apply_losses(dc):
+            if isinstance(dc, dict):
+                return OrderedDict((key, value * self.results.losses)
+                                   for key, value in dc.items())
+            return dc * self.results.losses
+
         if isinstance(self.results.dc, tuple):
-            for dc in self.results.dc:
-                dc *= self.results.losses
+            self.results.dc = tuple(_apply_losses(dc)
+                                    for dc in self.results.dc)
         else:
-            self.results.dc *= self.results.losses
+            self.results.dc = _apply_losses(self.results.dc)
         return self
 
     def no_extra_losses(self):
@@ -1273,20 +1582,22 @@ class ModelChain:
         self._check_multiple_input(weather)
         # Don't use ModelChain._assign_weather() here because it adds
         # temperature and wind-speed columns which we do not need here.
-        self.results.weather = _copy(weather)
-        self._assign_times()
-        self.results.solar_position = self.location.get_solarposition(
+        weather = _copy(weather)
+        self._assign_times(weather)
+        solar_position = self.location.get_solarposition(
             self.results.times, method=self.solar_position_method)
 
         if isinstance(weather, tuple):
-            for w in self.results.weather:
-                self._complete_irradiance(w)
+            for w in weather:
+                self._complete_irradiance(w, solar_position)
         else:
-            self._complete_irradiance(self.results.weather)
+            self._complete_irradiance(weather, solar_position)
 
+        self.results.weather = weather
+        self.results.solar_position = solar_position
         return self
 
-    def _complete_irradiance(self, weather):
+    def _complete_irradiance(self, weather, solar_position):
         icolumns = set(weather.columns)
         wrn_txt = ("This function is not safe at the moment.\n" +
                    "Results can be too high or negative.\n" +
@@ -1295,23 +1606,23 @@ class ModelChain:
 
         if {'ghi', 'dhi'} <= icolumns and 'dni' not in icolumns:
             clearsky = self.location.get_clearsky(
-                weather.index, solar_position=self.results.solar_position)
+                weather.index, solar_position=solar_position)
             weather.loc[:, 'dni'] = pvlib.irradiance.dni(
                 weather.loc[:, 'ghi'], weather.loc[:, 'dhi'],
-                self.results.solar_position.zenith,
+                solar_position.zenith,
                 clearsky_dni=clearsky['dni'],
                 clearsky_tolerance=1.1)
         elif {'dni', 'dhi'} <= icolumns and 'ghi' not in icolumns:
             warnings.warn(wrn_txt, UserWarning)
             weather.loc[:, 'ghi'] = (
                 weather.dhi + weather.dni *
-                tools.cosd(self.results.solar_position.zenith)
+                tools.cosd(solar_position.zenith)
             )
         elif {'dni', 'ghi'} <= icolumns and 'dhi' not in icolumns:
             warnings.warn(wrn_txt, UserWarning)
             weather.loc[:, 'dhi'] = (
                 weather.ghi - weather.dni *
-                tools.cosd(self.results.solar_position.zenith))
+                tools.cosd(solar_position.zenith))
 
     def _prep_inputs_solar_pos(self, weather):
         """
@@ -1326,7 +1637,12 @@ class ModelChain:
         except KeyError:
             pass
 
-        self.results.solar_position = self.location.get_solarposition(
+        if self.solar_position_cache is None:
+            get_solarposition = self.location.get_solarposition
+        else:
+            get_solarposition = partial(
+                self.solar_position_cache.get_solarposition, self.location)
+        self.results.solar_position = get_solarposition(
             self.results.times, method=self.solar_position_method,
             **kwargs)
         return self
@@ -1335,24 +1651,28 @@ class ModelChain:
         """
         Assign airmass
         """
-        self.results.airmass = self.location.get_airmass(
-            solar_position=self.results.solar_position,
-            model=self.airmass_model)
+        if self.solar_position_cache is None:
+            self.results.airmass = self.location.get_airmass(
+                solar_position=self.results.solar_position,
+                model=self.airmass_model)
+        else:
+            self.results.airmass = self.solar_position_cache.get_airmass(
+                self.location, self.results.solar_position,
+                model=self.airmass_model)
         return self
 
     def _prep_inputs_tracking(self):
         """
         Calculate tracker position and AOI
         """
-        self.results.tracking = self.system.singleaxis(
+        tracking = self.system.singleaxis(
             self.results.solar_position['apparent_zenith'],
             self.results.solar_position['azimuth'])
-        self.results.tracking['surface_tilt'] = (
-            self.results.tracking['surface_tilt']
-                .fillna(self.system.axis_tilt))
-        self.results.tracking['surface_azimuth'] = (
-            self.results.tracking['surface_azimuth']
-                .fillna(self.system.axis_azimuth))
+        tracking['surface_tilt'] = _fillna(tracking['surface_tilt'],
+                                           self.system.axis_tilt)
+        tracking['surface_azimuth'] = _fillna(tracking['surface_azimuth'],
+                                              self.system.axis_azimuth)
+        self.results.tracking = tracking
         self.results.aoi = self.results.tracking['aoi']
         return self
 
@@ -1365,6 +1685,134 @@ class ModelChain:
             self.results.solar_position['azimuth'])
         return self
 
+    def _prep_inputs_geometry(self, weather):
+        """
+        Assign solar position, airmass, and tracker position and AOI
+        """
+        self._timed('solar_position', self._prep_inputs_solar_pos, weather)
+        self._timed('airmass', self._prep_inputs_airmass)
+        if isinstance(self.system, SingleAxisTracker):
+            self._timed('tracking', self._prep_inputs_tracking)
+        else:
+            self._timed('aoi', self._prep_inputs_fixed)
+        return self
+
+    def _start_timings(self):
+        self._timings = [] if self.stage_timings else None
+
+    def _finish_timings(self):
+        if self._timings is None:
+            return
+        self.results.stage_timings = pd.DataFrame(
+            self._timings, columns=['stage', 'seconds', 'rows', 'nbytes']
+        ).set_index('stage')
+        self._timings = None
+
+    def _timed(self, name, stage, *args):
+        """
+        Run ``stage(*args)``. If timings are being recorded, also record
+        the wall time of the stage, the number of timestamps and the size
+        of the results that the stage assigns.
+        """
+        if self._timings is None:
+            return stage(*args)
+        before = dict(vars(self.results))
+        start = time.perf_counter()
+        stage(*args)
+        seconds = time.perf_counter() - start
+        nbytes = sum(_nbytes(value) for key, value in
+                     vars(self.results).items()
+                     if value is not before.get(key))
+        rows = 0 if self.results.times is None else len(self.results.times)
+        self._timings.append((name, seconds, rows, nbytes))
+        return self
+
+    def _prep_inputs_cached(self, weather):
+        """
+        Assign solar position, airmass, and tracker position and AOI,
+        reusing those of the last call at the timestamps where the pressure
+        and air temperature are unchanged.
+        """
+        cache = self._stage_cache
+        times = self.results.times
+        first = weather[0] if isinstance(weather, tuple) else weather
+        inputs = first[[k for k in ('pressure', 'temp_air') if k in first]]
+        key = _config_key((self.location, self.system,
+                           self.solar_position_method, self.airmass_model))
+        if key != cache.prep_key or times.has_duplicates:
+            cache.prep_key, cache.prep_inputs, cache.prep = key, None, {}
+        names = ['solar_position', 'airmass', 'aoi']
+        if isinstance(self.system, SingleAxisTracker):
+            names.append('tracking')
+        new = ~_unchanged_rows(inputs, cache.prep_inputs)
+        calculated = dict.fromkeys(names)
+        if new.any():
+            self.results.times = times[new]
+            self._prep_inputs_geometry(_select_rows(weather, new))
+            self.results.times = times
+            calculated = {name: getattr(self.results, name) for name in names}
+        # keep the rows of every timestamp of the current run_model call,
+        # which may run this on the timestamps with changed weather only
+        keep = times if cache.times is None else cache.times
+        inputs = _merge_rows(cache.prep_inputs, inputs, None)
+        keep = keep[keep.isin(inputs.index)]
+        cache.prep_inputs = inputs.reindex(keep)
+        for name in names:
+            cache.prep[name] = _merge_rows(cache.prep.get(name),
+                                           calculated[name], keep)
+            setattr(self.results, name,
+                    _merge_rows(cache.prep[name], None, times))
+        return self
+
+    def _run_model_cached(self, weather, outputs):
+        """
+        :py:meth:`run_model`, reusing the results of the last call at the
+        timestamps where the weather is unchanged.
+        """
+        cache = self._stage_cache
+        frames = weather if isinstance(weather, tuple) else (weather,)
+        times = frames[0].index
+        models = (self.dc_model, self.ac_model, self.aoi_model,
+                  self.spectral_model, self.temperature_model,
+                  self.dc_ohmic_model, self.losses_model,
+                  self.transposition_model)
+        key = (_config_key((self.location, self.system,
+                            self.solar_position_method, self.airmass_model)),
+               tuple(repr(model) for model in models),
+               isinstance(weather, tuple), outputs)
+        # the fuentes model depends on the previous timestamps, so its
+        # results can't be reused for single timestamps
+        stateful = (getattr(self.temperature_model, '__func__', None) is
+                    ModelChain.fuentes_temp)
+        if (key != cache.key or stateful or times.has_duplicates or
+                cache.weather is None or len(cache.weather) != len(frames)):
+            cache.key, cache.weather, cache.results = key, None, {}
+            unchanged = np.zeros(len(times), dtype=bool)
+        else:
+            unchanged = np.logical_and.reduce([
+                _unchanged_rows(frame, cached)
+                for frame, cached in zip(frames, cache.weather)])
+        names = (list(_RESULT_STAGES) if outputs is None
+                 else [name for name in _RESULT_STAGES if name in outputs])
+        calculated = dict.fromkeys(names)
+        if not unchanged.all():
+            changed = _select_rows(weather, ~unchanged)
+            cache.times = times
+            try:
+                self.prepare_inputs(changed)
+            finally:
+                cache.times = None
+            self._run_stages(changed, 1, outputs)
+            calculated = {name: getattr(self.results, name) for name in names}
+        for name in names:
+            setattr(self.results, name, _merge_rows(cache.results.get(name),
+                                                    calculated[name], times))
+        self.results.times = times
+        cache.key = key
+        cache.results = {name: getattr(self.results, name) for name in names}
+        cache.weather = tuple(frame.copy() for frame in frames)
+        return self
+
     def _verify_df(self, data, required):
         """ Checks data for column names in required
 
@@ -1412,6 +1860,11 @@ class ModelChain:
     def _assign_weather(self, data):
         def _build_weather(data):
             key_list = [k for k in WEATHER_KEYS if k in data]
+            if self.results._results_format == 'numpy':
+                weather = {k: np.array(data[k]) for k in key_list}
+                weather.setdefault('wind_speed', np.full(len(data), 0.))
+                weather.setdefault('temp_air', np.full(len(data), 20.))
+                return weather
             weather = data[key_list].copy()
             if weather.get('wind_speed') is None:
                 weather['wind_speed'] = 0
@@ -1425,7 +1878,7 @@ class ModelChain:
             weather = _build_weather(data)
             self._configure_results(per_array_data=False)
         self.results.weather = weather
-        self._assign_times()
+        self._assign_times(data)
         return self
 
     def _assign_total_irrad(self, data):
@@ -1440,21 +1893,21 @@ class ModelChain:
         self.results.total_irrad = _build_irrad(data)
         return self
 
-    def _assign_times(self):
+    def _assign_times(self, weather):
         """Assign self.results.times according the the index of
-        self.results.weather.
+        weather.
 
-        If there are multiple DataFrames in self.results.weather then
-        the index of the first one is assigned. It is assumed that the
-        indices of each DataFrame in self.results.weather are the same.
-        This can be verified by calling :py:func:`_all_same_index` or
+        If there are multiple DataFrames in weather then the index of the
+        first one is assigned. It is assumed that the indices of each
+        DataFrame in weather are the same. This can be verified by calling
+        :py:func:`_all_same_index` or
         :py:meth:`self._check_multiple_weather` before calling this
         method.
         """
-        if isinstance(self.results.weather, tuple):
-            self.results.times = self.results.weather[0].index
+        if isinstance(weather, tuple):
+            self.results.times = weather[0].index
         else:
-            self.results.times = self.results.weather.index
+            self.results.times = weather.index
 
     def prepare_inputs(self, weather):
         """
@@ -1497,15 +1950,16 @@ class ModelChain:
         self._verify_df(weather, required=['ghi', 'dni', 'dhi'])
         self._assign_weather(weather)
 
-        self._prep_inputs_solar_pos(weather)
-        self._prep_inputs_airmass()
+        if self._stage_cache is None:
+            self._prep_inputs_geometry(weather)
+        else:
+            self._prep_inputs_cached(weather)
 
         # PVSystem.get_irradiance and SingleAxisTracker.get_irradiance
         # and PVSystem.get_aoi and SingleAxisTracker.get_aoi
         # have different method signatures. Use partial to handle
         # the differences.
         if isinstance(self.system, SingleAxisTracker):
-            self._prep_inputs_tracking()
             get_irradiance = partial(
                 self.system.get_irradiance,
                 self.results.tracking['surface_tilt'],
@@ -1513,20 +1967,29 @@ class ModelChain:
                 self.results.solar_position['apparent_zenith'],
                 self.results.solar_position['azimuth'])
         else:
-            self._prep_inputs_fixed()
             get_irradiance = partial(
                 self.system.get_irradiance,
                 self.results.solar_position['apparent_zenith'],
                 self.results.solar_position['azimuth'])
 
+        self._timed('transposition', self._prep_inputs_total_irrad,
+                    get_irradiance)
+
+        return self
+
+    def _prep_inputs_total_irrad(self, get_irradiance):
+        """
+        Assign plane of array irradiance
+        """
         self.results.total_irrad = get_irradiance(
             _tuple_from_dfs(self.results.weather, 'dni'),
             _tuple_from_dfs(self.results.weather, 'ghi'),
             _tuple_from_dfs(self.results.weather, 'dhi'),
+            dni_extra=pvlib.irradiance.get_extra_radiation(
+                self.results.times),
             airmass=self.results.airmass['airmass_relative'],
             model=self.transposition_model
         )
-
         return self
 
     def _check_multiple_input(self, data, strict=True):
@@ -1708,7 +2171,7 @@ class ModelChain:
         )
         return self
 
-    def run_model(self, weather):
+    def run_model(self, weather, outputs=None):
         """
         Run the model chain starting with broadband global, diffuse and/or
         direct irradiance.
@@ -1727,6 +2190,10 @@ class ModelChain:
             If list or tuple, must be of the same length and order as the
             Arrays of the ModelChain's PVSystem.
 
+        outputs : None, str or list of str, default None
+            Names of the ``results`` attributes to compute, e.g. ``'ac'``.
+            If None, every attribute is kept. See Notes.
+
         Returns
         -------
         self
@@ -1738,6 +2205,8 @@ class ModelChain:
             of Arrays in the PVSystem.
         ValueError
             If the DataFrames in `data` have different indexes.
+        ValueError
+            If `outputs` contains a name that is not a result.
 
         Notes
         -----
@@ -1748,22 +2217,33 @@ class ModelChain:
         ``losses``, ``diode_params`` (if dc_model is a single diode
         model).
 
+        If `outputs` is given, the models that are not needed for them are
+        not run, and every other attribute is set to None as soon as the
+        remaining models no longer need it. ``total_irrad`` keeps only
+        ``'poa_global'``, ``'poa_direct'`` and ``'poa_diffuse'`` until the
+        effective irradiance is calculated, and then only ``'poa_global'``.
+        This lowers the peak memory use of long simulations. User-defined
+        model functions must then only read the results that the model
+        they replace reads.
+
         See also
         --------
         pvlib.modelchain.ModelChain.run_model_from_poa
         pvlib.modelchain.ModelChain.run_model_from_effective_irradiance
         """
+        outputs = _check_outputs(outputs)
         weather = _to_tuple(weather)
-        self.prepare_inputs(weather)
-        self.aoi_model()
-        self.spectral_model()
-        self.effective_irradiance_model()
-
-        self._run_from_effective_irrad(weather)
+        self._start_timings()
+        if self._stage_cache is not None:
+            self._run_model_cached(weather, outputs)
+        else:
+            self.prepare_inputs(weather)
+            self._run_stages(weather, 1, outputs)
+        self._finish_timings()
 
         return self
 
-    def run_model_from_poa(self, data):
+    def run_model_from_poa(self, data, outputs=None):
         """
         Run the model starting with broadband irradiance in the plane of array.
 
@@ -1788,6 +2268,10 @@ class ModelChain:
             Arrays. Each element of `data` provides the irradiance and weather
             for the corresponding array.
 
+        outputs : None, str or list of str, default None
+            Names of the ``results`` attributes to compute. See
+            :py:meth:`run_model`.
+
         Returns
         -------
         self
@@ -1814,18 +2298,50 @@ class ModelChain:
         pvlib.modelchain.ModelChain.run_model
         pvlib.modelchain.ModelChain.run_model_from_effective_irradiance
         """
+        outputs = _check_outputs(outputs)
         data = _to_tuple(data)
+        self._start_timings()
         self.prepare_inputs_from_poa(data)
+        self._run_stages(data, 1, outputs)
+        self._finish_timings()
 
-        self.aoi_model()
-        self.spectral_model()
-        self.effective_irradiance_model()
-
-        self._run_from_effective_irrad(data)
+        return self
 
+    def _run_stages(self, data, first, outputs):
+        """
+        Run the stages of the model chain from ``first`` up to the last one
+        needed for ``outputs``, and release the results that are no longer
+        needed after each stage. See ``_RESULT_STAGES``.
+        """
+        stages = [None, self.aoi_model, self.spectral_model,
+                  self.effective_irradiance_model,
+                  partial(self._prepare_temperature, data), self.dc_model,
+                  self.dc_ohmic_model, self.losses_model, self.ac_model]
+        last = len(stages) - 1
+        if outputs is not None:
+            last = max([_RESULT_STAGES[name][0] for name in outputs
+                        if name in _RESULT_STAGES] + [0])
+        self._release_results(outputs, first - 1)
+        for stage in range(first, last + 1):
+            self._timed(_STAGE_NAMES[stage], stages[stage])
+            self._release_results(outputs, stage)
+        self._release_results(outputs, len(stages))
         return self
 
-    def _run_from_effective_irrad(self, data=None):
+    def _release_results(self, outputs, stage):
+        """Set the results that aren't in ``outputs`` and aren't read after
+        ``stage`` to None."""
+        if outputs is None:
+            return
+        for name, (_, last_read) in _RESULT_STAGES.items():
+            if last_read <= stage and name not in outputs:
+                setattr(self.results, name, None)
+        total_irrad = self.results.total_irrad
+        if 'total_irrad' not in outputs and total_irrad is not None:
+            keys = POA_KEYS if stage < 3 else ('poa_global',)
+            self.results.total_irrad = _select_keys(total_irrad, keys)
+
+    def _run_from_effective_irrad(self, data=None, outputs=None):
         """
         Executes the temperature, DC, losses and AC models.
 
@@ -1836,6 +2352,8 @@ class ModelChain:
             are used instead of `temperature_model`. If optional column
             `module_temperature` is provided, `temperature_model` must be
             ``'sapm'``.
+        outputs : None or set of str, default None
+            See :py:meth:`run_model`.
 
         Returns
         -------
@@ -1846,15 +2364,9 @@ class ModelChain:
         Assigns attributes:``cell_temperature``, ``dc``, ``ac``, ``losses``,
         ``diode_params`` (if dc_model is a single diode model).
         """
-        self._prepare_temperature(data)
-        self.dc_model()
-        self.dc_ohmic_model()
-        self.losses_model()
-        self.ac_model()
-
-        return self
+        return self._run_stages(data, 4, outputs)
 
-    def run_model_from_effective_irradiance(self, data=None):
+    def run_model_from_effective_irradiance(self, data=None, outputs=None):
         """
         Run the model starting with effective irradiance in the plane of array.
 
@@ -1873,6 +2385,10 @@ class ModelChain:
             Arrays. Each element of `data` provides the irradiance and weather
             for the corresponding array.
 
+        outputs : None, str or list of str, default None
+            Names of the ``results`` attributes to compute. See
+            :py:meth:`run_model`.
+
         Returns
         -------
         self
@@ -1910,17 +2426,1027 @@ class ModelChain:
         pvlib.modelchain.ModelChain.run_model
         pvlib.modelchain.ModelChain.run_model_from_poa
         """
+        outputs = _check_outputs(outputs)
         data = _to_tuple(data)
         self._check_multiple_input(data)
         self._verify_df(data, required=['effective_irradiance'])
+        self._start_timings()
         self._assign_weather(data)
         self._assign_total_irrad(data)
         self.results.effective_irradiance = _tuple_from_dfs(
             data, 'effective_irradiance')
-        self._run_from_effective_irrad(data)
+        self._run_from_effective_irrad(data, outputs)
+        self._finish_timings()
+
+        return self
+
+    def run_model_chunks(self, weather, chunksize=None, outputs=('ac',),
+                         sink=None):
+        """
+        Run the model chain on consecutive chunks of the weather, starting
+        with GHI, DNI and DHI, and pass the results of each chunk to `sink`.
+
+        The results are the same as those of :py:meth:`run_model` on all
+        the weather at once, but only one chunk of the intermediate results
+        is held in memory. The thermal history of the ``'fuentes'``
+        temperature model is carried from each chunk to the next.
+
+        Parameters
+        ----------
+        weather : DataFrame, tuple of DataFrame, or iterable
+            The weather of :py:meth:`run_model`, which is split into chunks
+            of `chunksize` rows, or an iterable of consecutive chunks of
+            weather, e.g. a list or ``pd.read_csv(..., chunksize=...)``.
+            Weather of several Arrays must be a tuple, not a list.
+
+        chunksize : int, optional
+            Number of rows of each chunk. Required if `weather` is a
+            DataFrame or a tuple of DataFrame.
+
+        outputs : str or list of str, default ('ac',)
+            Names of the ``results`` attributes to compute, see
+            :py:meth:`run_model`.
+
+        sink : callable, optional
+            ``sink(name, value)`` is called with the name and value of each
+            result in `outputs` after each chunk, e.g. to append it to a CSV
+            or Parquet file. If None, the results of all chunks are
+            concatenated and assigned to ``results``.
+
+        Returns
+        -------
+        self
+
+        Raises
+        ------
+        ValueError
+            If `chunksize` is not given for a DataFrame or tuple of
+            DataFrame, or is less than 1.
+        ValueError
+            If `outputs` is None or contains a name that is not a result.
+        ValueError
+            If the temperature model is ``'fuentes'`` and the first chunk
+            has fewer than two rows.
+
+        See also
+        --------
+        pvlib.modelchain.ModelChain.run_model
+        """
+        if outputs is None:
+            raise ValueError('outputs must be given to run the model in '
+                             'chunks')
+        outputs = sorted(_check_outputs(outputs))
+        # a tuple is the weather of each Array, any other iterable, e.g. a
+        # list, holds the chunks
+        if isinstance(weather, (pd.DataFrame, tuple)):
+            if chunksize is None or chunksize < 1:
+                raise ValueError(f'chunksize must be a positive integer, got '
+                                 f'{chunksize}')
+            chunks = _weather_chunks(weather, chunksize)
+        else:
+            chunks = iter(weather)
+        collected = {name: [] for name in outputs}
+        self._fuentes_state = [None] * self.system.num_arrays
+        try:
+            for chunk in chunks:
+                self.run_model(chunk, outputs=outputs)
+                for name in outputs:
+                    value = getattr(self.results, name)
+                    if sink is None:
+                        collected[name].append(value)
+                    else:
+                        sink(name, value)
+        finally:
+            self._fuentes_state = None
+        if sink is None:
+            for name in outputs:
+                setattr(self.results, name,
+                        _concat_results(collected[name]))
+        return self
+
+
+# columns of FleetModelChain.systems: required, and optional with defaults
+_FLEET_SYSTEM_COLUMNS = ('latitude', 'longitude', 'surface_tilt',
+                         'surface_azimuth', 'module', 'inverter')
+_FLEET_SYSTEM_DEFAULTS = {'altitude': 0., 'albedo': 0.25,
+                          'modules_per_string': 1, 'strings_per_inverter': 1}
+
+# single diode models of FleetModelChain, with the module parameters that
+# PVSystem passes to their calcparams functions
+_FLEET_CALCPARAMS = {
+    'desoto': (pvsystem.calcparams_desoto,
+               ['a_ref', 'I_L_ref', 'I_o_ref', 'R_sh_ref', 'R_s',
+                'alpha_sc', 'EgRef', 'dEgdT', 'irrad_ref', 'temp_ref']),
+    'cec': (pvsystem.calcparams_cec,
+            ['a_ref', 'I_L_ref', 'I_o_ref', 'R_sh_ref', 'R_s', 'alpha_sc',
+             'Adjust', 'EgRef', 'dEgdT', 'irrad_ref', 'temp_ref']),
+    'pvsyst': (pvsystem.calcparams_pvsyst,
+               ['gamma_ref', 'mu_gamma', 'I_L_ref', 'I_o_ref', 'R_sh_ref',
+                'R_sh_0', 'R_sh_exp', 'R_s', 'alpha_sc', 'EgRef',
+                'irrad_ref', 'temp_ref', 'cells_in_series']),
+}
+
+
+@dataclass
+class FleetModelChainResult:
+    """
+    Results of a :py:class:`FleetModelChain`. Every DataFrame is indexed by
+    ``times`` and has one column per system.
+    """
+
+    times: Optional[pd.DatetimeIndex] = None
+    """DatetimeIndex of the input weather data."""
+
+    solar_position: Optional[dict] = None
+    """dict of DataFrame with keys ``'apparent_zenith'``, ``'zenith'``,
+    ``'apparent_elevation'``, ``'elevation'``, ``'azimuth'`` and
+    ``'equation_of_time'``, as calculated by
+    :py:func:`~pvlib.solarposition.spa_python`."""
+
+    airmass: Optional[dict] = None
+    """dict of DataFrame with keys ``'airmass_relative'`` and
+    ``'airmass_absolute'``."""
+
+    aoi: Optional[pd.DataFrame] = None
+    """Angle of incidence (degrees)."""
+
+    total_irrad: Optional[dict] = None
+    """dict of DataFrame with keys ``'poa_global'``, ``'poa_direct'``,
+    ``'poa_diffuse'``, ``'poa_sky_diffuse'`` and ``'poa_ground_diffuse'``
+    (W/m2)."""
+
+    aoi_modifier: Optional[pd.DataFrame] = None
+    """Angle of incidence modifier (unitless)."""
+
+    effective_irradiance: Optional[pd.DataFrame] = None
+    """Effective irradiance (W/m2)."""
+
+    cell_temperature: Optional[pd.DataFrame] = None
+    """Cell temperature (C)."""
+
+    dc: Optional[dict] = None
+    """dict of DataFrame with DC power ``'p_mp'`` (W) of each system and,
+    for single diode models, the other key points of the IV curve."""
+
+    ac: Optional[pd.DataFrame] = None
+    """AC power (W)."""
+
+
+class FleetModelChain:
+    """
+    Simulate a fleet of PV systems with the same models in one vectorized
+    pass.
+
+    Where :py:class:`ModelChain` runs one PVSystem at one Location,
+    FleetModelChain evaluates every modeling step on arrays with one row
+    per system and one column per time step. Each system is one Array of
+    identical modules on a fixed mount, connected to one inverter.
+
+    Parameters
+    ----------
+    systems : DataFrame
+        One row per system, indexed by system name. Required columns are
+        ``'latitude'``, ``'longitude'``, ``'surface_tilt'``,
+        ``'surface_azimuth'``, ``'module'`` and ``'inverter'``, where
+        ``'module'`` and ``'inverter'`` are column names of ``modules`` and
+        ``inverters``. Optional columns are ``'altitude'`` (default 0 m),
+        ``'albedo'`` (0.25), ``'modules_per_string'`` (1),
+        ``'strings_per_inverter'`` (1), and the parameters of the
+        temperature model, e.g. ``'a'``, ``'b'`` and ``'deltaT'`` for
+        ``'sapm'``.
+
+    modules : DataFrame
+        Module parameters with one column per module, as returned by
+        :py:func:`~pvlib.pvsystem.retrieve_sam`.
+
+    inverters : DataFrame
+        Inverter parameters with one column per inverter, as returned by
+        :py:func:`~pvlib.pvsystem.retrieve_sam`.
+
+    dc_model : None or str, default None
+        Valid strings are 'desoto', 'cec', 'pvsyst' and 'pvwatts'. If None,
+        the model is inferred from the parameters of the modules of the
+        systems.
+
+    ac_model : None or str, default None
+        Valid strings are 'sandia' and 'pvwatts'. If None, the model is
+        inferred from the parameters of the inverters of the systems.
+
+    transposition_model : str, default 'haydavies'
+        Passed to :py:func:`~pvlib.irradiance.get_total_irradiance`.
+
+    airmass_model : str, default 'kastenyoung1989'
+        Passed to :py:func:`~pvlib.atmosphere.get_relative_airmass`.
+
+    aoi_model : str, default 'physical'
+        Valid strings are 'physical', 'ashrae', 'martin_ruiz' and
+        'no_loss'. Model parameters are taken from ``modules`` if present.
+
+    temperature_model : str, default 'sapm'
+        Valid strings are 'sapm', 'pvsyst' and 'faiman'.
+
+    name : None or str, default None
+        Name of FleetModelChain instance.
+
+    Attributes
+    ----------
+    results : FleetModelChainResult
+
+    Notes
+    -----
+    Solar position is calculated by the numpy implementation of
+    :py:func:`~pvlib.solarposition.spa_python` with ``delta_t=67``, as
+    ModelChain does by default. There is no spectral or DC loss model.
+
+    Memory use is proportional to the number of systems times the number
+    of time steps; split large fleets into several FleetModelChain
+    instances if needed.
+
+    See also
+    --------
+    ModelChain
+    """
+
+    def __init__(self, systems, modules, inverters, dc_model=None,
+                 ac_model=None, transposition_model='haydavies',
+                 airmass_model='kastenyoung1989', aoi_model='physical',
+                 temperature_model='sapm', name=None):
+        missing = set(_FLEET_SYSTEM_COLUMNS) - set(systems.columns)
+        if missing:
+            raise ValueError(f'systems is missing required columns '
+                             f'{sorted(missing)}')
+        self.name = name
+        self.systems = systems
+        # parameters of the module and inverter of each system
+        self.module_parameters = modules[systems['module']]
+        self.inverter_parameters = inverters[systems['inverter']]
+        self.transposition_model = transposition_model
+        self.airmass_model = airmass_model
+
+        if dc_model is None:
+            dc_model = self._infer_dc_model()
+        dc_model = dc_model.lower()
+        if dc_model == 'pvwatts':
+            required = {'pdc0', 'gamma_pdc'}
+        elif dc_model in _FLEET_CALCPARAMS:
+            required = _DC_MODEL_PARAMS[dc_model]
+        else:
+            raise ValueError(dc_model + ' is not a valid DC power model')
+        self._check_params(self.module_parameters, required, dc_model,
+                           'module')
+        self.dc_model = dc_model
+
+        if ac_model is None:
+            ac_model = self._infer_ac_model()
+        ac_model = ac_model.lower()
+        if ac_model == 'sandia':
+            required = {'Paco', 'Pdco', 'Vdco', 'Pso', 'C0', 'C1', 'C2',
+                        'C3', 'Pnt'}
+        elif ac_model == 'pvwatts':
+            required = {'pdc0'}
+        else:
+            raise ValueError(ac_model + ' is not a valid AC power model')
+        self._check_params(self.inverter_parameters, required, ac_model,
+                           'inverter')
+        self.ac_model = ac_model
+
+        aoi_model = aoi_model.lower()
+        if aoi_model not in ('physical', 'ashrae', 'martin_ruiz', 'no_loss'):
+            raise ValueError(aoi_model + ' is not a valid aoi loss model')
+        self.aoi_model = aoi_model
+
+        temperature_model = temperature_model.lower()
+        if temperature_model == 'sapm':
+            required = {'a', 'b', 'deltaT'}
+        elif temperature_model in ('pvsyst', 'faiman'):
+            required = set()
+        else:
+            raise ValueError(temperature_model +
+                             ' is not a valid temperature model')
+        missing = required - set(systems.columns)
+        if missing:
+            raise ValueError(f'systems is missing the columns '
+                             f'{sorted(missing)} required by the '
+                             f'{temperature_model} temperature model')
+        self.temperature_model = temperature_model
 
+        self.results = FleetModelChainResult()
+
+    def __repr__(self):
+        attrs = ['name', 'transposition_model', 'airmass_model', 'dc_model',
+                 'ac_model', 'aoi_model', 'temperature_model']
+        return ('FleetModelChain: \n  ' + '\n  '.join(
+            f'{attr}: {getattr(self, attr)}' for attr in attrs) +
+            f'\n  systems: {len(self.systems)}')
+
+    @staticmethod
+    def _check_params(parameters, required, model, kind):
+        # a parameter is only available if every system has a value for it
+        missing = required - set(parameters.dropna().index)
+        if missing:
+            raise ValueError(f'{kind} parameters are missing {sorted(missing)}'
+                             f' required by the {model} model')
+
+    def _infer_dc_model(self):
+        params = set(self.module_parameters.dropna().index)
+        for model in ('cec', 'desoto', 'pvsyst'):
+            if _DC_MODEL_PARAMS[model] <= params:
+                return model
+        if {'pdc0', 'gamma_pdc'} <= params:
+            return 'pvwatts'
+        raise ValueError('Could not infer DC model from the module '
+                         'parameters. Check the module parameters or '
+                         'explicitly set the model with the dc_model '
+                         'keyword argument.')
+
+    def _infer_ac_model(self):
+        params = set(self.inverter_parameters.dropna().index)
+        if _snl_params(params):
+            return 'sandia'
+        if _pvwatts_params(params):
+            return 'pvwatts'
+        raise ValueError('Could not infer AC model from the inverter '
+                         'parameters. Check the inverter parameters or '
+                         'explicitly set the model with the ac_model '
+                         'keyword argument.')
+
+    @staticmethod
+    def _column(values):
+        """(N, 1) float array of per-system values."""
+        return np.asarray(values, dtype=np.float64)[:, np.newaxis]
+
+    def _system_param(self, name):
+        if name in self.systems:
+            return self._column(self.systems[name])
+        return _FLEET_SYSTEM_DEFAULTS[name]
+
+    def _params(self, parameters, names):
+        """(N, 1) arrays of the ``names`` that are in ``parameters``."""
+        return {name: self._column(parameters.loc[name]) for name in names
+                if name in parameters.index}
+
+    def _weather(self, weather, name, default=None):
+        """(N, T) or (1, T) array of a weather variable."""
+        if name not in weather:
+            return default
+        data = weather[name]
+        if isinstance(data, pd.DataFrame):
+            return np.asarray(data[self.systems.index].values,
+                              dtype=np.float64).T
+        return np.asarray(data, dtype=np.float64)[np.newaxis, :]
+
+    def _frame(self, values):
+        """DataFrame of a (N, T) array, indexed by time."""
+        values = np.broadcast_to(values, (len(self.systems),
+                                          len(self.results.times)))
+        return pd.DataFrame(values.T, index=self.results.times,
+                            columns=self.systems.index)
+
+    def prepare_inputs(self, weather):
+        """
+        Calculate solar position, airmass, angle of incidence and plane of
+        array irradiance of every system.
+
+        Parameters
+        ----------
+        weather : dict or DataFrame
+            Maps the names ``'ghi'``, ``'dni'``, ``'dhi'`` and optionally
+            ``'temp_air'`` (default 20 C), ``'wind_speed'`` (0 m/s) and
+            ``'pressure'`` (from ``'altitude'``) to a DataFrame indexed by
+            time with one column per system, or to a Series with the same
+            values for every system. A DataFrame with columns
+            ``(name, system)`` also works.
+
+        Returns
+        -------
+        self
+
+        Raises
+        ------
+        ValueError
+            If any of ``'ghi'``, ``'dni'`` or ``'dhi'`` is missing.
+        """
+        missing = [name for name in ('ghi', 'dni', 'dhi')
+                   if name not in weather]
+        if missing:
+            raise ValueError(f'weather is missing {missing}')
+        self.results = FleetModelChainResult(times=weather['ghi'].index)
+        self._irradiance = {name: self._weather(weather, name)
+                            for name in ('ghi', 'dni', 'dhi')}
+        self._temp_air = self._weather(weather, 'temp_air', 20.)
+        self._wind_speed = self._weather(weather, 'wind_speed', 0.)
+
+        pressure = atmosphere.alt2pres(self._system_param('altitude'))
+        self._prep_inputs_solar_pos(
+            self._weather(weather, 'pressure', pressure),
+            self._weather(weather, 'temp_air', 12.))
+        self._prep_inputs_airmass(pressure)
+        self._prep_inputs_irradiance()
+        return self
+
+    def _prep_inputs_solar_pos(self, pressure, temperature):
+        spa = solarposition._spa_python_import('numpy')
+        times = self.results.times
+        unixtime = np.asarray(times.view(np.int64) / 10**9)[np.newaxis, :]
+        # pressure in millibars, as in solarposition.spa_python
+        position = spa.solar_position_numpy(
+            unixtime, self._system_param('latitude'),
+            self._system_param('longitude'), self._system_param('altitude'),
+            pressure / 100, temperature, 67.0, 0.5667, numthreads=1)
+        self._solar_position = dict(zip(
+            ('apparent_zenith', 'zenith', 'apparent_elevation', 'elevation',
+             'azimuth', 'equation_of_time'), position))
+        self.results.solar_position = {
+            key: self._frame(value)
+            for key, value in self._solar_position.items()}
+        return self
+
+    def _prep_inputs_airmass(self, pressure):
+        if self.airmass_model in atmosphere.APPARENT_ZENITH_MODELS:
+            zenith = self._solar_position['apparent_zenith']
+        elif self.airmass_model in atmosphere.TRUE_ZENITH_MODELS:
+            zenith = self._solar_position['zenith']
+        else:
+            raise ValueError(f'{self.airmass_model} is not a valid airmass '
+                             'model')
+        self._airmass = atmosphere.get_relative_airmass(zenith,
+                                                        self.airmass_model)
+        self.results.airmass = {
+            'airmass_relative': self._frame(self._airmass),
+            'airmass_absolute': self._frame(
+                atmosphere.get_absolute_airmass(self._airmass, pressure))}
         return self
 
+    def _prep_inputs_irradiance(self):
+        surface_tilt = self._system_param('surface_tilt')
+        surface_azimuth = self._system_param('surface_azimuth')
+        zenith = self._solar_position['apparent_zenith']
+        azimuth = self._solar_position['azimuth']
+        self._aoi = pvlib.irradiance.aoi(surface_tilt, surface_azimuth,
+                                         zenith, azimuth)
+        self.results.aoi = self._frame(self._aoi)
+        dni_extra = pvlib.irradiance.get_extra_radiation(self.results.times)
+        self._total_irrad = pvlib.irradiance.get_total_irradiance(
+            surface_tilt, surface_azimuth, zenith, azimuth,
+            self._irradiance['dni'], self._irradiance['ghi'],
+            self._irradiance['dhi'],
+            dni_extra=np.asarray(dni_extra)[np.newaxis, :],
+            airmass=self._airmass, albedo=self._system_param('albedo'),
+            model=self.transposition_model)
+        self.results.total_irrad = {
+            key: self._frame(value)
+            for key, value in self._total_irrad.items()}
+        return self
+
+    def run_model(self, weather):
+        """
+        Run the models of every system, starting with GHI, DNI and DHI.
+
+        Parameters
+        ----------
+        weather : dict or DataFrame
+            See :py:meth:`prepare_inputs`.
+
+        Returns
+        -------
+        self
+
+        Notes
+        -----
+        Assigns every attribute of ``results``.
+        """
+        self.prepare_inputs(weather)
+        self._calc_aoi_modifier()
+        self._calc_effective_irradiance()
+        self._calc_cell_temperature()
+        self._calc_dc()
+        self._calc_ac()
+        return self
+
+    def _calc_aoi_modifier(self):
+        if self.aoi_model == 'no_loss':
+            self._aoi_modifier = 1.
+        else:
+            kwargs = self._params(self.module_parameters,
+                                  iam._IAM_MODEL_PARAMS[self.aoi_model])
+            self._aoi_modifier = getattr(iam, self.aoi_model)(self._aoi,
+                                                              **kwargs)
+        self.results.aoi_modifier = self._frame(self._aoi_modifier)
+        return self
+
+    def _calc_effective_irradiance(self):
+        fd = self._params(self.module_parameters, ['FD']).get('FD', 1.)
+        self._effective_irradiance = (
+            self._total_irrad['poa_direct'] * self._aoi_modifier +
+            fd * self._total_irrad['poa_diffuse'])
+        self.results.effective_irradiance = self._frame(
+            self._effective_irradiance)
+        return self
+
+    def _calc_cell_temperature(self):
+        if self.temperature_model == 'sapm':
+            func = temperature.sapm_cell
+            kwargs = self._params(self.systems.T,
+                                  ['a', 'b', 'deltaT', 'irrad_ref'])
+        elif self.temperature_model == 'pvsyst':
+            func = temperature.pvsyst_cell
+            kwargs = {
+                **self._params(self.module_parameters,
+                               ['module_efficiency', 'alpha_absorption']),
+                **self._params(self.systems.T, ['u_c', 'u_v'])}
+        else:
+            func = temperature.faiman
+            kwargs = self._params(self.systems.T, ['u0', 'u1'])
+        self._cell_temp = func(self._total_irrad['poa_global'],
+                               self._temp_air, self._wind_speed, **kwargs)
+        self.results.cell_temperature = self._frame(self._cell_temp)
+        return self
+
+    def _calc_dc(self):
+        voltage = self._system_param('modules_per_string')
+        current = self._system_param('strings_per_inverter')
+        if self.dc_model == 'pvwatts':
+            dc = {'p_mp': pvsystem.pvwatts_dc(
+                self._effective_irradiance, self._cell_temp,
+                **self._params(self.module_parameters,
+                               ['pdc0', 'gamma_pdc', 'temp_ref']))}
+        else:
+            calcparams, names = _FLEET_CALCPARAMS[self.dc_model]
+            dc = pvsystem.singlediode(*calcparams(
+                self._effective_irradiance, self._cell_temp,
+                **self._params(self.module_parameters, names)))
+        # as in PVSystem.scale_voltage_current_power, and ModelChain fills
+        # nan with 0
+        for key, value in dc.items():
+            if key.startswith('v'):
+                value = value * voltage
+            elif key.startswith('i'):
+                value = value * current
+            else:
+                value = value * voltage * current
+            dc[key] = np.where(np.isnan(value), 0., value)
+        self._dc_result = dc
+        self.results.dc = {key: self._frame(value)
+                           for key, value in dc.items()}
+        return self
+
+    def _calc_ac(self):
+        if self.ac_model == 'sandia':
+            params = self._params(self.inverter_parameters,
+                                  ['Paco', 'Pdco', 'Vdco', 'Pso', 'C0', 'C1',
+                                   'C2', 'C3', 'Pnt'])
+            ac = inverter.sandia(self._dc_result['v_mp'],
+                                 self._dc_result['p_mp'], params)
+        else:
+            params = self._params(self.inverter_parameters,
+                                  ['pdc0', 'eta_inv_nom', 'eta_inv_ref'])
+            ac = inverter.pvwatts(self._dc_result['p_mp'], **params)
+            ac = np.where(np.isnan(ac), 0., ac)
+        self.results.ac = self._frame(ac)
+        return self
+
+
+# columns of the systems table passed to run_model_parallel as
+# PVSystem.temperature_model_parameters
+_PARALLEL_TEMPERATURE_PARAMS = ('a', 'b', 'deltaT', 'irrad_ref', 'u_c',
+                                'u_v', 'u0', 'u1')
+
+# state of a run_model_parallel worker, set by _parallel_init
+_PARALLEL_WORKER = {}
+
+
+def _shared_array(context, shape, values=0.):
+    """RawArray of float64 with ``shape``, filled with ``values``."""
+    buffer = context.RawArray('d', max(int(np.prod(shape)), 1))
+    _shared_view(buffer, shape)[...] = values
+    return buffer, shape
+
+
+def _shared_view(buffer, shape):
+    return np.frombuffer(buffer, dtype=np.float64)[:int(np.prod(shape))] \
+        .reshape(shape)
+
+
+def _parallel_init(modules, inverters, weather, outputs, times,
+                   modelchain_kwargs):
+    _PARALLEL_WORKER.update(
+        modules=modules, inverters=inverters, module_parameters={},
+        inverter_parameters={}, times=times, kwargs=modelchain_kwargs,
+        weather={name: _shared_view(*value)
+                 for name, value in weather.items()},
+        outputs={key: _shared_view(*value)
+                 for key, value in outputs.items()})
+
+
+def _parallel_parameters(kind, name):
+    """Parameters of a module or inverter, converted once per worker."""
+    cache = _PARALLEL_WORKER[kind + '_parameters']
+    if name not in cache:
+        cache[name] = _PARALLEL_WORKER[kind + 's'][name].dropna().to_dict()
+    return cache[name]
+
+
+def _parallel_model(position, system, outputs):
+    """Run the ModelChain of one system of run_model_parallel."""
+    temperature_model_parameters = {
+        key: system[key] for key in _PARALLEL_TEMPERATURE_PARAMS
+        if key in system} or None
+    pv_system = pvsystem.PVSystem(
+        surface_tilt=system['surface_tilt'],
+        surface_azimuth=system['surface_azimuth'],
+        albedo=system.get('albedo'),
+        module_parameters=_parallel_parameters('module', system['module']),
+        temperature_model_parameters=temperature_model_parameters,
+        modules_per_string=system.get('modules_per_string', 1),
+        strings_per_inverter=system.get('strings_per_inverter', 1),
+        inverter_parameters=_parallel_parameters('inverter',
+                                                 system['inverter']))
+    location = Location(system['latitude'], system['longitude'],
+                        altitude=system.get('altitude', 0))
+    weather = pd.DataFrame(
+        {name: values[:, position if values.shape[1] > 1 else 0]
+         for name, values in _PARALLEL_WORKER['weather'].items()},
+        index=_PARALLEL_WORKER['times'])
+    mc = ModelChain(pv_system, location, results_format='numpy',
+                    **_PARALLEL_WORKER['kwargs'])
+    return mc.run_model(weather, outputs=outputs).results
+
+
+def _parallel_store(position, results, outputs):
+    for (name, column), out in outputs.items():
+        values = getattr(results, name)
+        if column is not None:
+            values = values[column]
+        out[position] = values
+
+
+def _parallel_run(task):
+    position, system = task
+    outputs = _PARALLEL_WORKER['outputs']
+    results = _parallel_model(position, system,
+                              {name for name, _ in outputs})
+    _parallel_store(position, results, outputs)
+    return position
+
+
+def run_model_parallel(systems, modules, inverters, weather,
+                       outputs=('ac',), processes=None, chunksize=1,
+                       context=None, **kwargs):
+    """
+    Run a :py:class:`ModelChain` for each of many systems in a pool of
+    worker processes.
+
+    Every worker receives ``modules``, ``inverters`` and the weather data
+    once, when it is started, rather than with each system. The weather
+    data and the outputs are in shared memory, so that each task only
+    sends one row of ``systems`` to a worker and each worker writes its
+    results directly into the output arrays.
+
+    Parameters
+    ----------
+    systems : DataFrame
+        One row per system, indexed by system name, with the columns
+        described in :py:class:`FleetModelChain`. Each system is one
+        PVSystem at one Location.
+
+    modules : DataFrame
+        Module parameters with one column per module, as returned by
+        :py:func:`~pvlib.pvsystem.retrieve_sam`.
+
+    inverters : DataFrame
+        Inverter parameters with one column per inverter, as returned by
+        :py:func:`~pvlib.pvsystem.retrieve_sam`.
+
+    weather : DataFrame or dict
+        Weather data of all systems, with the columns described in
+        :py:meth:`ModelChain.run_model`. Alternatively, a dict mapping each
+        weather variable to a Series shared by all systems or to a
+        DataFrame indexed by time with one column per system.
+
+    outputs : sequence of str, default ('ac',)
+        Names of :py:class:`ModelChainResult` attributes to return.
+
+    processes : None or int, default None
+        Number of worker processes. If None, the number returned by
+        :py:func:`os.cpu_count` is used. If 1, all systems are run in the
+        calling process.
+
+    chunksize : int, default 1
+        Number of systems sent to a worker at a time.
+
+    context : None or multiprocessing context, default None
+        Context used to start the workers. If None,
+        ``multiprocessing.get_context('spawn')``.
+
+    **kwargs
+        Passed to :py:class:`ModelChain`, e.g. ``dc_model`` and
+        ``ac_model``.
+
+    Returns
+    -------
+    dict
+        Maps each name in ``outputs`` to a DataFrame indexed by time with
+        one column per system, or, if the attribute is a DataFrame, to a
+        dict of such DataFrames by column.
+
+    Notes
+    -----
+    The first system is run in the calling process to determine the
+    shape of each output, and any error in the configuration is raised
+    there. Errors in the workers are raised when they are collected.
+
+    Workers are started with the 'spawn' method by default, because
+    forking a process after numba has started its thread pool, e.g. in
+    the ``how='numba'`` solvers, is not safe with every numba threading
+    layer. With 'spawn', scripts that call this function must protect
+    their entry point with ``if __name__ == '__main__':``.
+
+    See also
+    --------
+    FleetModelChain
+    """
+    missing = set(_FLEET_SYSTEM_COLUMNS) - set(systems.columns)
+    if missing:
+        raise ValueError(f'systems is missing required columns '
+                         f'{sorted(missing)}')
+    if isinstance(weather, pd.DataFrame):
+        weather = {name: weather[name] for name in weather.columns}
+    times = next(iter(weather.values())).index
+    if context is None:
+        context = multiprocessing.get_context('spawn')
+
+    shared_weather = {}
+    for name, data in weather.items():
+        if isinstance(data, pd.DataFrame):
+            values = data[systems.index].values
+        else:
+            values = np.asarray(data)[:, np.newaxis]
+        shared_weather[name] = _shared_array(context, values.shape, values)
+    tasks = [(position, row.dropna().to_dict())
+             for position, (_, row) in enumerate(systems.iterrows())]
+    shape = (len(systems), len(times))
+
+    init_args = (modules, inverters, shared_weather, {}, times, kwargs)
+    _parallel_init(*init_args)
+    try:
+        first = _parallel_model(*tasks[0], outputs)
+    finally:
+        _PARALLEL_WORKER.clear()
+    shared_outputs = {}
+    for name in outputs:
+        values = getattr(first, name)
+        if isinstance(values, dict):
+            keys = [(name, column) for column in values]
+        else:
+            keys = [(name, None)]
+        for key in keys:
+            shared_outputs[key] = _shared_array(context, shape)
+    _parallel_store(0, first, {key: _shared_view(*value)
+                               for key, value in shared_outputs.items()})
+
+    init_args = (modules, inverters, shared_weather, shared_outputs, times,
+                 kwargs)
+    if processes == 1:
+        _parallel_init(*init_args)
+        try:
+            for task in tasks[1:]:
+                _parallel_run(task)
+        finally:
+            _PARALLEL_WORKER.clear()
+    else:
+        with context.Pool(processes, initializer=_parallel_init,
+                          initargs=init_args) as pool:
+            for _ in pool.imap_unordered(_parallel_run, tasks[1:],
+                                         chunksize=chunksize):
+                pass
+
+    results = {}
+    for (name, column), value in shared_outputs.items():
+        frame = pd.DataFrame(_shared_view(*value).T, index=times,
+                             columns=systems.index)
+        if column is None:
+            results[name] = frame
+        else:
+            results.setdefault(name, {})[column] = frame
+    return results
+
+
+def pvwatts_chain(solar_zenith, solar_azimuth, dni, ghi, dhi, dni_extra,
+                  airmass, temp_air, wind_speed, surface_tilt,
+                  surface_azimuth, pdc0, gamma_pdc, inverter_pdc0, a, b,
+                  deltaT, albedo=0.25, temp_ref=25., irrad_ref=1000.,
+                  n=1.526, K=4., L=0.002, modules_per_string=1,
+                  strings_per_inverter=1, losses=None, eta_inv_nom=0.96,
+                  eta_inv_ref=0.9637, how='numpy'):
+    """
+    DC and AC power of the PVWatts model chain, evaluated on arrays in one
+    fused pass.
+
+    Computes the same results as ``ModelChain.with_pvwatts(...).run_model``
+    for systems of one Array on a fixed mount: perez transposition,
+    physical AOI losses, no spectral losses, sapm cell temperature,
+    PVWatts DC power, PVWatts losses and PVWatts inverter. All inputs
+    broadcast against each other, so that a portfolio can be simulated by
+    passing system parameters with shape (N, 1) and weather with shape
+    (T,) or (N, T). The Perez brightening coefficients are calculated
+    once on the shape of the sky inputs, which is usually (T,), rather
+    than for every system.
+
+    Parameters
+    ----------
+    solar_zenith : numeric
+        Apparent solar zenith angle. [degrees]
+
+    solar_azimuth : numeric
+        Solar azimuth angle. [degrees]
+
+    dni : numeric
+        Direct normal irradiance. [W/m2]
+
+    ghi : numeric
+        Global horizontal irradiance. [W/m2]
+
+    dhi : numeric
+        Diffuse horizontal irradiance. [W/m2]
+
+    dni_extra : numeric
+        Extraterrestrial direct normal irradiance. [W/m2]
+
+    airmass : numeric
+        Relative airmass. [unitless]
+
+    temp_air : numeric
+        Ambient air temperature. [C]
+
+    wind_speed : numeric
+        Wind speed. [m/s]
+
+    surface_tilt : numeric
+        Surface tilt angle. [degrees]
+
+    surface_azimuth : numeric
+        Surface azimuth angle. [degrees]
+
+    pdc0 : numeric
+        Power of one module at 1000 W/m2 and cell reference temperature.
+        [W]
+
+    gamma_pdc : numeric
+        Temperature coefficient of power. [1/C]
+
+    inverter_pdc0 : numeric
+        DC input limit of the inverter. [W]
+
+    a, b, deltaT : numeric
+        Parameters of :py:func:`~pvlib.temperature.sapm_cell`.
+
+    albedo : numeric, default 0.25
+        Ground surface albedo. [unitless]
+
+    temp_ref : numeric, default 25
+        Cell reference temperature. [C]
+
+    irrad_ref : numeric, default 1000
+        Reference irradiance of :py:func:`~pvlib.temperature.sapm_cell`.
+        [W/m2]
+
+    n, K, L : numeric, default 1.526, 4, 0.002
+        Parameters of :py:func:`~pvlib.iam.physical`.
+
+    modules_per_string, strings_per_inverter : numeric, default 1
+        Scale DC power as
+        :py:meth:`~pvlib.pvsystem.PVSystem.scale_voltage_current_power`.
+
+    losses : None or numeric, default None
+        Total DC losses in percent. If None, the default of
+        :py:func:`~pvlib.pvsystem.pvwatts_losses`.
+
+    eta_inv_nom, eta_inv_ref : numeric, default 0.96, 0.9637
+        Parameters of :py:func:`~pvlib.inverter.pvwatts`.
+
+    how : str, default 'numpy'
+        Options are ``'numpy'`` or ``'numba'``. ``'numba'`` evaluates the
+        model chain with a compiled, multithreaded kernel that does not
+        store intermediate results, and falls back to ``'numpy'`` with a
+        warning if numba is not installed. Inputs with more than two
+        dimensions are not supported with ``'numba'``.
+
+    Returns
+    -------
+    dc : numeric
+        DC power after losses, as ``ModelChainResult.dc``. [W]
+
+    ac : numeric
+        AC power, as ``ModelChainResult.ac``. Missing values are 0. [W]
+
+    Raises
+    ------
+    ValueError
+        If Series inputs do not share the same index.
+
+    Notes
+    -----
+    Outputs are Series if any input is a Series and the outputs are 1-D,
+    and arrays otherwise. Solar position, airmass and ``dni_extra`` are
+    inputs rather than calculated, so that they can be shared by the
+    systems at one location, e.g. with
+    :py:class:`~pvlib.location.SolarPositionCache`.
+
+    See also
+    --------
+    ModelChain.with_pvwatts
+    FleetModelChain
+    """
+    index = None
+    for arg in (solar_zenith, solar_azimuth, dni, ghi, dhi, dni_extra,
+                airmass, temp_air, wind_speed):
+        if isinstance(arg, pd.Series):
+            if index is None:
+                index = arg.index
+            elif not arg.index.equals(index):
+                raise ValueError('Series inputs must have the same index')
+
+    if losses is None:
+        losses = pvsystem.pvwatts_losses()
+    args = [np.asarray(x, dtype=np.float64) for x in (
+        solar_zenith, solar_azimuth, dni, ghi, dhi, dni_extra, airmass,
+        temp_air, wind_speed, surface_tilt, surface_azimuth, pdc0,
+        gamma_pdc, inverter_pdc0, a, b, deltaT, albedo, temp_ref,
+        irrad_ref, n, K, L, modules_per_string, strings_per_inverter,
+        losses, eta_inv_nom, eta_inv_ref)]
+    (solar_zenith, solar_azimuth, dni, ghi, dhi, dni_extra, airmass,
+     temp_air, wind_speed, surface_tilt, surface_azimuth, pdc0, gamma_pdc,
+     inverter_pdc0, a, b, deltaT, albedo, temp_ref, irrad_ref, n, K, L,
+     modules_per_string, strings_per_inverter, losses, eta_inv_nom,
+     eta_inv_ref) = args
+    shape = np.broadcast(*args).shape
+
+    # terms of the Perez model that do not depend on the surface. where
+    # airmass is nan, perez returns 0 sky diffuse, which zeroing dhi and
+    # the coefficients reproduces
+    F1, F2 = pvlib.irradiance._perez_brightening(
+        dhi, dni, dni_extra, solar_zenith, airmass, 'allsitescomposite1990')
+    no_airmass = np.isnan(airmass)
+    F1 = np.where(no_airmass, 0., F1)
+    F2 = np.where(no_airmass, 0., F2)
+    dhi = np.where(no_airmass, 0., dhi)
+    cos_zenith = np.maximum(tools.cosd(solar_zenith), tools.cosd(85))
+    pdc0 = pdc0 * modules_per_string * strings_per_inverter
+    loss_factor = (100 - losses) / 100.
+
+    if tools._use_kernels(how, '_modelchain_kernels'):
+        # the sines and cosines of the angles are calculated on the shapes
+        # of the angles, e.g. (N, 1) and (T,), rather than on (N, T)
+        dc, ac = _pvwatts_chain_kernel(
+            tools.cosd(surface_tilt), tools.sind(surface_tilt),
+            surface_azimuth, tools.cosd(solar_zenith),
+            tools.sind(solar_zenith), solar_azimuth, dni, ghi, dhi, F1, F2,
+            cos_zenith, temp_air, wind_speed, albedo, pdc0, gamma_pdc,
+            temp_ref, n, K, L, a, b, deltaT, irrad_ref, loss_factor,
+            inverter_pdc0, eta_inv_nom, eta_inv_ref, shape=shape)
+    else:
+        projection = pvlib.irradiance.aoi_projection(
+            surface_tilt, surface_azimuth, solar_zenith, solar_azimuth)
+        aoi = np.rad2deg(np.arccos(projection))
+        poa_direct = np.maximum(dni * tools.cosd(aoi), 0)
+        cos_tilt = tools.cosd(surface_tilt)
+        sky_diffuse = np.maximum(dhi * (
+            0.5 * (1 - F1) * (1 + cos_tilt) +
+            F1 * np.maximum(projection, 0) / cos_zenith +
+            F2 * tools.sind(surface_tilt)), 0)
+        poa_diffuse = sky_diffuse + ghi * albedo * (1 - cos_tilt) * 0.5
+        poa_global = poa_direct + poa_diffuse
+        effective_irradiance = (
+            poa_direct * iam.physical(aoi, n=n, K=K, L=L) + poa_diffuse)
+        temp_cell = temperature.sapm_cell(poa_global, temp_air, wind_speed,
+                                          a, b, deltaT, irrad_ref)
+        dc = pvsystem.pvwatts_dc(effective_irradiance, temp_cell, pdc0,
+                                 gamma_pdc, temp_ref) * loss_factor
+        ac = inverter.pvwatts(dc, inverter_pdc0, eta_inv_nom, eta_inv_ref)
+        ac = np.where(np.isnan(ac), 0., ac)
+
+    if index is not None and len(shape) == 1:
+        return pd.Series(dc, index=index), pd.Series(ac, index=index)
+    return dc[()], ac[()]
+
+
+def _pvwatts_chain_kernel(*args, shape):
+    """
+    Evaluate ``pvlib._modelchain_kernels.pvwatts`` on ``args`` broadcast to
+    ``shape``, without expanding them in memory.
+    """
+    from pvlib import _modelchain_kernels
+
+    if len(shape) > 2:
+        raise ValueError("inputs with more than two dimensions are not "
+                         "supported with how='numba'")
+    rows, columns = (1,) * (2 - len(shape)) + shape
+    # pad each input to two dimensions of length 1 or of the output
+    arrays = [np.ascontiguousarray(
+        np.reshape(x, (1,) * (2 - x.ndim) + x.shape)) for x in args]
+    dc, ac = _modelchain_kernels.pvwatts(*arrays, rows, columns)
+    return dc.reshape(shape), ac.reshape(shape)
+
 
 def _irrad_for_celltemp(total_irrad, effective_irradiance):
     """
@@ -1963,6 +3489,177 @@ def _pvwatts_params(inverter_params):
     return {'pdc0'} <= inverter_params
 
 
+def _to_numpy(data):
+    """Convert Series to arrays and DataFrames to dicts of arrays."""
+    if isinstance(data, tuple):
+        return tuple(_to_numpy(d) for d in data)
+    if isinstance(data, pd.Series):
+        return data.values
+    if isinstance(data, pd.DataFrame):
+        return {column: data[column].values for column in data.columns}
+    return data
+
+
+def _check_outputs(outputs):
+    """Set of the result names in ``outputs``, or None."""
+    if outputs is None:
+        return None
+    if isinstance(outputs, str):
+        outputs = [outputs]
+    outputs = set(outputs)
+    invalid = outputs - set(_RESULT_STAGES) - {'times'}
+    if invalid:
+        raise ValueError(f'outputs {sorted(invalid)} are not results of '
+                         f'ModelChain. Valid outputs are '
+                         f'{sorted(_RESULT_STAGES)}')
+    return outputs
+
+
+class _StageCache:
+    """
+    Results of the last call of :py:meth:`ModelChain.run_model`, and the
+    inputs they were calculated from. See the ``cache_stages`` parameter of
+    :py:class:`ModelChain`.
+    """
+
+    def __init__(self):
+        # solar position, airmass, tracking and aoi, and the weather
+        # columns that solar position reads
+        self.prep_key = None
+        self.prep_inputs = None
+        self.prep = {}
+        # timestamps of the current call of run_model
+        self.times = None
+        # results of the requested outputs, and the weather
+        self.key = None
+        self.weather = None
+        self.results = {}
+
+
+def _config_key(value):
+    """Nested tuples of the attributes and parameters of a Location or
+    PVSystem, which are equal if the configuration is unchanged. Methods
+    and other callable attributes are ignored."""
+    if isinstance(value, dict):
+        return tuple((key, _config_key(v)) for key, v in value.items()
+                     if not callable(v))
+    if isinstance(value, (list, tuple)):
+        return tuple(_config_key(v) for v in value)
+    if isinstance(value, pd.Series):
+        return _config_key(value.to_dict())
+    if isinstance(value, (pd.DataFrame, np.ndarray)):
+        return _config_key(np.asarray(value).tolist())
+    if isinstance(value, float) and np.isnan(value):
+        return 'nan'
+    if hasattr(value, '__dict__') and not callable(value):
+        return (type(value).__name__, _config_key(vars(value)))
+    return value
+
+
+def _unchanged_rows(data, cached):
+    """Boolean array that is True for the rows of DataFrame `data` whose
+    time and values are in DataFrame `cached`."""
+    if (cached is None or list(data.columns) != list(cached.columns) or
+            data.index.has_duplicates):
+        return np.zeros(len(data), dtype=bool)
+    old = cached.reindex(data.index).values
+    new = data.values
+    same = (new == old) | (pd.isnull(new) & pd.isnull(old))
+    return data.index.isin(cached.index) & same.all(axis=1)
+
+
+def _select_rows(data, rows):
+    """Select `rows` of a DataFrame or of each DataFrame in a tuple."""
+    if isinstance(data, tuple):
+        return tuple(d.iloc[rows] for d in data)
+    return data.iloc[rows]
+
+
+def _merge_rows(cached, calculated, times):
+    """The rows at `times` of a result, taken from `calculated` if present
+    and from `cached` otherwise. All rows are kept if `times` is None."""
+    if calculated is None:
+        calculated, cached = cached, None
+    if isinstance(calculated, tuple):
+        if cached is None:
+            cached = (None,) * len(calculated)
+        return tuple(_merge_rows(old, new, times)
+                     for old, new in zip(cached, calculated))
+    if not isinstance(calculated, (pd.Series, pd.DataFrame)):
+        # None or a constant, e.g. the losses of the 'no_loss' model
+        return calculated
+    if cached is not None:
+        cached = cached[~cached.index.isin(calculated.index)]
+        calculated = pd.concat([cached, calculated])
+    if times is None:
+        return calculated
+    return calculated.reindex(times)
+
+
+def _nbytes(value):
+    """Size in bytes of the data of a result."""
+    if isinstance(value, tuple):
+        return sum(_nbytes(v) for v in value)
+    if isinstance(value, dict):
+        return sum(_nbytes(v) for v in value.values())
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return int(np.sum(value.memory_usage(index=False)))
+    return getattr(value, 'nbytes', 0)
+
+
+def _weather_chunks(weather, chunksize):
+    """Consecutive chunks of `chunksize` rows of a DataFrame or of each
+    DataFrame in a tuple."""
+    num_rows = len(weather[0] if isinstance(weather, tuple) else weather)
+    for start in range(0, num_rows, chunksize):
+        rows = slice(start, start + chunksize)
+        if isinstance(weather, tuple):
+            yield tuple(w.iloc[rows] for w in weather)
+        else:
+            yield weather.iloc[rows]
+
+
+def _concat_results(values):
+    """Concatenate the values of one result from consecutive chunks."""
+    if not values:
+        return None
+    first = values[0]
+    if isinstance(first, tuple):
+        return tuple(_concat_results(list(v)) for v in zip(*values))
+    if isinstance(first, (pd.Series, pd.DataFrame)):
+        return pd.concat(values)
+    if isinstance(first, pd.Index):
+        return first.append(values[1:])
+    if isinstance(first, dict):
+        return OrderedDict((key, _concat_results([v[key] for v in values]))
+                           for key in first)
+    if np.ndim(first) == 0:
+        # None or a constant, e.g. the losses of the 'no_loss' model
+        return first
+    return np.concatenate(values)
+
+
+def _select_keys(data, keys):
+    """Keep only the ``keys`` of a DataFrame or dict, or of each one in a
+    tuple."""
+    if isinstance(data, tuple):
+        return tuple(_select_keys(d, keys) for d in data)
+    keys = [key for key in keys if key in data]
+    if isinstance(data, pd.DataFrame):
+        return data[keys]
+    return OrderedDict((key, data[key]) for key in keys)
+
+
+def _fillna(data, value):
+    """fillna for pandas objects, arrays and dicts of arrays."""
+    if isinstance(data, (pd.Series, pd.DataFrame)):
+        return data.fillna(value)
+    if isinstance(data, dict):
+        return OrderedDict((key, _fillna(values, value))
+                           for key, values in data.items())
+    return np.where(np.isnan(data), value, data)
+
+
 def _copy(data):
     """Return a copy of each DataFrame in `data` if it is a tuple,
     otherwise return a copy of `data`."""
@@ -67,6 +67,81 @@ def _unwrap_single_value(func):
     return f
 
 
+def _stack_per_array(index, *values):
+    """
+    Stack the values of each input for every Array, to evaluate a model for
+    all Arrays in one call.
+
+    Each of `values` is a sequence with one value per Array. If these are
+    the same object, it is used for all Arrays. Otherwise scalars are
+    stacked into a column of shape (number of Arrays, 1), and Series indexed
+    by `index` or 1-D arrays into an array of shape (number of Arrays,
+    number of times). Series are replaced by their values.
+
+    Returns
+    -------
+    list or None
+        The stacked inputs, or None if `index` is None or an input can't be
+        stacked, in which case the Arrays must be evaluated one at a time.
+    """
+    if index is None:
+        return None
+    stacked = []
+    for per_array in values:
+        per_array = list(per_array)
+        for i, value in enumerate(per_array):
+            if isinstance(value, pd.Series):
+                if not value.index.equals(index):
+                    return None
+                per_array[i] = value.values
+            elif value is None or np.ndim(value) > 1:
+                return None
+        if all(value is per_array[0] for value in per_array):
+            stacked.append(per_array[0])
+            continue
+        ndims = {np.ndim(value) for value in per_array}
+        if ndims == {1} and {len(value) for value in per_array} == {
+                len(index)}:
+            stacked.append(np.vstack(per_array))
+        elif ndims == {0}:
+            try:
+                stacked.append(np.array(per_array, dtype=float)[:, np.newaxis])
+            except (TypeError, ValueError):
+                return None
+        else:
+            return None
+    return stacked
+
+
+def _unstack_series(values, index, num_arrays, names=None):
+    """Split an array of shape (number of Arrays, number of times), or one
+    that broadcasts to it, into a tuple of Series named by `names`."""
+    shape = (num_arrays, len(index))
+    if np.shape(values) != shape:
+        values = np.broadcast_to(values, shape).copy()
+    if names is None or isinstance(names, str):
+        names = (names,) * num_arrays
+    return tuple(pd.Series(row, index=index, name=name)
+                 for row, name in zip(values, names))
+
+
+def _common_name(*values):
+    """Name of the result of arithmetic on `values`: the name of the Series
+    among them if they all have the same name, else None."""
+    names = {value.name for value in values if isinstance(value, pd.Series)}
+    return names.pop() if len(names) == 1 else None
+
+
+def _unstack_frames(values, index, num_arrays):
+    """Split a dict of arrays of shape (number of Arrays, number of times),
+    or that broadcast to it, into a tuple of DataFrames."""
+    shape = (num_arrays, len(index))
+    stacked = np.stack([np.broadcast_to(value, shape)
+                        for value in values.values()], axis=-1)
+    return tuple(pd.DataFrame(frame, index=index, columns=list(values))
+                 for frame in stacked)
+
+
 def _check_deprecated_passthrough(func):
     """
     Decorator to warn or error when getting and setting the "pass-through"
@@ -327,7 +402,19 @@ class PVSystem:
         aoi : Series or tuple of Series
             The angle of incidence
         """
-
+        index = getattr(solar_zenith, 'index', None)
+        if self.num_arrays > 1 and index is not None:
+            orientation = [array.mount.get_orientation(solar_zenith,
+                                                       solar_azimuth)
+                           for array in self.arrays]
+            stacked = _stack_per_array(
+                index, [o['surface_tilt'] for o in orientation],
+                [o['surface_azimuth'] for o in orientation],
+                (solar_zenith,) * self.num_arrays,
+                (solar_azimuth,) * self.num_arrays)
+            if stacked is not None:
+                return _unstack_series(irradiance.aoi(*stacked), index,
+                                       self.num_arrays, 'aoi')
         return tuple(array.get_aoi(solar_zenith, solar_azimuth)
                      for array in self.arrays)
 
@@ -380,6 +467,34 @@ class PVSystem:
         dni = self._validate_per_array(dni, system_wide=True)
         ghi = self._validate_per_array(ghi, system_wide=True)
         dhi = self._validate_per_array(dhi, system_wide=True)
+        if dni_extra is None:
+            # calculate once for all arrays
+            dni_extra = irradiance.get_extra_radiation(solar_zenith.index)
+        index = getattr(solar_zenith, 'index', None)
+        if (self.num_arrays > 1 and index is not None
+                and kwargs.get('how', 'numpy') == 'numpy'):
+            if airmass is None:
+                airmass = atmosphere.get_relative_airmass(solar_zenith)
+            orientation = [array.mount.get_orientation(solar_zenith,
+                                                       solar_azimuth)
+                           for array in self.arrays]
+            stacked = _stack_per_array(
+                index, [o['surface_tilt'] for o in orientation],
+                [o['surface_azimuth'] for o in orientation],
+                (solar_zenith,) * self.num_arrays,
+                (solar_azimuth,) * self.num_arrays, dni, ghi, dhi,
+                (dni_extra,) * self.num_arrays,
+                (airmass,) * self.num_arrays,
+                [array.albedo for array in self.arrays])
+            if stacked is not None:
+                (surface_tilt, surface_azimuth, zenith, azimuth, dni, ghi,
+                 dhi, dni_extra, airmass, albedo) = stacked
+                poa_irradiance = irradiance.get_total_irradiance(
+                    surface_tilt, surface_azimuth, zenith, azimuth, dni, ghi,
+                    dhi, dni_extra=dni_extra, airmass=airmass, model=model,
+                    albedo=albedo, **kwargs)
+                return _unstack_frames(poa_irradiance, index,
+                                       self.num_arrays)
         return tuple(
             array.get_irradiance(solar_zenith, solar_azimuth,
                                  dni, ghi, dhi,
@@ -419,6 +534,21 @@ class PVSystem:
             if `iam_model` is not a valid model name.
         """
         aoi = self._validate_per_array(aoi)
+        if (self.num_arrays > 1
+                and iam_model in ('ashrae', 'physical', 'martin_ruiz')):
+            names = sorted(iam._IAM_MODEL_PARAMS[iam_model])
+            kwargs = [_build_kwargs(names, array.module_parameters)
+                      for array in self.arrays]
+            names = [name for name in names if name in kwargs[0]]
+            if all(list(k) == list(kwargs[0]) for k in kwargs):
+                index = getattr(aoi[0], 'index', None)
+                stacked = _stack_per_array(
+                    index, aoi, *([k[name] for k in kwargs] for name in names))
+                if stacked is not None:
+                    func = getattr(iam, iam_model)
+                    return _unstack_series(
+                        func(stacked[0], **dict(zip(names, stacked[1:]))),
+                        index, self.num_arrays)
         return tuple(array.get_iam(aoi, iam_model)
                      for array, aoi in zip(self.arrays, aoi))
 
@@ -469,6 +599,25 @@ class PVSystem:
         # Not used for all models, but Array.get_cell_temperature handles it
         effective_irradiance = self._validate_per_array(effective_irradiance,
                                                         system_wide=True)
+        if self.num_arrays > 1 and model in ('sapm', 'pvsyst', 'faiman'):
+            models = [array._cell_temperature_model(model)
+                      for array in self.arrays]
+            func, required, optional = models[0]
+            if all(len(r) == len(required) and list(o) == list(optional)
+                   for _, r, o in models):
+                index = getattr(poa_global[0], 'index', None)
+                stacked = _stack_per_array(
+                    index, poa_global, temp_air, wind_speed,
+                    *([r[i] for _, r, _ in models]
+                      for i in range(len(required))),
+                    *([o[name] for _, _, o in models] for name in optional))
+                if stacked is not None:
+                    args = stacked[:3 + len(required)]
+                    kwargs = dict(zip(optional, stacked[3 + len(required):]))
+                    return _unstack_series(
+                        func(*args, **kwargs), index, self.num_arrays,
+                        [_common_name(*inputs) for inputs in
+                         zip(poa_global, temp_air, wind_speed)])
 
         return tuple(
             array.get_cell_temperature(poa_global, temp_air, wind_speed,
@@ -1066,6 +1215,25 @@ class PVSystem:
         """
         g_poa_effective = self._validate_per_array(g_poa_effective)
         temp_cell = self._validate_per_array(temp_cell)
+        if self.num_arrays > 1:
+            kwargs = [_build_kwargs(['temp_ref'], array.module_parameters)
+                      for array in self.arrays]
+            names = list(kwargs[0])
+            if all(list(k) == names for k in kwargs):
+                index = getattr(g_poa_effective[0], 'index', None)
+                stacked = _stack_per_array(
+                    index, g_poa_effective, temp_cell,
+                    [array.module_parameters['pdc0'] for array in self.arrays],
+                    [array.module_parameters['gamma_pdc']
+                     for array in self.arrays],
+                    *([k[name] for k in kwargs] for name in names))
+                if stacked is not None:
+                    return _unstack_series(
+                        pvwatts_dc(*stacked[:4],
+                                   **dict(zip(names, stacked[4:]))),
+                        index, self.num_arrays,
+                        [_common_name(*inputs) for inputs in
+                         zip(g_poa_effective, temp_cell)])
         return tuple(
             pvwatts_dc(g_poa_effective, temp_cell,
                        array.module_parameters['pdc0'],
@@ -1564,6 +1732,17 @@ class Array:
         Some temperature models have requirements for the input types;
         see the documentation of the underlying model function for details.
         """
+        func, required, optional = self._cell_temperature_model(
+            model, effective_irradiance)
+        temperature_cell = func(poa_global, temp_air, wind_speed,
+                                *required, **optional)
+        return temperature_cell
+
+    def _cell_temperature_model(self, model, effective_irradiance=None):
+        """
+        The cell temperature function of ``model`` and its required and
+        optional arguments from the parameters of this Array.
+        """
         # convenience wrapper to avoid passing args 2 and 3 every call
         _build_tcell_args = functools.partial(
             _build_args, input_dict=self.temperature_model_parameters,
@@ -1608,10 +1787,7 @@ class Array:
                                      self.temperature_model_parameters)
         else:
             raise ValueError(f'{model} is not a valid cell temperature model')
-
-        temperature_cell = func(poa_global, temp_air, wind_speed,
-                                *required, **optional)
-        return temperature_cell
+        return func, required, optional
 
     def dc_ohms_from_percent(self):
         """
@@ -1819,6 +1995,30 @@ class SingleAxisTrackerMount(AbstractMount):
         return tracking_data
 
 
+def _module_dimension(effective_irradiance, temp_cell, *module_params):
+    """
+    Prepare the weather inputs of the calcparams functions for module
+    parameters with a leading module dimension.
+
+    Returns ``effective_irradiance``, ``temp_cell`` and whether any module
+    parameter is at least 2-D, e.g. shape (M, 1) for M modules. In that
+    case pandas weather inputs are converted to arrays, so that they
+    broadcast against the module dimension instead of being aligned on
+    their index.
+    """
+    # dEgdT of calcparams_desoto may be a DataFrame indexed like the weather
+    if not any(np.ndim(param) >= 2 and not isinstance(param, pd.DataFrame)
+               for param in module_params):
+        return effective_irradiance, temp_cell, False
+    return np.asarray(effective_irradiance), np.asarray(temp_cell), True
+
+
+def _broadcast_modules(*outputs):
+    """Broadcast the calcparams outputs to their common (M, ...) shape."""
+    return tuple(np.array(output, dtype=np.float64)
+                 for output in np.broadcast_arrays(*outputs))
+
+
 def calcparams_desoto(effective_irradiance, temp_cell,
                       alpha_sc, a_ref, I_L_ref, I_o_ref, R_sh_ref, R_s,
                       EgRef=1.121, dEgdT=-0.0002677,
@@ -1923,6 +2123,14 @@ def calcparams_desoto(effective_irradiance, temp_cell,
 
     Notes
     -----
+    Module parameters are usually floats. To evaluate M modules against the
+    same T values of ``effective_irradiance`` and ``temp_cell``, pass
+    arrays of shape (M, 1) for the module parameters that differ between
+    modules, e.g. the columns of :py:func:`retrieve_sam` output as
+    ``modules.loc['a_ref'].values[:, np.newaxis]``. All outputs then have
+    shape (M, T) and can be passed to :py:func:`singlediode`. Weather inputs
+    that are pandas Series are used by position.
+
     If the reference parameters in the ModuleParameters struct are read
     from a database or library of parameters (e.g. System Advisor
     Model), it is important to use the same EgRef and dEgdT values that
@@ -1985,6 +2193,10 @@ def calcparams_desoto(effective_irradiance, temp_cell,
          Source: [4]
     '''
 
+    effective_irradiance, temp_cell, modules = _module_dimension(
+        effective_irradiance, temp_cell, alpha_sc, a_ref, I_L_ref, I_o_ref,
+        R_sh_ref, R_s, EgRef, dEgdT)
+
     # Boltzmann constant in eV/K
     k = 8.617332478e-05
 
@@ -2015,6 +2227,8 @@ def calcparams_desoto(effective_irradiance, temp_cell,
         Rsh = R_sh_ref * (irrad_ref / effective_irradiance)
     Rs = R_s
 
+    if modules:
+        return _broadcast_modules(IL, I0, Rs, Rsh, nNsVth)
     return IL, I0, Rs, Rsh, nNsVth
 
 
@@ -2123,6 +2337,15 @@ def calcparams_cec(effective_irradiance, temp_cell,
     singlediode
     retrieve_sam
 
+    Notes
+    -----
+    Module parameters are usually floats. To evaluate M modules against the
+    same T values of ``effective_irradiance`` and ``temp_cell``, pass
+    arrays of shape (M, 1) for the module parameters that differ between
+    modules, e.g. the columns of :py:func:`retrieve_sam` output as
+    ``modules.loc['a_ref'].values[:, np.newaxis]``. All outputs then have
+    shape (M, T) and can be passed to :py:func:`singlediode`. Weather inputs
+    that are pandas Series are used by position.
     '''
 
     # pass adjusted temperature coefficient to desoto
@@ -2240,8 +2463,22 @@ def calcparams_pvsyst(effective_irradiance, temp_cell,
     calcparams_desoto
     singlediode
 
+    Notes
+    -----
+    Module parameters are usually floats. To evaluate M modules against the
+    same T values of ``effective_irradiance`` and ``temp_cell``, pass
+    arrays of shape (M, 1) for the module parameters that differ between
+    modules, e.g. the columns of :py:func:`retrieve_sam` output as
+    ``modules.loc['a_ref'].values[:, np.newaxis]``. All outputs then have
+    shape (M, T) and can be passed to :py:func:`singlediode`. Weather inputs
+    that are pandas Series are used by position.
     '''
 
+    effective_irradiance, temp_cell, modules = _module_dimension(
+        effective_irradiance, temp_cell, alpha_sc, gamma_ref, mu_gamma,
+        I_L_ref, I_o_ref, R_sh_ref, R_sh_0, R_s, cells_in_series, R_sh_exp,
+        EgRef)
+
     # Boltzmann constant in J/K
     k = 1.38064852e-23
 
@@ -2270,6 +2507,8 @@ def calcparams_pvsyst(effective_irradiance, temp_cell,
 
     Rs = R_s
 
+    if modules:
+        return _broadcast_modules(IL, I0, Rs, Rsh, nNsVth)
     return IL, I0, Rs, Rsh, nNsVth
 
 
@@ -2836,21 +3075,26 @@ def singlediode(photocurrent, saturation_current, resistance_series,
         # equation for the diode voltage V_d then backing out voltage
         args = (photocurrent, saturation_current, resistance_series,
                 resistance_shunt, nNsVth)  # collect args
-        v_oc = _singlediode.bishop88_v_from_i(
-            0.0, *args, method=method.lower()
-        )
-        i_mp, v_mp, p_mp = _singlediode.bishop88_mpp(
-            *args, method=method.lower()
-        )
-        i_sc = _singlediode.bishop88_i_from_v(
-            0.0, *args, method=method.lower()
-        )
-        i_x = _singlediode.bishop88_i_from_v(
-            v_oc / 2.0, *args, method=method.lower()
-        )
-        i_xx = _singlediode.bishop88_i_from_v(
-            (v_oc + v_mp) / 2.0, *args, method=method.lower()
-        )
+        if method.lower() == 'newton':
+            # solve for all key points in a single Newton iteration
+            i_sc, v_oc, i_mp, v_mp, p_mp, i_x, i_xx = \
+                _singlediode._bishop88_key_points(*args)
+        else:
+            v_oc = _singlediode.bishop88_v_from_i(
+                0.0, *args, method=method.lower()
+            )
+            i_mp, v_mp, p_mp = _singlediode.bishop88_mpp(
+                *args, method=method.lower()
+            )
+            i_sc = _singlediode.bishop88_i_from_v(
+                0.0, *args, method=method.lower()
+            )
+            i_x = _singlediode.bishop88_i_from_v(
+                v_oc / 2.0, *args, method=method.lower()
+            )
+            i_xx = _singlediode.bishop88_i_from_v(
+                (v_oc + v_mp) / 2.0, *args, method=method.lower()
+            )
 
         # calculate the IV curve if requested using bishop88
         if ivcurve_pnts:
@@ -2879,6 +3123,117 @@ def singlediode(photocurrent, saturation_current, resistance_series,
     return out
 
 
+def ivcurve_blocks(photocurrent, saturation_current, resistance_series,
+                   resistance_shunt, nNsVth, ivcurve_pnts, block_size=1440,
+                   spacing='linear', dtype=np.float64, method='lambertw'):
+    """
+    Generate IV curves of the single diode model in blocks of curves.
+
+    The inputs are broadcast together and flattened, then the IV curves are
+    calculated for ``block_size`` consecutive elements at a time, so that
+    memory use is bounded by ``block_size * ivcurve_pnts`` regardless of the
+    number of curves. Each block is yielded as soon as it is calculated, e.g.
+    to write the curves to disk.
+
+    Parameters
+    ----------
+    photocurrent : numeric
+        Light-generated current :math:`I_L` (photocurrent). [A]
+    saturation_current : numeric
+        Diode saturation current :math:`I_0`. [A]
+    resistance_series : numeric
+        Series resistance :math:`R_s`. [ohm]
+    resistance_shunt : numeric
+        Shunt resistance :math:`R_{sh}`. [ohm]
+    nNsVth : numeric
+        The product of the diode ideality factor :math:`n`, the number of
+        cells in series :math:`N_s` and the cell thermal voltage
+        :math:`V_{th}`. [V]
+    ivcurve_pnts : int
+        Number of points on each IV curve, at least 2.
+    block_size : int, default 1440
+        Maximum number of IV curves in each block.
+    spacing : str, default 'linear'
+        Placement of the points on each IV curve. ``'linear'`` evenly spaces
+        the voltages from 0 to ``v_oc``. ``'knee'`` places half of the
+        points at voltages from 0 to ``v_mp`` and the other half at currents
+        from ``i_mp`` to 0, both concentrated towards the maximum power
+        point, which resolves the knee of the curve with fewer points.
+    dtype : data-type, default numpy.float64
+        Data type of the returned curves, e.g. ``numpy.float32`` to halve
+        their size. The calculation is always done in float64.
+    method : str, default 'lambertw'
+        Passed to :py:func:`singlediode`, :py:func:`i_from_v` and
+        :py:func:`v_from_i`.
+
+    Yields
+    ------
+    block : slice
+        Positions of the curves of the block in the flattened inputs. For
+        Series inputs, ``index[block]`` are the labels of the curves.
+    out : OrderedDict
+        The key points returned by :py:func:`singlediode` for the curves of
+        the block, and the keys ``'i'`` and ``'v'`` with arrays of shape
+        ``(number of curves, ivcurve_pnts)`` and data type ``dtype``, in
+        order of increasing voltage.
+
+    Raises
+    ------
+    ValueError
+        If ``spacing`` is not ``'linear'`` or ``'knee'`` or
+        ``ivcurve_pnts`` is less than 2.
+
+    See also
+    --------
+    singlediode
+    """
+    if spacing not in ('linear', 'knee'):
+        raise ValueError("spacing must be either 'linear' or 'knee'")
+    if ivcurve_pnts < 2:
+        raise ValueError('ivcurve_pnts must be at least 2')
+    args = np.broadcast_arrays(*(
+        np.asarray(arg, dtype=np.float64)
+        for arg in (photocurrent, saturation_current, resistance_series,
+                    resistance_shunt, nNsVth)))
+    args = [arg.ravel() for arg in args]
+    size = args[0].size
+
+    if spacing == 'linear':
+        fractions = np.linspace(0, 1, ivcurve_pnts)
+    else:
+        # voltages up to v_mp, then currents down from i_mp to 0, the
+        # sine makes the points denser towards the maximum power point
+        n_v = (ivcurve_pnts + 1) // 2
+        v_fractions = np.sin(0.5 * np.pi * np.linspace(0, 1, n_v))
+        i_fractions = np.sin(0.5 * np.pi *
+                             np.linspace(1, 0, ivcurve_pnts - n_v + 1)[1:])
+
+    for start in range(0, size, block_size):
+        block = slice(start, min(start + block_size, size))
+        il, io, rs, rsh, nnsvth = (arg[block] for arg in args)
+        out = singlediode(il, io, rs, rsh, nnsvth, method=method)
+        # curves along the last axis
+        il, io, rs, rsh, nnsvth = (
+            arg[:, np.newaxis] for arg in (il, io, rs, rsh, nnsvth))
+        if spacing == 'linear':
+            v = out['v_oc'][:, np.newaxis] * fractions
+            i = i_from_v(rsh, rs, nnsvth, v, io, il, method=method)
+        else:
+            v_knee = out['v_mp'][:, np.newaxis] * v_fractions
+            i_knee = out['i_mp'][:, np.newaxis] * i_fractions
+            v = np.concatenate(
+                [v_knee,
+                 v_from_i(rsh, rs, nnsvth, i_knee, io, il, method=method)],
+                axis=1)
+            i = np.concatenate(
+                [i_from_v(rsh, rs, nnsvth, v_knee, io, il, method=method),
+                 i_knee],
+                axis=1)
+        out['i'] = i.astype(dtype, copy=False)
+        out['v'] = v.astype(dtype, copy=False)
+        yield block, out
+
+
 def max_power_point(photocurrent, saturation_current, resistance_series,
                     resistance_shunt, nNsVth, d2mutau=0, NsVbi=np.Inf,
                     method='brentq'):
@@ -3124,7 +3479,7 @@ def scale_voltage_current_power(data, voltage=1, current=1):
 
     Parameters
     ----------
-    data: DataFrame
+    data: DataFrame or dict
         May contain columns `'v_mp', 'v_oc', 'i_mp' ,'i_x', 'i_xx',
         'i_sc', 'p_mp'`.
     voltage: numeric, default 1
@@ -3134,16 +3489,20 @@ def scale_voltage_current_power(data, voltage=1, current=1):
 
     Returns
     -------
-    scaled_data: DataFrame
+    scaled_data: DataFrame or OrderedDict
         A scaled copy of the input data.
         `'p_mp'` is scaled by `voltage * current`.
     """
 
-    # as written, only works with a DataFrame
-    # could make it work with a dict, but it would be more verbose
     voltage_keys = ['v_mp', 'v_oc']
     current_keys = ['i_mp', 'i_x', 'i_xx', 'i_sc']
     power_keys = ['p_mp']
+    if not isinstance(data, pd.DataFrame):
+        factors = dict.fromkeys(voltage_keys, voltage)
+        factors.update(dict.fromkeys(current_keys, current))
+        factors.update(dict.fromkeys(power_keys, voltage * current))
+        return OrderedDict((key, value * factors[key]) if key in factors
+                           else (key, value) for key, value in data.items())
     voltage_df = data.filter(voltage_keys, axis=1) * voltage
     current_df = data.filter(current_keys, axis=1) * current
     power_df = data.filter(power_keys, axis=1) * voltage * current
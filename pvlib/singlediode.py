@@ -2,12 +2,19 @@
 Low-level functions for solving the single diode equation.
 """
 
+from collections import OrderedDict
 from functools import partial
+import hashlib
+import multiprocessing
+import warnings
+
 import numpy as np
-from pvlib.tools import _golden_sect_DataFrame
+import pandas as pd
 
+from scipy.interpolate import RectBivariateSpline
 from scipy.optimize import brentq, newton
-from scipy.special import lambertw
+
+from pvlib import tools
 
 # set keyword arguments for all uses of newton in this module
 newton = partial(newton, tol=1e-6, maxiter=100, fprime2=None)
@@ -155,10 +162,15 @@ def bishop88(diode_voltage, photocurrent, saturation_current,
     """
     # calculate recombination loss current where d2mutau > 0
     is_recomb = d2mutau > 0  # True where there is thin-film recombination loss
-    v_recomb = np.where(is_recomb, NsVbi - diode_voltage, np.inf)
-    i_recomb = np.where(is_recomb, photocurrent * d2mutau / v_recomb, 0)
+    any_recomb = np.any(is_recomb)
+    if any_recomb:
+        v_recomb = np.where(is_recomb, NsVbi - diode_voltage, np.inf)
+        i_recomb = np.where(is_recomb, photocurrent * d2mutau / v_recomb, 0)
+    else:
+        i_recomb = 0.
     # calculate temporary values to simplify calculations
     v_star = diode_voltage / nNsVth  # non-dimensional diode voltage
+    expm1_v_star = np.expm1(v_star)
     g_sh = 1.0 / resistance_shunt  # conductance
     if breakdown_factor > 0:  # reverse bias is considered
         brk_term = 1 - diode_voltage / breakdown_voltage
@@ -166,15 +178,20 @@ def bishop88(diode_voltage, photocurrent, saturation_current,
         i_breakdown = breakdown_factor * diode_voltage * g_sh * brk_pwr
     else:
         i_breakdown = 0.
-    i = (photocurrent - saturation_current * np.expm1(v_star)  # noqa: W503
+    i = (photocurrent - saturation_current * expm1_v_star  # noqa: W503
          - diode_voltage * g_sh - i_recomb - i_breakdown)   # noqa: W503
     v = diode_voltage - i * resistance_series
     retval = (i, v, i*v)
     if gradients:
         # calculate recombination loss current gradients where d2mutau > 0
-        grad_i_recomb = np.where(is_recomb, i_recomb / v_recomb, 0)
-        grad_2i_recomb = np.where(is_recomb, 2 * grad_i_recomb / v_recomb, 0)
-        g_diode = saturation_current * np.exp(v_star) / nNsVth  # conductance
+        if any_recomb:
+            grad_i_recomb = np.where(is_recomb, i_recomb / v_recomb, 0)
+            grad_2i_recomb = np.where(is_recomb, 2 * grad_i_recomb / v_recomb,
+                                      0)
+        else:
+            grad_i_recomb = grad_2i_recomb = 0.
+        # conductance, reusing the exponential of the current
+        g_diode = saturation_current * (expm1_v_star + 1) / nNsVth
         if breakdown_factor > 0:  # reverse bias is considered
             brk_pwr_1 = np.power(brk_term, -breakdown_exp - 1)
             brk_pwr_2 = np.power(brk_term, -breakdown_exp - 2)
@@ -206,7 +223,8 @@ def bishop88_i_from_v(voltage, photocurrent, saturation_current,
                       resistance_series, resistance_shunt, nNsVth,
                       d2mutau=0, NsVbi=np.Inf, breakdown_factor=0.,
                       breakdown_voltage=-5.5, breakdown_exp=3.28,
-                      method='newton'):
+                      method='newton', how='numpy', warm_start=False,
+                      full_output=False):
     """
     Find current given any voltage.
 
@@ -247,12 +265,32 @@ def bishop88_i_from_v(voltage, photocurrent, saturation_current,
     method : str, default 'newton'
        Either ``'newton'`` or ``'brentq'``. ''method'' must be ``'newton'``
        if ``breakdown_factor`` is not 0.
+    how : str, default 'numpy'
+        Options are ``'numpy'`` or ``'numba'``. With ``method='brentq'``,
+        ``'numba'`` solves every element with a compiled, multithreaded
+        Newton's method safeguarded by bisection within the same bracket,
+        and falls back to ``'numpy'`` with a warning if numba is not
+        installed. Elements without a solution in the bracket are nan,
+        where ``'numpy'`` raises ``ValueError``. ``'numba'`` is not
+        implemented for ``method='newton'``.
+    warm_start : bool, default False
+        Only for ``method='newton'``. Solve every 16th element from the usual
+        initial guess first, then start each of the other elements from the
+        solution of the preceding solved element. This takes fewer
+        iterations when neighbouring elements have similar parameters, as in
+        a time series.
+    full_output : bool, default False
+        Only for ``method='newton'``. If True, also return a dict with the
+        number of Newton iterations of each element as ``'iterations'``.
 
     Returns
     -------
     current : numeric
         current (I) at the specified voltage (V). [A]
+    info : dict
+        iteration counts, only if ``full_output`` is True.
     """
+    _check_newton_options(method, warm_start, full_output)
     # collect args
     args = (photocurrent, saturation_current, resistance_series,
             resistance_shunt, nNsVth, d2mutau, NsVbi,
@@ -262,7 +300,11 @@ def bishop88_i_from_v(voltage, photocurrent, saturation_current,
         # calculate voltage residual given diode voltage "x"
         return bishop88(x, *a)[1] - v
 
-    if method.lower() == 'brentq':
+    if (method.lower() == 'brentq' and
+            tools._use_kernels(how, '_singlediode_kernels')):
+        voc_est = estimate_voc(photocurrent, saturation_current, nNsVth)
+        vd = _solve_kernel(_V_RESIDUAL, voltage, voc_est, args)
+    elif method.lower() == 'brentq':
         # first bound the search using voc
         voc_est = estimate_voc(photocurrent, saturation_current, nNsVth)
 
@@ -279,22 +321,34 @@ def bishop88_i_from_v(voltage, photocurrent, saturation_current,
         vd_from_brent_vectorized = np.vectorize(vd_from_brent)
         vd = vd_from_brent_vectorized(voc_est, voltage, *args)
     elif method.lower() == 'newton':
+        if tools._use_kernels(how, '_singlediode_kernels'):
+            raise NotImplementedError(
+                "how='numba' isn't implemented for method='newton'")
         # make sure all args are numpy arrays if max size > 1
         # if voltage is an array, then make a copy to use for initial guess, v0
         args, v0 = _prepare_newton_inputs((voltage,), args, voltage)
-        vd = newton(func=lambda x, *a: fv(x, voltage, *a), x0=v0,
-                    fprime=lambda x, *a: bishop88(x, *a, gradients=True)[4],
-                    args=args)
+        if warm_start or full_output:
+            vd, iterations = _bishop88_newton_solve(
+                _V_RESIDUAL, voltage, v0, args, warm_start)
+        else:
+            vd = newton(
+                func=lambda x, *a: fv(x, voltage, *a), x0=v0,
+                fprime=lambda x, *a: bishop88(x, *a, gradients=True)[4],
+                args=args)
     else:
         raise NotImplementedError("Method '%s' isn't implemented" % method)
-    return bishop88(vd, *args)[0]
+    current = bishop88(vd, *args)[0]
+    if full_output:
+        return current, {'iterations': iterations}
+    return current
 
 
 def bishop88_v_from_i(current, photocurrent, saturation_current,
                       resistance_series, resistance_shunt, nNsVth,
                       d2mutau=0, NsVbi=np.Inf, breakdown_factor=0.,
                       breakdown_voltage=-5.5, breakdown_exp=3.28,
-                      method='newton'):
+                      method='newton', how='numpy', warm_start=False,
+                      full_output=False):
     """
     Find voltage given any current.
 
@@ -335,12 +389,32 @@ def bishop88_v_from_i(current, photocurrent, saturation_current,
     method : str, default 'newton'
        Either ``'newton'`` or ``'brentq'``. ''method'' must be ``'newton'``
        if ``breakdown_factor`` is not 0.
+    how : str, default 'numpy'
+        Options are ``'numpy'`` or ``'numba'``. With ``method='brentq'``,
+        ``'numba'`` solves every element with a compiled, multithreaded
+        Newton's method safeguarded by bisection within the same bracket,
+        and falls back to ``'numpy'`` with a warning if numba is not
+        installed. Elements without a solution in the bracket are nan,
+        where ``'numpy'`` raises ``ValueError``. ``'numba'`` is not
+        implemented for ``method='newton'``.
+    warm_start : bool, default False
+        Only for ``method='newton'``. Solve every 16th element from the usual
+        initial guess first, then start each of the other elements from the
+        solution of the preceding solved element. This takes fewer
+        iterations when neighbouring elements have similar parameters, as in
+        a time series.
+    full_output : bool, default False
+        Only for ``method='newton'``. If True, also return a dict with the
+        number of Newton iterations of each element as ``'iterations'``.
 
     Returns
     -------
     voltage : numeric
         voltage (V) at the specified current (I) in volts [V]
+    info : dict
+        iteration counts, only if ``full_output`` is True.
     """
+    _check_newton_options(method, warm_start, full_output)
     # collect args
     args = (photocurrent, saturation_current, resistance_series,
             resistance_shunt, nNsVth, d2mutau, NsVbi, breakdown_factor,
@@ -352,7 +426,10 @@ def bishop88_v_from_i(current, photocurrent, saturation_current,
         # calculate current residual given diode voltage "x"
         return bishop88(x, *a)[0] - i
 
-    if method.lower() == 'brentq':
+    if (method.lower() == 'brentq' and
+            tools._use_kernels(how, '_singlediode_kernels')):
+        vd = _solve_kernel(_I_RESIDUAL, current, voc_est, args)
+    elif method.lower() == 'brentq':
         # brentq only works with scalar inputs, so we need a set up function
         # and np.vectorize to repeatedly call the optimizer with the right
         # arguments for possible array input
@@ -366,21 +443,33 @@ def bishop88_v_from_i(current, photocurrent, saturation_current,
         vd_from_brent_vectorized = np.vectorize(vd_from_brent)
         vd = vd_from_brent_vectorized(voc_est, current, *args)
     elif method.lower() == 'newton':
+        if tools._use_kernels(how, '_singlediode_kernels'):
+            raise NotImplementedError(
+                "how='numba' isn't implemented for method='newton'")
         # make sure all args are numpy arrays if max size > 1
         # if voc_est is an array, then make a copy to use for initial guess, v0
         args, v0 = _prepare_newton_inputs((current,), args, voc_est)
-        vd = newton(func=lambda x, *a: fi(x, current, *a), x0=v0,
-                    fprime=lambda x, *a: bishop88(x, *a, gradients=True)[3],
-                    args=args)
+        if warm_start or full_output:
+            vd, iterations = _bishop88_newton_solve(
+                _I_RESIDUAL, current, v0, args, warm_start)
+        else:
+            vd = newton(
+                func=lambda x, *a: fi(x, current, *a), x0=v0,
+                fprime=lambda x, *a: bishop88(x, *a, gradients=True)[3],
+                args=args)
     else:
         raise NotImplementedError("Method '%s' isn't implemented" % method)
-    return bishop88(vd, *args)[1]
+    voltage = bishop88(vd, *args)[1]
+    if full_output:
+        return voltage, {'iterations': iterations}
+    return voltage
 
 
 def bishop88_mpp(photocurrent, saturation_current, resistance_series,
                  resistance_shunt, nNsVth, d2mutau=0, NsVbi=np.Inf,
                  breakdown_factor=0., breakdown_voltage=-5.5,
-                 breakdown_exp=3.28, method='newton'):
+                 breakdown_exp=3.28, method='newton', how='numpy',
+                 warm_start=False, full_output=False):
     """
     Find max power point.
 
@@ -419,13 +508,33 @@ def bishop88_mpp(photocurrent, saturation_current, resistance_series,
     method : str, default 'newton'
        Either ``'newton'`` or ``'brentq'``. ''method'' must be ``'newton'``
        if ``breakdown_factor`` is not 0.
+    how : str, default 'numpy'
+        Options are ``'numpy'`` or ``'numba'``. With ``method='brentq'``,
+        ``'numba'`` solves every element with a compiled, multithreaded
+        Newton's method safeguarded by bisection within the same bracket,
+        and falls back to ``'numpy'`` with a warning if numba is not
+        installed. Elements without a solution in the bracket are nan,
+        where ``'numpy'`` raises ``ValueError``. ``'numba'`` is not
+        implemented for ``method='newton'``.
+    warm_start : bool, default False
+        Only for ``method='newton'``. Solve every 16th element from the usual
+        initial guess first, then start each of the other elements from the
+        solution of the preceding solved element. This takes fewer
+        iterations when neighbouring elements have similar parameters, as in
+        a time series.
+    full_output : bool, default False
+        Only for ``method='newton'``. If True, also return a dict with the
+        number of Newton iterations of each element as ``'iterations'``.
 
     Returns
     -------
     OrderedDict or pandas.DataFrame
         max power current ``i_mp`` [A], max power voltage ``v_mp`` [V], and
         max power ``p_mp`` [W]
+    info : dict
+        iteration counts, only if ``full_output`` is True.
     """
+    _check_newton_options(method, warm_start, full_output)
     # collect args
     args = (photocurrent, saturation_current, resistance_series,
             resistance_shunt, nNsVth, d2mutau, NsVbi, breakdown_factor,
@@ -436,7 +545,10 @@ def bishop88_mpp(photocurrent, saturation_current, resistance_series,
     def fmpp(x, *a):
         return bishop88(x, *a, gradients=True)[6]
 
-    if method.lower() == 'brentq':
+    if (method.lower() == 'brentq' and
+            tools._use_kernels(how, '_singlediode_kernels')):
+        vd = _solve_kernel(_MPP_RESIDUAL, 0., voc_est, args)
+    elif method.lower() == 'brentq':
         # break out arguments for numpy.vectorize to handle broadcasting
         vec_fun = np.vectorize(
             lambda voc, iph, isat, rs, rsh, gamma, d2mutau, NsVbi, vbr_a, vbr,
@@ -446,16 +558,640 @@ def bishop88_mpp(photocurrent, saturation_current, resistance_series,
         )
         vd = vec_fun(voc_est, *args)
     elif method.lower() == 'newton':
+        if tools._use_kernels(how, '_singlediode_kernels'):
+            raise NotImplementedError(
+                "how='numba' isn't implemented for method='newton'")
         # make sure all args are numpy arrays if max size > 1
         # if voc_est is an array, then make a copy to use for initial guess, v0
         args, v0 = _prepare_newton_inputs((), args, voc_est)
-        vd = newton(
-            func=fmpp, x0=v0,
-            fprime=lambda x, *a: bishop88(x, *a, gradients=True)[7], args=args
-        )
+        if warm_start or full_output:
+            vd, iterations = _bishop88_newton_solve(
+                _MPP_RESIDUAL, 0., v0, args, warm_start)
+        else:
+            vd = newton(
+                func=fmpp, x0=v0,
+                fprime=lambda x, *a: bishop88(x, *a, gradients=True)[7],
+                args=args
+            )
     else:
         raise NotImplementedError("Method '%s' isn't implemented" % method)
-    return bishop88(vd, *args)
+    mpp = bishop88(vd, *args)
+    if full_output:
+        return mpp, {'iterations': iterations}
+    return mpp
+
+
+class SingleDiodeTable:
+    """
+    Lookup table of the key points of the IV curve of a module over
+    effective irradiance and cell temperature.
+
+    The five single diode parameters are calculated by ``calcparams`` and
+    the key points are solved by :py:func:`pvlib.pvsystem.singlediode` once
+    for every node of a grid of irradiance and temperature. Each key point
+    is then interpolated by a bicubic spline in the logarithm of irradiance
+    and in temperature. The interpolation error is estimated by solving the
+    key points again at the centers of the grid cells.
+
+    Parameters
+    ----------
+    calcparams : callable
+        ``calcparams(effective_irradiance, temp_cell)`` returns the tuple
+        ``(photocurrent, saturation_current, resistance_series,
+        resistance_shunt, nNsVth)`` for 2-D arrays of irradiance and
+        temperature, e.g. ``functools.partial(pvsystem.calcparams_cec,
+        **parameters)``.
+    irradiance : array-like, optional
+        Strictly increasing, positive effective irradiance nodes, at least
+        four. Default is 60 nodes spaced logarithmically from 1 to 1500.
+        [W/m^2]
+    temperature : array-like, optional
+        Strictly increasing cell temperature nodes, at least four. Default is
+        every 5 C from -40 to 100 C. [C]
+    method : str, default 'lambertw'
+        Passed to :py:func:`pvlib.pvsystem.singlediode`.
+
+    Attributes
+    ----------
+    max_error : dict
+        Maximum absolute difference between the interpolated and the solved
+        key points at the centers of the grid cells, for each key point.
+        Same units as the key points.
+
+    Raises
+    ------
+    ValueError
+        If the nodes are not strictly increasing, irradiance is not positive,
+        or a key point is not finite at every node.
+
+    See also
+    --------
+    pvlib.pvsystem.singlediode
+    pvlib.modelchain.ModelChain.cec_table
+    """
+
+    KEY_POINTS = ('i_sc', 'v_oc', 'i_mp', 'v_mp', 'p_mp', 'i_x', 'i_xx')
+
+    def __init__(self, calcparams, irradiance=None, temperature=None,
+                 method='lambertw'):
+        if irradiance is None:
+            irradiance = np.logspace(0., np.log10(1500.), 60)
+        if temperature is None:
+            temperature = np.arange(-40., 101., 5.)
+        irradiance = np.asarray(irradiance, dtype=np.float64)
+        temperature = np.asarray(temperature, dtype=np.float64)
+        for name, nodes in (('irradiance', irradiance),
+                            ('temperature', temperature)):
+            if (nodes.ndim != 1 or nodes.size < 4 or
+                    not np.all(np.diff(nodes) > 0)):
+                raise ValueError(f'{name} must be a strictly increasing 1-D '
+                                 'array of at least four values')
+        if not irradiance[0] > 0:
+            raise ValueError('irradiance must be positive')
+        self.irradiance = irradiance
+        self.temperature = temperature
+        self.method = method
+
+        log_irradiance = np.log(irradiance)
+        nodes = self._solve(calcparams, irradiance, temperature)
+        self._splines = {}
+        for key in self.KEY_POINTS:
+            if not np.all(np.isfinite(nodes[key])):
+                raise ValueError(f'{key} is not finite at every node')
+            self._splines[key] = RectBivariateSpline(
+                log_irradiance, temperature, nodes[key], kx=3, ky=3)
+
+        # geometric means are the centers of the cells in log(irradiance)
+        irradiance_centers = np.sqrt(irradiance[1:] * irradiance[:-1])
+        temperature_centers = 0.5 * (temperature[1:] + temperature[:-1])
+        centers = self._solve(calcparams, irradiance_centers,
+                              temperature_centers)
+        self.max_error = {
+            key: np.max(np.abs(
+                self._splines[key](np.log(irradiance_centers),
+                                   temperature_centers) - centers[key]))
+            for key in self.KEY_POINTS
+        }
+
+    def _solve(self, calcparams, irradiance, temperature):
+        # import here, pvlib.pvsystem imports this module
+        from pvlib.pvsystem import singlediode
+        effective_irradiance, temp_cell = np.meshgrid(
+            irradiance, temperature, indexing='ij')
+        return singlediode(*calcparams(effective_irradiance, temp_cell),
+                           method=self.method)
+
+    def evaluate(self, effective_irradiance, temp_cell):
+        """
+        Interpolate the key points of the IV curve.
+
+        Parameters
+        ----------
+        effective_irradiance : numeric
+            The irradiance (W/m2) that is converted to photocurrent.
+        temp_cell : numeric
+            The average cell temperature of cells within a module in C.
+
+        Returns
+        -------
+        OrderedDict or DataFrame
+            The key points ``i_sc``, ``v_oc``, ``i_mp``, ``v_mp``, ``p_mp``,
+            ``i_x`` and ``i_xx`` as returned by
+            :py:func:`pvlib.pvsystem.singlediode`. A DataFrame is returned
+            if either input is a Series. Key points are nan where the inputs
+            are outside of the nodes of the table.
+        """
+        g, t = np.broadcast_arrays(
+            np.asarray(effective_irradiance, dtype=np.float64),
+            np.asarray(temp_cell, dtype=np.float64))
+        inside = ((g >= self.irradiance[0]) & (g <= self.irradiance[-1]) &
+                  (t >= self.temperature[0]) & (t <= self.temperature[-1]))
+        # evaluate outside points at a node, they are replaced by nan
+        log_g = np.log(np.where(inside, g, self.irradiance[0]))
+        t = np.where(inside, t, self.temperature[0])
+        out = OrderedDict()
+        for key in self.KEY_POINTS:
+            value = self._splines[key].ev(log_g, t)
+            out[key] = np.where(inside, value, np.nan)[()]
+
+        for x in (effective_irradiance, temp_cell):
+            if isinstance(x, pd.Series):
+                out = pd.DataFrame(out, index=x.index)
+                break
+        return out
+
+
+class SingleDiodeCache:
+    """
+    Bounded cache of the key points of the IV curve, keyed on quantized
+    effective irradiance and cell temperature and on a hash of the module
+    parameters.
+
+    Effective irradiance and cell temperature are rounded to multiples of
+    ``irradiance_resolution`` and ``temperature_resolution``, and the key
+    points are solved by :py:func:`pvlib.pvsystem.singlediode` at the
+    rounded values. Every request of the same module in the same bin
+    therefore gets the same result, whether it is cached or not.
+
+    The cache is direct-mapped: each key has one slot out of ``size``, and
+    a new entry replaces the entry in its slot. With ``shared=True`` the
+    cache is allocated in shared memory and can be used by worker processes
+    that inherit it, e.g. by fork or as an argument of
+    :py:class:`multiprocessing.Process` or the ``initializer`` of
+    :py:class:`multiprocessing.pool.Pool`.
+
+    Parameters
+    ----------
+    irradiance_resolution : float, default 1
+        Resolution of effective irradiance. [W/m^2]
+    temperature_resolution : float, default 0.1
+        Resolution of cell temperature. [C]
+    size : int, default 2**20
+        Number of entries. Each entry takes 80 bytes.
+    shared : bool or multiprocessing context, default False
+        Allocate the cache in shared memory for use by several processes.
+        Pass the context of the processes, e.g.
+        ``multiprocessing.get_context('spawn')``, if it isn't the default
+        context.
+    method : str, default 'lambertw'
+        Passed to :py:func:`pvlib.pvsystem.singlediode`.
+
+    Attributes
+    ----------
+    hits : int
+        Number of requested points that were not solved, either because
+        they were cached or because another point of the same request is in
+        the same bin.
+    misses : int
+        Number of points that were solved.
+    hit_rate : float
+        ``hits / (hits + misses)``, nan before the first request.
+    max_error : dict
+        Largest absolute difference between the key points at the rounded
+        and at the requested irradiance and temperature, for each key point.
+        The difference is calculated for the first request of every entry,
+        so it estimates the error induced by the rounding. Same units as the
+        key points.
+
+    See also
+    --------
+    pvlib.pvsystem.singlediode
+    pvlib.singlediode.SingleDiodeTable
+    """
+
+    KEY_POINTS = SingleDiodeTable.KEY_POINTS
+
+    def __init__(self, irradiance_resolution=1., temperature_resolution=0.1,
+                 size=2**20, shared=False, method='lambertw'):
+        if not (irradiance_resolution > 0 and temperature_resolution > 0):
+            raise ValueError('resolutions must be positive')
+        if size < 1:
+            raise ValueError('size must be at least 1')
+        self.irradiance_resolution = irradiance_resolution
+        self.temperature_resolution = temperature_resolution
+        self.size = int(size)
+        self.method = method
+        n = len(self.KEY_POINTS)
+        # keys are (module hash, irradiance bin, temperature bin), hashes
+        # are non-negative and -1 marks an empty slot. stats are hits and
+        # misses, followed by the max error of each key point
+        buffers = {'keys': (np.int64, (self.size, 3)),
+                   'values': (np.float64, (self.size, n)),
+                   'stats': (np.float64, (2 + n,))}
+        if shared:
+            context = multiprocessing if shared is True else shared
+            self._buffers = {
+                name: context.RawArray(
+                    'b', int(np.prod(shape)) * np.dtype(dtype).itemsize)
+                for name, (dtype, shape) in buffers.items()}
+            self._lock = context.Lock()
+        else:
+            self._buffers = {
+                name: bytearray(int(np.prod(shape)) *
+                                np.dtype(dtype).itemsize)
+                for name, (dtype, shape) in buffers.items()}
+            self._lock = None
+        self._views()
+        self.clear()
+
+    def _views(self):
+        self._keys = np.frombuffer(self._buffers['keys'],
+                                   dtype=np.int64).reshape(self.size, 3)
+        self._values = np.frombuffer(self._buffers['values'],
+                                     dtype=np.float64).reshape(self.size, -1)
+        self._stats = np.frombuffer(self._buffers['stats'], dtype=np.float64)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in ('_keys', '_values', '_stats'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._views()
+
+    def _locked(self):
+        if self._lock is None:
+            return _NoLock()
+        return self._lock
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._locked():
+            self._keys[:] = -1
+            self._values[:] = np.nan
+            self._stats[:] = 0.
+
+    @property
+    def hits(self):
+        return int(self._stats[0])
+
+    @property
+    def misses(self):
+        return int(self._stats[1])
+
+    @property
+    def hit_rate(self):
+        total = self._stats[0] + self._stats[1]
+        return self._stats[0] / total if total else np.nan
+
+    @property
+    def max_error(self):
+        return dict(zip(self.KEY_POINTS, self._stats[2:].tolist()))
+
+    @staticmethod
+    def module_hash(module):
+        """
+        Hash of module parameters that is the same in every process.
+
+        Parameters
+        ----------
+        module : dict-like or object
+            Module parameters, e.g. a dict or Series, or any other object
+            whose ``repr`` identifies the module.
+
+        Returns
+        -------
+        int
+            A non-negative 63-bit integer.
+        """
+        if hasattr(module, 'items'):
+            # numpy scalars, e.g. from a Series, are hashed as python scalars
+            module = sorted(
+                (str(k), repr(v.item() if isinstance(v, np.generic) else v))
+                for k, v in module.items())
+        digest = hashlib.sha1(repr(module).encode()).digest()
+        return int.from_bytes(digest[:8], 'little') >> 1
+
+    def evaluate(self, calcparams, module, effective_irradiance, temp_cell):
+        """
+        Key points of the IV curve from the cache, solving the missing ones.
+
+        Parameters
+        ----------
+        calcparams : callable
+            ``calcparams(effective_irradiance, temp_cell)`` returns the tuple
+            ``(photocurrent, saturation_current, resistance_series,
+            resistance_shunt, nNsVth)`` for 1-D arrays of irradiance and
+            temperature, e.g. ``functools.partial(pvsystem.calcparams_cec,
+            **parameters)``.
+        module : dict-like or object
+            Identifies the module and model of ``calcparams``, see
+            :py:meth:`module_hash`. Different ``calcparams`` must use
+            different ``module``.
+        effective_irradiance : numeric
+            The irradiance (W/m2) that is converted to photocurrent.
+        temp_cell : numeric
+            The average cell temperature of cells within a module in C.
+
+        Returns
+        -------
+        OrderedDict or DataFrame
+            The key points ``i_sc``, ``v_oc``, ``i_mp``, ``v_mp``, ``p_mp``,
+            ``i_x`` and ``i_xx`` as returned by
+            :py:func:`pvlib.pvsystem.singlediode`. A DataFrame is returned
+            if either input is a Series. Key points are nan where either
+            input is not finite.
+        """
+        g, t = np.broadcast_arrays(
+            np.asarray(effective_irradiance, dtype=np.float64),
+            np.asarray(temp_cell, dtype=np.float64))
+        shape = g.shape
+        g, t = g.ravel(), t.ravel()
+        values = np.full((g.size, len(self.KEY_POINTS)), np.nan)
+        finite = np.isfinite(g) & np.isfinite(t)
+        if finite.any():
+            values[finite] = self._lookup(calcparams, module, g[finite],
+                                          t[finite])
+        out = OrderedDict(
+            (key, values[:, k].reshape(shape)[()])
+            for k, key in enumerate(self.KEY_POINTS))
+
+        for x in (effective_irradiance, temp_cell):
+            if isinstance(x, pd.Series):
+                out = pd.DataFrame(out, index=x.index)
+                break
+        return out
+
+    def _lookup(self, calcparams, module, g, t):
+        g_bin = np.round(g / self.irradiance_resolution).astype(np.int64)
+        t_bin = np.round(t / self.temperature_resolution).astype(np.int64)
+        # unique bins of this request
+        order = np.lexsort((t_bin, g_bin))
+        new = np.ones(order.size, dtype=bool)
+        new[1:] = ((np.diff(g_bin[order]) != 0) |
+                   (np.diff(t_bin[order]) != 0))
+        first = order[new]
+        inverse = np.empty(order.size, dtype=np.intp)
+        inverse[order] = np.cumsum(new) - 1
+        keys = np.column_stack([
+            np.full(first.size, self.module_hash(module), dtype=np.int64),
+            g_bin[first], t_bin[first]])
+        slots = self._slots(keys)
+
+        with self._locked():
+            hit = np.all(self._keys[slots] == keys, axis=1)
+            values = self._values[slots]
+        miss = ~hit
+        if miss.any():
+            # solve at the rounded and at the requested values together
+            nmiss = np.count_nonzero(miss)
+            solved = self._solve(
+                calcparams,
+                np.concatenate([keys[miss, 1] * self.irradiance_resolution,
+                                g[first[miss]]]),
+                np.concatenate([keys[miss, 2] * self.temperature_resolution,
+                                t[first[miss]]]))
+            values[miss] = solved[:nmiss]
+            with np.errstate(invalid='ignore'):
+                error = np.abs(solved[:nmiss] - solved[nmiss:])
+            error = np.max(np.where(np.isnan(error), 0., error), axis=0)
+        with self._locked():
+            if miss.any():
+                self._keys[slots[miss]] = keys[miss]
+                self._values[slots[miss]] = values[miss]
+                self._stats[2:] = np.maximum(self._stats[2:], error)
+            nmiss = np.count_nonzero(miss)
+            self._stats[0] += g.size - nmiss
+            self._stats[1] += nmiss
+        return values[inverse]
+
+    def _slots(self, keys):
+        # multiplicative hashing in wrapping unsigned arithmetic
+        h = keys.view(np.uint64)
+        h = (h[:, 0] + np.uint64(0x9E3779B97F4A7C15) * h[:, 1] +
+             np.uint64(0xC2B2AE3D27D4EB4F) * h[:, 2])
+        h ^= h >> np.uint64(29)
+        return (h % np.uint64(self.size)).astype(np.intp)
+
+    def _solve(self, calcparams, effective_irradiance, temp_cell):
+        # import here, pvlib.pvsystem imports this module
+        from pvlib.pvsystem import singlediode
+        out = singlediode(*calcparams(effective_irradiance, temp_cell),
+                          method=self.method)
+        return np.column_stack([np.broadcast_to(out[key],
+                                                effective_irradiance.shape)
+                                for key in self.KEY_POINTS])
+
+
+class _NoLock:
+    """Context manager that does nothing, in place of a lock."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def _bishop88_key_points(photocurrent, saturation_current, resistance_series,
+                         resistance_shunt, nNsVth, d2mutau=0, NsVbi=np.Inf,
+                         breakdown_factor=0., breakdown_voltage=-5.5,
+                         breakdown_exp=3.28, tol=1e-6, maxiter=100):
+    """
+    Find the key points of the IV curve with a fused Newton iteration.
+
+    The diode voltages at open circuit, maximum power and short circuit are
+    found in one Newton iteration, followed by a second for the points at
+    ``v_oc / 2`` and ``(v_oc + v_mp) / 2``. Each iteration evaluates
+    :py:func:`bishop88` with gradients once for all points that have not
+    yet converged, instead of once for the function and once for the
+    derivative of every separate solution. Elements are processed in
+    blocks that are small enough to stay in the CPU cache.
+
+    Supports :py:func:`pvlib.pvsystem.singlediode` with ``method='newton'``
+    and gives the same results as :py:func:`bishop88_v_from_i`,
+    :py:func:`bishop88_mpp` and :py:func:`bishop88_i_from_v` within
+    ``tol``.
+
+    Returns
+    -------
+    tuple
+        ``(i_sc, v_oc, i_mp, v_mp, p_mp, i_x, i_xx)``
+    """
+    args = (photocurrent, saturation_current, resistance_series,
+            resistance_shunt, nNsVth, d2mutau, NsVbi)
+    # bishop88 requires scalar breakdown_factor
+    breakdown_args = (breakdown_factor, breakdown_voltage, breakdown_exp)
+    voc_est = estimate_voc(photocurrent, saturation_current, nNsVth)
+    shape = np.broadcast(voc_est, *args).shape
+    # flatten array arguments so that converged points can be dropped.
+    # scalars are kept as they are, which is faster in bishop88
+    args = [np.broadcast_to(arg, shape).ravel() if np.ndim(arg) else arg
+            for arg in args]
+    voc_est = np.broadcast_to(voc_est, shape).ravel()
+
+    out = np.empty((7, voc_est.size))
+    # iterate over blocks of elements that fit into the CPU cache
+    for start in range(0, voc_est.size, _KEY_POINTS_BLOCK_SIZE):
+        block = slice(start, start + _KEY_POINTS_BLOCK_SIZE)
+        out[:, block] = _bishop88_key_points_block(
+            voc_est[block],
+            [arg[block] if np.ndim(arg) else arg for arg in args],
+            breakdown_args, tol, maxiter)
+    return tuple(x.reshape(shape)[()] for x in out)
+
+
+_KEY_POINTS_BLOCK_SIZE = 4096
+
+
+def _bishop88_key_points_block(voc_est, args, breakdown_args, tol, maxiter):
+    zeros = np.zeros_like(voc_est, dtype=np.float64)
+
+    # open circuit, max power and short circuit, with the initial guesses
+    # of bishop88_v_from_i, bishop88_mpp and bishop88_i_from_v
+    vd, _ = _bishop88_newton(
+        np.stack([voc_est, voc_est, zeros]),
+        [_I_RESIDUAL, _MPP_RESIDUAL, _V_RESIDUAL], zeros, args,
+        breakdown_args, tol, maxiter)
+    i, v, p = bishop88(vd, *args, *breakdown_args)
+    v_oc = v[0]
+    i_mp, v_mp, p_mp = i[1], v[1], p[1]
+    i_sc = i[2]
+
+    v_x = np.stack([v_oc / 2.0, (v_oc + v_mp) / 2.0])
+    vd, _ = _bishop88_newton(v_x, [_V_RESIDUAL, _V_RESIDUAL], v_x, args,
+                             breakdown_args, tol, maxiter)
+    i_x, i_xx = bishop88(vd, *args, *breakdown_args)[0]
+    return i_sc, v_oc, i_mp, v_mp, p_mp, i_x, i_xx
+
+
+# residuals solved by _bishop88_newton: current, dP/dV and voltage
+_I_RESIDUAL, _MPP_RESIDUAL, _V_RESIDUAL = 0, 1, 2
+
+
+def _bishop88_newton(vd, residuals, target, args, breakdown_args, tol,
+                     maxiter):
+    """
+    Newton iteration for the diode voltage of several kinds of points.
+
+    Row ``k`` of ``vd`` is the initial guess for points where
+    ``residuals[k]`` is zero: the current equals ``target`` (``_I_RESIDUAL``),
+    dP/dV is zero (``_MPP_RESIDUAL``) or the voltage equals ``target``
+    (``_V_RESIDUAL``). Points are dropped from the iteration as soon as they
+    converge. Like :py:func:`scipy.optimize.newton`, zero derivatives and
+    nan steps stop the iteration of a point. Returns the diode voltages and
+    the number of iterations of each point.
+    """
+    nrows, n = vd.shape
+    vd = vd.astype(np.float64).ravel()
+    target = np.broadcast_to(target, (nrows, n)).ravel()
+    iterations = np.zeros(vd.size, dtype=int)
+    active = np.arange(vd.size)
+    for _ in range(maxiter):
+        iterations[active] += 1
+        x = vd[active]
+        if active.size == vd.size:
+            # nothing has converged yet, broadcast instead of gathering
+            out = bishop88(x.reshape(nrows, n), *args, *breakdown_args,
+                           gradients=True)
+            out = [np.broadcast_to(o, (nrows, n)).ravel() for o in out]
+        else:
+            col = active % n
+            a = [arg[col] if np.ndim(arg) else arg for arg in args]
+            out = bishop88(x, *a, *breakdown_args, gradients=True)
+        i, v, _, di_dvd, dv_dvd, _, dp_dv, d2p_dvdvd = out
+        # active is sorted, so the points of each row are contiguous
+        bounds = np.searchsorted(active, np.arange(nrows + 1) * n)
+        f = np.empty_like(x)
+        fprime = np.empty_like(x)
+        for residual, start, stop in zip(residuals, bounds, bounds[1:]):
+            rows = slice(start, stop)
+            if residual == _I_RESIDUAL:
+                f[rows] = i[rows] - target[active[rows]]
+                fprime[rows] = di_dvd[rows]
+            elif residual == _MPP_RESIDUAL:
+                f[rows] = dp_dv[rows]
+                fprime[rows] = d2p_dvdvd[rows]
+            else:
+                f[rows] = v[rows] - target[active[rows]]
+                fprime[rows] = dv_dvd[rows]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = np.where(fprime == 0, 0., f / fprime)
+        vd[active] = x - step
+        active = active[np.abs(step) >= tol]
+        if not active.size:
+            break
+    else:
+        warnings.warn('some failed to converge after %d iterations'
+                      % maxiter, RuntimeWarning)
+    return vd.reshape(nrows, n), iterations.reshape(nrows, n)
+
+
+def _bishop88_newton_solve(residual, target, v0, args, warm_start,
+                           tol=1e-6, maxiter=100):
+    """
+    Diode voltage where ``residual`` equals ``target``, from the initial
+    guess ``v0``, by :py:func:`_bishop88_newton`. Returns the diode voltage
+    and the number of iterations of each element, with the broadcast shape
+    of the inputs.
+
+    With ``warm_start``, every ``_WARM_START_STRIDE``-th element is solved
+    first, and the other elements start from the solution of the preceding
+    solved element where it is finite. Elements that do not converge from
+    the warm start are solved again from ``v0``.
+    """
+    # bishop88 requires scalar breakdown parameters
+    *args, breakdown_factor, breakdown_voltage, breakdown_exp = args
+    breakdown_args = (breakdown_factor, breakdown_voltage, breakdown_exp)
+    shape = np.broadcast(target, v0, *args).shape
+    target, v0 = (np.broadcast_to(x, shape).astype(np.float64).ravel()
+                  for x in (target, v0))
+    # scalars are kept as they are, which is faster in bishop88
+    args = [np.broadcast_to(arg, shape).ravel() if np.ndim(arg) else arg
+            for arg in args]
+
+    def solve(elements, v0):
+        vd, iterations = _bishop88_newton(
+            v0[elements][np.newaxis], [residual], target[elements],
+            [arg[elements] if np.ndim(arg) else arg for arg in args],
+            breakdown_args, tol, maxiter)
+        return vd[0], iterations[0]
+
+    vd = np.empty_like(v0)
+    iterations = np.empty(v0.size, dtype=int)
+    if warm_start:
+        first = slice(None, None, _WARM_START_STRIDE)
+        vd[first], iterations[first] = solve(first, v0)
+        rest = np.arange(v0.size) % _WARM_START_STRIDE != 0
+        warm = np.repeat(vd[first], _WARM_START_STRIDE)[:v0.size]
+        with warnings.catch_warnings():
+            # elements that fail from the warm start are solved again
+            warnings.simplefilter('ignore', RuntimeWarning)
+            vd[rest], iterations[rest] = solve(
+                rest, np.where(np.isfinite(warm), warm, v0))
+        retry = rest & ~(np.isfinite(vd) & (iterations < maxiter))
+        if retry.any():
+            vd[retry], cold_iterations = solve(retry, v0)
+            iterations[retry] += cold_iterations
+    else:
+        vd[:], iterations[:] = solve(slice(None), v0)
+    return vd.reshape(shape)[()], iterations.reshape(shape)[()]
+
+
+# elements solved from the usual initial guess with warm_start=True
+_WARM_START_STRIDE = 16
 
 
 def _get_size_and_shape(args):
@@ -495,6 +1231,72 @@ def _prepare_newton_inputs(i_or_v_tup, args, v0):
     return args, v0
 
 
+def _check_newton_options(method, warm_start, full_output):
+    if (warm_start or full_output) and method.lower() != 'newton':
+        raise NotImplementedError(
+            "warm_start and full_output are only implemented for "
+            "method='newton'")
+
+
+def _solve_kernel(residual, target, voc_est, args):
+    """
+    Diode voltage in [0, voc_est] where ``residual`` equals ``target``,
+    solved element-wise by ``pvlib._singlediode_kernels.solve``.
+    """
+    from pvlib import _singlediode_kernels
+
+    # breakdown parameters are scalars, as in bishop88
+    *args, breakdown_factor, breakdown_voltage, breakdown_exp = args
+    arrays = [np.asarray(a, dtype=np.float64)
+              for a in (target, voc_est, *args)]
+    shape = np.broadcast(*arrays).shape
+    arrays = [np.ascontiguousarray(np.broadcast_to(a, shape)).ravel()
+              for a in arrays]
+    vd = _singlediode_kernels.solve(
+        *arrays, float(breakdown_factor), float(breakdown_voltage),
+        float(breakdown_exp), residual)
+    return vd.reshape(shape)[()]
+
+
+def _lambertw_of_exp(z):
+    """
+    Principal branch of the Lambert W function of ``exp(z)``, also known as
+    the Wright omega function, for real ``z``.
+
+    Works on the logarithm of the argument, so that large arguments do not
+    overflow, and in real arithmetic, unlike
+    :py:func:`scipy.special.lambertw`. The initial guess is the
+    approximation of Winitzki [1]_ for ``z <= 10`` and the asymptotic
+    expansion for larger ``z``. Two iterations of the method of Fritsch et
+    al. [2]_ then give double precision.
+
+    References
+    ----------
+    .. [1] S. Winitzki, "Uniform approximations for transcendental
+       functions", Lecture Notes in Computer Science 2667 (2003) 780-789.
+    .. [2] F. N. Fritsch, R. E. Shafer, W. P. Crowley, "Algorithm 443:
+       Solution of the transcendental equation w e^w = x", Communications of
+       the ACM 16 (1973) 123-124.
+    """
+    z = np.asarray(z, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        w = np.log1p(np.exp(np.minimum(z, 10.)))
+        w *= 1. - np.log1p(w) / (2. + w)
+        large = z > 10.
+        if np.any(large):
+            z_large = z[large]
+            log_z = np.log(z_large)
+            w[large] = z_large - log_z + log_z / z_large
+        for _ in range(2):
+            # residual of w + log(w) = z
+            r = z - w - np.log(w)
+            u = r / (1. + w)
+            q = 2. * (1. + w + 2. / 3. * r)
+            w *= 1. + u * (q - u) / (q - 2. * u)
+    # W(0) = 0 and W(inf) = inf, where the iteration is nan
+    return np.where(np.isinf(z), np.maximum(z, 0.), w)
+
+
 def _lambertw_v_from_i(resistance_shunt, resistance_series, nNsVth, current,
                        saturation_current, photocurrent):
     # Record if inputs were all scalar
@@ -529,36 +1331,13 @@ def _lambertw_v_from_i(resistance_shunt, resistance_series, nNsVth, current,
 
     # Only compute using LambertW if there are cases with Gsh>0
     if np.any(idx_p):
-        # LambertW argument, cannot be float128, may overflow to np.inf
-        # overflow is explicitly handled below, so ignore warnings here
-        with np.errstate(over='ignore'):
-            argW = (I0[idx_p] / (Gsh[idx_p] * a[idx_p]) *
-                    np.exp((-I[idx_p] + IL[idx_p] + I0[idx_p]) /
-                           (Gsh[idx_p] * a[idx_p])))
-
-        # lambertw typically returns complex value with zero imaginary part
-        # may overflow to np.inf
-        lambertwterm = lambertw(argW).real
-
-        # Record indices where lambertw input overflowed output
-        idx_inf = np.logical_not(np.isfinite(lambertwterm))
-
-        # Only re-compute LambertW if it overflowed
-        if np.any(idx_inf):
-            # Calculate using log(argW) in case argW is really big
-            logargW = (np.log(I0[idx_p]) - np.log(Gsh[idx_p]) -
-                       np.log(a[idx_p]) +
-                       (-I[idx_p] + IL[idx_p] + I0[idx_p]) /
-                       (Gsh[idx_p] * a[idx_p]))[idx_inf]
-
-            # Three iterations of Newton-Raphson method to solve
-            #  w+log(w)=logargW. The initial guess is w=logargW. Where direct
-            #  evaluation (above) results in NaN from overflow, 3 iterations
-            #  of Newton's method gives approximately 8 digits of precision.
-            w = logargW
-            for _ in range(0, 3):
-                w = w * (1. - np.log(w) + logargW) / (1. + w)
-            lambertwterm[idx_inf] = w
+        # natural log of the LambertW argument, which itself may overflow
+        with np.errstate(divide='ignore'):
+            log_argW = (np.log(I0[idx_p]) - np.log(Gsh[idx_p]) -
+                        np.log(a[idx_p]) +
+                        (-I[idx_p] + IL[idx_p] + I0[idx_p]) /
+                        (Gsh[idx_p] * a[idx_p]))
+        lambertwterm = _lambertw_of_exp(log_argW)
 
         # Eqn. 3 in Jain and Kapoor, 2004
         #  V = -I*(Rs + Rsh) + IL*Rsh - a*lambertwterm + I0*Rsh
@@ -605,24 +1384,20 @@ def _lambertw_i_from_v(resistance_shunt, resistance_series, nNsVth, voltage,
                    Gsh[idx_z] * V[idx_z]
 
     # Only compute using LambertW if there are cases with Rs>0
-    # Does NOT handle possibility of overflow, github issue 298
     if np.any(idx_p):
-        # LambertW argument, cannot be float128, may overflow to np.inf
-        argW = Rs[idx_p] * I0[idx_p] / (
-                    a[idx_p] * (Rs[idx_p] * Gsh[idx_p] + 1.)) * \
-               np.exp((Rs[idx_p] * (IL[idx_p] + I0[idx_p]) + V[idx_p]) /
-                      (a[idx_p] * (Rs[idx_p] * Gsh[idx_p] + 1.)))
-
-        # lambertw typically returns complex value with zero imaginary part
-        # may overflow to np.inf
-        lambertwterm = lambertw(argW).real
+        # natural log of the LambertW argument, which itself may overflow
+        k = Rs[idx_p] * Gsh[idx_p] + 1.
+        with np.errstate(divide='ignore'):
+            log_argW = (np.log(Rs[idx_p] * I0[idx_p] / (a[idx_p] * k)) +
+                        (Rs[idx_p] * (IL[idx_p] + I0[idx_p]) + V[idx_p]) /
+                        (a[idx_p] * k))
+        lambertwterm = _lambertw_of_exp(log_argW)
 
         # Eqn. 2 in Jain and Kapoor, 2004
         #  I = -V/(Rs + Rsh) - (a/Rs)*lambertwterm + Rsh*(IL + I0)/(Rs + Rsh)
         # Recast in terms of Gsh=1/Rsh for better numerical stability.
-        I[idx_p] = (IL[idx_p] + I0[idx_p] - V[idx_p] * Gsh[idx_p]) / \
-                   (Rs[idx_p] * Gsh[idx_p] + 1.) - (
-                               a[idx_p] / Rs[idx_p]) * lambertwterm
+        I[idx_p] = (IL[idx_p] + I0[idx_p] - V[idx_p] * Gsh[idx_p]) / k - (
+            a[idx_p] / Rs[idx_p]) * lambertwterm
 
     if output_is_scalar:
         return I.item()
@@ -640,20 +1415,14 @@ def _lambertw(photocurrent, saturation_current, resistance_series,
     v_oc = _lambertw_v_from_i(resistance_shunt, resistance_series, nNsVth, 0.,
                               saturation_current, photocurrent)
 
-    params = {'r_sh': resistance_shunt,
-              'r_s': resistance_series,
-              'nNsVth': nNsVth,
-              'i_0': saturation_current,
-              'i_l': photocurrent}
-
-    # Find the voltage, v_mp, where the power is maximized.
-    # Start the golden section search at v_oc * 1.14
-    p_mp, v_mp = _golden_sect_DataFrame(params, 0., v_oc * 1.14,
-                                        _pwr_optfcn)
+    # Find the voltage, v_mp, where the power is maximized
+    v_mp = _lambertw_v_mp(resistance_shunt, resistance_series, nNsVth,
+                          v_oc, saturation_current, photocurrent)
 
     # Find Imp using Lambert W
     i_mp = _lambertw_i_from_v(resistance_shunt, resistance_series, nNsVth,
                               v_mp, saturation_current, photocurrent)
+    p_mp = i_mp * v_mp
 
     # Find Ix and Ixx using Lambert W
     i_x = _lambertw_i_from_v(resistance_shunt, resistance_series, nNsVth,
@@ -670,21 +1439,94 @@ def _lambertw(photocurrent, saturation_current, resistance_series,
         ivcurve_v = (np.asarray(v_oc)[..., np.newaxis] *
                      np.linspace(0, 1, ivcurve_pnts))
 
-        ivcurve_i = _lambertw_i_from_v(resistance_shunt, resistance_series,
-                                       nNsVth, ivcurve_v.T, saturation_current,
-                                       photocurrent).T
+        # the points are on the last axis, move them first to broadcast
+        # against the parameters
+        ivcurve_i = np.moveaxis(
+            _lambertw_i_from_v(resistance_shunt, resistance_series, nNsVth,
+                               np.moveaxis(ivcurve_v, -1, 0),
+                               saturation_current, photocurrent),
+            0, -1)
 
         out += (ivcurve_i, ivcurve_v)
 
     return out
 
 
-def _pwr_optfcn(df, loc):
-    '''
-    Function to find power from ``i_from_v``.
-    '''
+def _lambertw_v_mp(resistance_shunt, resistance_series, nNsVth, v_oc,
+                   saturation_current, photocurrent, tol=1e-8, maxiter=100):
+    """
+    Find the maximum power voltage from the Lambert W solution for current.
+
+    Solves dP/dV = I + V dI/dV = 0 with Newton's method, using the analytic
+    derivatives of the Lambert W solution. Power is concave in voltage, and
+    the iteration is safeguarded by bisection of the bracket [0, v_oc],
+    which is narrowed at every step. Elements are dropped from the
+    iteration as soon as their voltage changes by less than ``tol``.
+    """
+    conductance_shunt = 1. / resistance_shunt
+    shape = np.broadcast(conductance_shunt, resistance_series, nNsVth,
+                         v_oc, saturation_current, photocurrent).shape
+    Gsh, Rs, a, I0, IL, hi = [
+        np.broadcast_to(x, shape).astype(np.float64).ravel()
+        for x in (conductance_shunt, resistance_series, nNsVth,
+                  saturation_current, photocurrent, v_oc)]
+    lo = np.zeros_like(hi)
+    # v_mp is roughly 0.8 v_oc for most modules
+    V = 0.8 * hi
+    active = np.arange(V.size)
+    for _ in range(maxiter):
+        v = V[active]
+        i, di_dv, d2i_dv2 = _lambertw_i_from_v_gradients(
+            Gsh[active], Rs[active], a[active], v, I0[active], IL[active])
+        dp_dv = i + v * di_dv
+        d2p_dv2 = 2. * di_dv + v * d2i_dv2
+        # narrow the bracket around the maximum
+        rising = dp_dv > 0
+        lo[active] = np.where(rising, v, lo[active])
+        hi[active] = np.where(rising, hi[active], v)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            v_new = v - dp_dv / d2p_dv2
+        # bisect where the Newton step leaves the bracket
+        outside = ~((v_new > lo[active]) & (v_new < hi[active]))
+        v_new = np.where(outside, 0.5 * (lo[active] + hi[active]), v_new)
+        V[active] = v_new
+        # nan voltages are considered converged
+        active = active[np.abs(v_new - v) >= tol]
+        if not active.size:
+            break
+    return V.reshape(shape)[()]
+
+
+def _lambertw_i_from_v_gradients(Gsh, Rs, a, V, I0, IL):
+    """
+    Current and its first and second derivatives with respect to voltage,
+    from the Lambert W solution. Inputs must be 1-D arrays of equal length.
+    """
+    I = np.empty_like(V)                                    # noqa: E741, N806
+    dI = np.empty_like(V)
+    d2I = np.empty_like(V)
 
-    I = _lambertw_i_from_v(df['r_sh'], df['r_s'],           # noqa: E741, N806
-                           df['nNsVth'], df[loc], df['i_0'], df['i_l'])
+    # explicit solutions where Rs=0
+    idx_z = Rs == 0.
+    if np.any(idx_z):
+        Gsh_z, a_z, V_z, I0_z = Gsh[idx_z], a[idx_z], V[idx_z], I0[idx_z]
+        exp_term = np.exp(V_z / a_z)
+        I[idx_z] = IL[idx_z] - I0_z * (exp_term - 1.) - Gsh_z * V_z
+        dI[idx_z] = -I0_z * exp_term / a_z - Gsh_z
+        d2I[idx_z] = -I0_z * exp_term / a_z ** 2
 
-    return I * df[loc]
+    idx_p = ~idx_z
+    if np.any(idx_p):
+        Gsh_p, Rs_p, a_p, V_p = Gsh[idx_p], Rs[idx_p], a[idx_p], V[idx_p]
+        I0_p, IL_p = I0[idx_p], IL[idx_p]
+        k = Rs_p * Gsh_p + 1.
+        with np.errstate(divide='ignore'):
+            log_argW = (np.log(Rs_p * I0_p / (a_p * k)) +
+                        (Rs_p * (IL_p + I0_p) + V_p) / (a_p * k))
+        W = _lambertw_of_exp(log_argW)
+        # Eqn. 2 in Jain and Kapoor, 2004, and its derivatives using
+        # dW/dV = W / ((1 + W) a k)
+        I[idx_p] = (IL_p + I0_p - V_p * Gsh_p) / k - (a_p / Rs_p) * W
+        dI[idx_p] = -(Gsh_p + W / (Rs_p * (1. + W))) / k
+        d2I[idx_p] = -W / (Rs_p * a_p * k ** 2 * (1. + W) ** 3)
+    return I, dI, d2I
@@ -591,6 +591,12 @@ def fuentes(poa_global, temp_air, wind_speed, noct_installed, module_height=5,
     temperature_cell : pandas Series
         The modeled cell temperature [C]
 
+    Raises
+    ------
+    ValueError
+        If `poa_global` has fewer than two times, because the first time
+        step is inferred from the second.
+
     Notes
     -----
     This function returns slightly different values from PVWatts at night
@@ -608,6 +614,23 @@ def fuentes(poa_global, temp_air, wind_speed, noct_installed, module_height=5,
            National Renewable Energy Laboratory, Golden CO.
            doi:10.2172/1158421.
     """
+    return _fuentes(poa_global, temp_air, wind_speed, noct_installed,
+                    module_height, wind_height, emissivity, absorption,
+                    surface_tilt, module_width, module_length)[0]
+
+
+def _fuentes(poa_global, temp_air, wind_speed, noct_installed,
+             module_height=5, wind_height=9.144, emissivity=0.84,
+             absorption=0.83, surface_tilt=30, module_width=0.31579,
+             module_length=1.2, state=None):
+    """
+    :py:func:`fuentes`, continuing from the thermal ``state`` that the
+    previous call returned.
+
+    Returns the module temperature and the state ``(tmod, sun, time)`` at
+    the last time of `poa_global`. The state is None for the first call,
+    which assumes an initial module temperature of 20 C.
+    """
     # ported from the FORTRAN77 code provided in Appendix A of Fuentes 1987;
     # nearly all variable names are kept the same for ease of comparison.
 
@@ -658,7 +681,16 @@ def fuentes(poa_global, temp_air, wind_speed, noct_installed, module_height=5,
     # it's the same as the second timedelta:
     timedelta_seconds = poa_global.index.to_series().diff().dt.total_seconds()
     timedelta_hours = timedelta_seconds / 3600
-    timedelta_hours.iloc[0] = timedelta_hours.iloc[1]
+    if state is None:
+        if len(timedelta_hours) < 2:
+            raise ValueError('poa_global must have at least two times to '
+                             'infer the first time step')
+        timedelta_hours.iloc[0] = timedelta_hours.iloc[1]
+    else:
+        # continue from the last time of the previous call
+        tmod0, sun0, time0 = state
+        timedelta_hours.iloc[0] = (
+            poa_global.index[0] - time0).total_seconds() / 3600
 
     tamb_array = temp_air + 273.15
     sun_array = poa_global * absorp
@@ -671,7 +703,6 @@ def fuentes(poa_global, temp_air, wind_speed, noct_installed, module_height=5,
     # behave well if wind == 0?
     windmod_array = wind_speed * (module_height/wind_height)**0.2 + 1e-4
 
-    tmod0 = 293.15
     tmod_array = np.zeros_like(poa_global)
 
     iterator = zip(tamb_array, sun_array, windmod_array, tsky_array,
@@ -714,7 +745,8 @@ def fuentes(poa_global, temp_air, wind_speed, noct_installed, module_height=5,
         tmod0 = tmod
         sun0 = sun
 
-    return pd.Series(tmod_array - 273.15, index=poa_global.index, name='tmod')
+    tmod = pd.Series(tmod_array - 273.15, index=poa_global.index, name='tmod')
+    return tmod, (tmod0, sun0, poa_global.index[-1])
 
 
 def _adj_for_mounting_standoff(x):
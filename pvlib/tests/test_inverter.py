@@ -70,6 +70,17 @@ def test_sandia_float(cec_inverter_parameters):
     assert_allclose(pacs, -1. * cec_inverter_parameters['Pnt'], 5)
 
 
+def test_sandia_array_parameters(cec_inverter_parameters):
+    # parameters of shape (N, 1) with (N, T) inputs, e.g. one inverter per row
+    params = {k: np.array([[v], [v]]) if not isinstance(v, str) else v
+              for k, v in cec_inverter_parameters.items()}
+    vdcs = np.array([[0., 25., 50.], [25., 25., 25.]])
+    pdcs = np.array([[0., 137.5, 550.], [0., 137.5, 0.]])
+    pacs = inverter.sandia(vdcs, pdcs, params)
+    expected = [[-0.02, 132.004278, 250.], [-0.02, 132.004278, -0.02]]
+    assert_allclose(pacs, expected, rtol=1e-6)
+
+
 def test_sandia_Pnt_micro():
     """
     Test for issue #140, where some microinverters were giving a positive AC
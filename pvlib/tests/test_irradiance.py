@@ -1,5 +1,9 @@
 import datetime
 from collections import OrderedDict
+import os
+import subprocess
+import sys
+import tempfile
 import warnings
 
 import numpy as np
@@ -9,10 +13,11 @@ import pandas as pd
 import pytest
 from numpy.testing import assert_almost_equal, assert_allclose
 
-from pvlib import irradiance
+from pvlib import atmosphere, clearsky, irradiance, solarposition
 
 from .conftest import (
     assert_frame_equal,
+    assert_index_equal,
     assert_series_equal,
     requires_ephem,
     requires_numba
@@ -115,6 +120,21 @@ def test_get_extra_radiation_nrel_numba(times):
                     [1322.332316, 1322.296282, 1322.261205, 1322.227091])
 
 
+@pytest.mark.parametrize('method', ['asce', 'spencer'])
+def test_get_extra_radiation_doy_table(method):
+    # integer days of year are looked up, fractional days are calculated
+    doys = np.arange(1, 367)
+    out = irradiance.get_extra_radiation(doys, method=method)
+    expected = irradiance.get_extra_radiation(doys.astype(float),
+                                              method=method)
+    assert_allclose(out, expected, rtol=1e-15)
+    times = pd.date_range('2020-01-01', '2020-12-31 23:00', freq='H')
+    out = irradiance.get_extra_radiation(times, method=method)
+    expected = irradiance.get_extra_radiation(
+        times.dayofyear.values.astype(float), method=method)
+    assert_allclose(out.values, expected, rtol=1e-15)
+
+
 def test_get_extra_radiation_invalid():
     with pytest.raises(ValueError):
         irradiance.get_extra_radiation(300, method='invalid')
@@ -356,6 +376,89 @@ def test_get_sky_diffuse_missing_airmass(irrad_data, ephem_data, dni_et):
     assert_series_equal(out, expected, check_less_precise=2)
 
 
+@requires_numba
+@pytest.mark.parametrize('model', ['isotropic', 'klucher', 'haydavies',
+                                   'reindl', 'king', 'perez'])
+def test_get_sky_diffuse_numba(irrad_data, ephem_data, dni_et,
+                               relative_airmass, model):
+    dni = irrad_data['dni'].copy()
+    dni.iloc[2] = np.nan
+    args = (40, 180, ephem_data['apparent_zenith'], ephem_data['azimuth'],
+            dni, irrad_data['ghi'], irrad_data['dhi'])
+    kwargs = dict(dni_extra=dni_et, airmass=relative_airmass, model=model)
+    expected = irradiance.get_sky_diffuse(*args, **kwargs)
+    out = irradiance.get_sky_diffuse(*args, how='numba', **kwargs)
+    assert_series_equal(out, expected)
+    # arrays and scalars
+    kwargs['airmass'] = relative_airmass.values
+    out = irradiance.get_sky_diffuse(*[np.asarray(a) for a in args],
+                                     how='numba', **kwargs)
+    assert isinstance(out, np.ndarray)
+    assert_allclose(out, expected.values)
+    out = irradiance.get_sky_diffuse(
+        40, 180, 72.41687122, 287.04104128, 646.22886049, 257.20751138,
+        62.03376265, dni_extra=1321.1655834833093, airmass=3.27930443,
+        model=model, how='numba')
+    assert np.isscalar(out)
+    assert_allclose(out, expected.iloc[-1])
+
+
+@requires_numba
+def test_perez_components_numba(irrad_data, ephem_data, dni_et,
+                                relative_airmass):
+    dni = irrad_data['dni'].copy()
+    dni.iloc[2] = np.nan
+    args = (40, 180, irrad_data['dhi'], dni, dni_et,
+            ephem_data['apparent_zenith'], ephem_data['azimuth'],
+            relative_airmass)
+    expected = irradiance.perez(*args, return_components=True)
+    out = irradiance.perez(*args, return_components=True, how='numba')
+    assert_frame_equal(out, expected)
+    out = irradiance.perez(*[np.asarray(a) for a in args],
+                           return_components=True, how='numba')
+    assert list(out.keys()) == list(expected.columns)
+    for k, v in out.items():
+        assert_allclose(v, expected[k].values)
+
+
+@requires_numba
+def test_haydavies_projection_ratio_numba(irrad_data, dni_et):
+    ratio = np.array([0., 1.1, 1.3, 2.])
+    expected = irradiance.haydavies(40, 180, irrad_data['dhi'],
+                                    irrad_data['dni'], dni_et,
+                                    projection_ratio=ratio)
+    out = irradiance.haydavies(40, 180, irrad_data['dhi'], irrad_data['dni'],
+                               dni_et, projection_ratio=ratio, how='numba')
+    assert_series_equal(out, expected)
+
+
+@requires_numba
+def test_isotropic_numba_series_name():
+    dhi = pd.Series([100., 200.], name='dhi')
+    expected = irradiance.isotropic(30, dhi)
+    out = irradiance.isotropic(30, dhi, how='numba')
+    assert out.name == 'dhi'
+    assert_series_equal(out, expected)
+    out = irradiance.isotropic(pd.Series([30., 40.], name='tilt'), dhi,
+                               how='numba')
+    assert out.name is None
+
+
+@requires_numba
+def test_call_kernel_index_mismatch():
+    tilt = pd.Series([0., 90.], index=[0, 1])
+    dhi = pd.Series([100., 200.], index=[1, 0])
+    with pytest.raises(ValueError, match='same index'):
+        irradiance.isotropic(tilt, dhi, how='numba')
+
+
+def test_get_sky_diffuse_how_invalid():
+    with pytest.raises(ValueError, match="how must be either"):
+        irradiance.get_sky_diffuse(
+            30, 180, 0, 180, 1000, 1100, 100, dni_extra=1360, airmass=1,
+            model='isotropic', how='invalid')
+
+
 def test_campbell_norman():
     expected = pd.DataFrame(np.array(
         [[863.859736967, 653.123094076, 220.65905025]]),
@@ -479,6 +582,17 @@ def test_disc_value(pressure, expected):
     assert_allclose(out.values, expected_values, atol=1e-5)
 
 
+def test_disc_dni_extra():
+    times = pd.DatetimeIndex(['2014-06-24T1200', '2014-06-24T1800'],
+                             tz='America/Phoenix')
+    ghi = pd.Series([1038.62, 254.53], index=times)
+    zenith = pd.Series([10.567, 72.469], index=times)
+    expected = irradiance.disc(ghi, zenith, times)
+    dni_extra = irradiance.get_extra_radiation(times, 1370., 'spencer')
+    out = irradiance.disc(ghi, zenith, times, dni_extra=dni_extra)
+    assert_frame_equal(out, expected)
+
+
 def test_disc_overirradiance():
     columns = ['dni', 'kt', 'airmass']
     ghi = np.array([3000])
@@ -599,6 +713,17 @@ def test_dirint_no_delta_kt():
                         np.array([861.9,  670.4]), 1)
 
 
+def test_dirint_dni_extra():
+    times = pd.DatetimeIndex(['2014-06-24T12-0700', '2014-06-24T18-0700',
+                              '2014-06-24T19-0700'])
+    ghi = pd.Series([1038.62, 254.53, 100.], index=times)
+    solar_zenith = pd.Series([10.567, 72.469, 85.], index=times)
+    expected = irradiance.dirint(ghi, solar_zenith, times)
+    dni_extra = irradiance.get_extra_radiation(times, 1370., 'spencer')
+    out = irradiance.dirint(ghi, solar_zenith, times, dni_extra=dni_extra)
+    assert_series_equal(out, expected)
+
+
 def test_dirint_coeffs():
     coeffs = irradiance._get_dirint_coeffs()
     assert coeffs[0, 0, 0, 0] == 0.385230
@@ -637,6 +762,50 @@ def test_dirint_min_cos_zenith_max_zenith():
     assert_series_equal(out, expected, check_less_precise=True)
 
 
+@pytest.mark.parametrize('use_delta_kt_prime', [True, False])
+@pytest.mark.parametrize('bounds', [
+    [0, 288],
+    [0, 1, 1, 2, 50, 51, 52, 200, 288],  # empty and single row blocks
+    list(range(97)) + [288],  # row by row
+])
+def test_dirint_stream(chunked_weather, use_delta_kt_prime, bounds):
+    ghi = chunked_weather['ghi'].copy()
+    ghi.iloc[100] = np.nan
+    solpos = solarposition.get_solarposition(ghi.index, 32.2, -110.9, 700)
+    zenith = solpos['zenith']
+    temp_dew = pd.Series(10., index=ghi.index)
+    expected = irradiance.dirint(ghi, zenith, ghi.index, pressure=93000.,
+                                 use_delta_kt_prime=use_delta_kt_prime,
+                                 temp_dew=temp_dew)
+
+    stream = irradiance.DirintStream(use_delta_kt_prime=use_delta_kt_prime)
+    results = []
+    for a, b in zip(bounds, bounds[1:]):
+        out = stream.update(ghi.iloc[a:b], zenith.iloc[a:b],
+                            ghi.index[a:b], pressure=93000.,
+                            temp_dew=temp_dew.iloc[a:b])
+        assert out.index.isin(ghi.index[:b]).all()
+        results.append(out)
+    results.append(stream.flush())
+    out = pd.concat(results)
+    assert_series_equal(out, expected, check_freq=False, check_exact=True)
+
+
+def test_dirint_stream_times_order():
+    times = pd.date_range('2014-06-24T12-0700', periods=4, freq='1H')
+    ghi = pd.Series([900., 800., 850., 700.], index=times)
+    zenith = pd.Series([10., 20., 30., 40.], index=times)
+    stream = irradiance.DirintStream()
+    stream.update(ghi[2:], zenith[2:], times[2:])
+    with pytest.raises(ValueError, match='must follow'):
+        stream.update(ghi[:2], zenith[:2], times[:2])
+    # flush ends the series so that earlier times are allowed again
+    assert len(stream.flush()) == 1
+    assert len(stream.flush()) == 0
+    out = stream.update(ghi[:2], zenith[:2], times[:2])
+    assert_index_equal(out.index, times[:1])
+
+
 def test_gti_dirint():
     times = pd.DatetimeIndex(
         ['2014-06-24T06-0700', '2014-06-24T09-0700', '2014-06-24T12-0700'])
@@ -729,6 +898,17 @@ def test_erbs():
     assert_frame_equal(np.round(out, 0), np.round(expected, 0))
 
 
+def test_erbs_dni_extra():
+    index = pd.date_range('2016-01-01 12:00', freq='H', periods=3,
+                          tz='US/Arizona')
+    ghi = pd.Series([0, 50, 1000], index=index)
+    zenith = pd.Series([120, 85, 10], index=index)
+    expected = irradiance.erbs(ghi, zenith, index)
+    dni_extra = irradiance.get_extra_radiation(index)
+    out = irradiance.erbs(ghi, zenith, index, dni_extra=dni_extra)
+    assert_frame_equal(out, expected)
+
+
 def test_erbs_min_cos_zenith_max_zenith():
     # map out behavior under difficult conditions with various
     # limiting kwargs settings
@@ -912,6 +1092,81 @@ def airmass_kt():
     return np.array([1, 5, 12, 20])
 
 
+@pytest.fixture
+def float32_inputs():
+    # random geometry and irradiance covering the full range of sun
+    # positions, already rounded to float32 so that the float64 reference
+    # differs only in the precision of the computation
+    rng = np.random.default_rng(2022)
+    n = 1000
+    solar_zenith = rng.uniform(0, 89, n)
+    dni = rng.uniform(0, 1000, n)
+    dhi = rng.uniform(10, 300, n)
+    inputs = {
+        'surface_tilt': rng.uniform(0, 90, n),
+        'surface_azimuth': rng.uniform(0, 360, n),
+        'solar_zenith': solar_zenith,
+        'solar_azimuth': rng.uniform(0, 360, n),
+        'dni': dni,
+        'ghi': dhi + dni * np.cos(np.radians(solar_zenith)),
+        'dhi': dhi,
+        'dni_extra': rng.uniform(1320, 1410, n),
+        'airmass': atmosphere.get_relative_airmass(solar_zenith),
+    }
+    return {k: v.astype(np.float32) for k, v in inputs.items()}
+
+
+def _float64(inputs):
+    return {k: v.astype(np.float64) for k, v in inputs.items()}
+
+
+@pytest.mark.parametrize('func,atol', [
+    (irradiance.aoi_projection, 1e-6),
+    (irradiance.aoi, 5e-2),  # degrees, arccos is ill-conditioned near 0
+])
+def test_aoi_float32(float32_inputs, func, atol):
+    args = ['surface_tilt', 'surface_azimuth', 'solar_zenith',
+            'solar_azimuth']
+    out = func(*[float32_inputs[k] for k in args])
+    expected = func(*[_float64(float32_inputs)[k] for k in args])
+    assert out.dtype == np.float32
+    assert_allclose(out, expected, atol=atol)
+
+
+def test_beam_component_float32(float32_inputs):
+    args = ['surface_tilt', 'surface_azimuth', 'solar_zenith',
+            'solar_azimuth', 'dni']
+    out = irradiance.beam_component(*[float32_inputs[k] for k in args])
+    expected = irradiance.beam_component(
+        *[_float64(float32_inputs)[k] for k in args])
+    assert out.dtype == np.float32
+    assert_allclose(out, expected, rtol=1e-5, atol=1e-3)
+
+
+def test_perez_float32(float32_inputs):
+    args = ['surface_tilt', 'surface_azimuth', 'dhi', 'dni', 'dni_extra',
+            'solar_zenith', 'solar_azimuth', 'airmass']
+    out = irradiance.perez(*[float32_inputs[k] for k in args],
+                           return_components=True)
+    expected = irradiance.perez(*[_float64(float32_inputs)[k] for k in args],
+                                return_components=True)
+    for k, v in out.items():
+        assert v.dtype == np.float32
+        assert_allclose(v, expected[k], rtol=1e-5, atol=1e-3)
+
+
+@pytest.mark.parametrize('model', ['isotropic', 'klucher', 'haydavies',
+                                   'reindl', 'king', 'perez'])
+def test_get_total_irradiance_float32(float32_inputs, model):
+    inputs = dict(float32_inputs, albedo=np.float32(0.25))
+    out = irradiance.get_total_irradiance(**inputs, model=model)
+    expected = irradiance.get_total_irradiance(**_float64(inputs),
+                                               model=model)
+    for k, v in out.items():
+        assert v.dtype == np.float32
+        assert_allclose(v, expected[k], rtol=1e-5, atol=1e-3)
+
+
 def test_kt_kt_prime_factor(airmass_kt):
     out = irradiance._kt_kt_prime_factor(airmass_kt)
     expected = np.array([ 0.999971,  0.723088,  0.548811,  0.471068])
@@ -1046,3 +1301,80 @@ def test_clearness_index_zenith_independent(airmass_kt):
                                                         airmass)
     expected = pd.Series([np.nan, 0.553744437562], index=times)
     assert_series_equal(out, expected)
+
+
+@pytest.fixture
+def chunked_weather():
+    times = pd.date_range('2019-06-01', periods=3*24*4, freq='15min',
+                          tz='Etc/GMT+7')
+    solpos = solarposition.get_solarposition(times, 32.2, -110.9, 700)
+    cs = clearsky.simplified_solis(solpos['apparent_elevation'])
+    # add some variability so that dirint's stability index matters
+    factor = 0.6 + 0.4 * np.abs(np.sin(np.arange(len(times)) / 3.))
+    weather = pd.DataFrame({'ghi': cs['ghi'] * factor,
+                            'dni': cs['dni'] * factor,
+                            'dhi': cs['dhi']}, index=times)
+    return weather
+
+
+@pytest.mark.parametrize('decomposition', [None, 'dirint', 'disc', 'erbs'])
+def test_iter_total_irradiance(chunked_weather, decomposition):
+    kwargs = dict(latitude=32.2, longitude=-110.9, surface_tilt=30,
+                  surface_azimuth=180, altitude=700,
+                  decomposition=decomposition, model='perez')
+    expected = next(irradiance.iter_total_irradiance([chunked_weather],
+                                                     **kwargs))
+    # uneven chunks including an empty and a single row chunk
+    bounds = [0, 50, 50, 51, 150, len(chunked_weather)]
+    chunks = [chunked_weather.iloc[a:b] for a, b in zip(bounds, bounds[1:])]
+    results = list(irradiance.iter_total_irradiance(chunks, **kwargs))
+    assert len(results) == 4
+    for chunk, result in zip([c for c in chunks if len(c)], results):
+        assert_index_equal(result.index, chunk.index)
+    assert_frame_equal(pd.concat(results), expected)
+    if decomposition == 'dirint':
+        dni = irradiance.dirint(
+            chunked_weather['ghi'],
+            solarposition.get_solarposition(
+                chunked_weather.index, 32.2, -110.9, 700)['zenith'],
+            chunked_weather.index, pressure=atmosphere.alt2pres(700))
+        assert_series_equal(expected['dni'], dni, check_names=False)
+
+
+def test_iter_total_irradiance_processes(chunked_weather):
+    kwargs = dict(latitude=32.2, longitude=-110.9, surface_tilt=30,
+                  surface_azimuth=180, decomposition='dirint')
+    chunks = [chunked_weather.iloc[i:i+40]
+              for i in range(0, len(chunked_weather), 40)]
+    expected = pd.concat(irradiance.iter_total_irradiance(chunks, **kwargs))
+    out = pd.concat(irradiance.iter_total_irradiance(chunks, processes=2,
+                                                     **kwargs))
+    assert_frame_equal(out, expected)
+
+
+@requires_numba
+def test_iter_total_irradiance_processes_after_numba(chunked_weather):
+    # the pool must not fork the threads of the numba kernels; run in a
+    # subprocess so that a deadlock at interpreter exit is detected
+    code = (
+        "import pandas as pd\n"
+        "from pvlib import irradiance\n"
+        "irradiance.isotropic(30, pd.Series([1., 2.]), how='numba')\n"
+        "weather = pd.read_pickle({path!r})\n"
+        "chunks = [weather.iloc[:100], weather.iloc[100:]]\n"
+        "out = list(irradiance.iter_total_irradiance(\n"
+        "    chunks, 32.2, -110.9, 30, 180, processes=2))\n"
+        "assert len(out) == 2\n"
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'weather.pkl')
+        chunked_weather.to_pickle(path)
+        subprocess.run([sys.executable, '-c', code.format(path=path)],
+                       check=True, timeout=120)
+
+
+def test_iter_total_irradiance_invalid_decomposition(chunked_weather):
+    with pytest.raises(ValueError, match='invalid decomposition'):
+        next(irradiance.iter_total_irradiance(
+            [chunked_weather], 32.2, -110.9, 30, 180,
+            decomposition='invalid'))
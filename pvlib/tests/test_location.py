@@ -3,6 +3,7 @@ from unittest.mock import ANY
 
 import numpy as np
 from numpy import nan
+from numpy.testing import assert_allclose
 import pandas as pd
 from .conftest import assert_frame_equal, assert_index_equal
 
@@ -12,7 +13,7 @@ import pytz
 from pytz.exceptions import UnknownTimeZoneError
 
 import pvlib
-from pvlib.location import Location
+from pvlib.location import Location, SolarPositionCache
 from pvlib.solarposition import declination_spencer71
 from pvlib.solarposition import equation_of_time_spencer71
 from .conftest import requires_ephem
@@ -277,12 +278,66 @@ def test_get_airmass(times):
     assert_frame_equal(expected, airmass)
 
 
+def test_get_airmass_dict(times):
+    tus = Location(32.2, -111, 'US/Arizona', 700, 'Tucson')
+    solar_position = tus.get_solarposition(times)
+    expected = tus.get_airmass(solar_position=solar_position)
+    airmass = tus.get_airmass(solar_position={
+        key: solar_position[key].values for key in solar_position})
+    assert list(airmass) == ['airmass_relative', 'airmass_absolute']
+    for key, value in airmass.items():
+        assert_allclose(value, expected[key].values)
+
+
 def test_get_airmass_valueerror(times):
     tus = Location(32.2, -111, 'US/Arizona', 700, 'Tucson')
     with pytest.raises(ValueError):
         tus.get_airmass(times, model='invalid_model')
 
 
+def test_solar_position_cache(times):
+    tus = Location(32.2, -111, 'US/Arizona', 700, 'Tucson')
+    cache = SolarPositionCache(maxsize=2)
+    solar_position = cache.get_solarposition(tus, times)
+    assert_frame_equal(solar_position, tus.get_solarposition(times))
+    assert cache.get_solarposition(tus, times.copy()) is solar_position
+    assert (cache.hits, cache.misses) == (1, 1)
+    # another site, time zone, method or pressure is a different entry
+    other = Location(32.2, -111, 'US/Arizona', 0, 'Tucson')
+    assert cache.get_solarposition(other, times) is not solar_position
+    utc = cache.get_solarposition(tus, times.tz_convert('UTC'))
+    assert_index_equal(utc.index, times.tz_convert('UTC'))
+    assert cache.get_solarposition(tus, times, pressure=90000.) is not utc
+    assert cache.get_solarposition(tus, times, method='ephemeris') \
+        is not utc
+    assert (cache.hits, cache.misses) == (1, 5)
+    # the least recently used entries are removed
+    assert len(cache._entries) == 2
+    cache.get_solarposition(tus, times)
+    assert cache.misses == 6
+    cache.clear()
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_solar_position_cache_airmass(times):
+    tus = Location(32.2, -111, 'US/Arizona', 700, 'Tucson')
+    cache = SolarPositionCache()
+    solar_position = cache.get_solarposition(tus, times)
+    airmass = cache.get_airmass(tus, solar_position, model='young1994')
+    assert_frame_equal(airmass, tus.get_airmass(times, model='young1994'))
+    assert cache.get_airmass(tus, solar_position, model='young1994') \
+        is airmass
+    # other solar positions aren't cached
+    other = solar_position.copy()
+    assert_frame_equal(cache.get_airmass(tus, other), tus.get_airmass(times))
+    assert cache.get_airmass(tus, other) is not cache.get_airmass(tus, other)
+
+
+def test_solar_position_cache_invalid():
+    with pytest.raises(ValueError, match='maxsize'):
+        SolarPositionCache(maxsize=0)
+
+
 def test_Location___repr__():
     tus = Location(32.2, -111, 'US/Arizona', 700, 'Tucson')
 
@@ -0,0 +1,143 @@
+import numpy as np
+from numpy.testing import assert_allclose
+import pytest
+
+from pvlib import mismatch, pvsystem
+from pvlib.singlediode import bishop88
+
+
+CELL = dict(saturation_current=1e-10, resistance_series=0.005,
+            resistance_shunt=10., nNsVth=0.0286)
+
+
+def test_device_curves():
+    il = np.array([[9.], [3.]])
+    current, voltage = mismatch.device_curves(
+        il, **CELL, breakdown_factor=2e-3, breakdown_voltage=-15.,
+        breakdown_exp=3., ivcurve_pnts=40)
+    assert current.shape == voltage.shape == (2, 1, 40)
+    assert (np.diff(voltage, axis=-1) > 0).all()
+    assert (np.diff(current, axis=-1) < 0).all()
+    # from reverse bias to beyond open circuit
+    assert (voltage[..., 0] < 0.95 * -15. + 0.1).all()
+    assert (current[..., -1] < 0).all()
+    # all points are on the curve
+    vd = voltage + current * CELL['resistance_series']
+    i, v, _ = bishop88(vd, il[..., np.newaxis], **CELL, breakdown_factor=2e-3,
+                       breakdown_voltage=-15., breakdown_exp=3.)
+    assert_allclose(i, current)
+
+
+def test_device_curves_invalid():
+    with pytest.raises(ValueError, match='ivcurve_pnts must be at least 4'):
+        mismatch.device_curves(9., **CELL, ivcurve_pnts=3)
+
+
+def test_combine_series_identical():
+    current, voltage = mismatch.device_curves(9., **CELL, ivcurve_pnts=50)
+    n = 60
+    i, v = mismatch.combine_series(np.broadcast_to(current, (n, 50)),
+                                   np.broadcast_to(voltage, (n, 50)))
+    assert i.shape == v.shape == (50,)
+    assert_allclose(v, n * np.interp(i, current[::-1], voltage[::-1]))
+    # the maximum power point of the module
+    module = pvsystem.singlediode(9., CELL['saturation_current'],
+                                  n * CELL['resistance_series'],
+                                  n * CELL['resistance_shunt'],
+                                  n * CELL['nNsVth'])
+    # limited by the resolution of the curves
+    i_mp, v_mp, p_mp = mismatch.max_power_point(i, v)
+    assert_allclose(p_mp, module['p_mp'], rtol=5e-3)
+    assert_allclose(v_mp, module['v_mp'], rtol=1e-2)
+
+
+def _series(current, voltage, bypass_voltage=None):
+    # one curve at a time with numpy.interp
+    i = np.linspace(current.max(), current.min(), current.shape[-1])
+    v = [np.interp(i, c[::-1], u[::-1]) for c, u in zip(current, voltage)]
+    if bypass_voltage is not None:
+        v = [np.maximum(u, -bypass_voltage) for u in v]
+    return i, np.sum(v, axis=0)
+
+
+def test_combine_series_nan():
+    # a time step with nan photocurrent must not affect the others
+    il = np.full((7, 3), 9.)
+    il[:, 0] = np.linspace(2., 9., 7)
+    il[3] = np.nan
+    current, voltage = mismatch.device_curves(il, **CELL, ivcurve_pnts=40)
+    i, v = mismatch.combine_series(current, voltage)
+    assert np.isnan(v[3]).all()
+    for t in (0, 1, 2, 4, 5, 6):
+        expected_i, expected_v = _series(current[t], voltage[t])
+        assert_allclose(i[t], expected_i)
+        # numpy.interp doesn't extrapolate
+        inside = ((i[t] >= current[t].min(axis=-1).max()) &
+                  (i[t] <= current[t].max(axis=-1).min()))
+        assert_allclose(v[t][inside], expected_v[inside])
+
+
+def test_combine_series_bypass():
+    # three substrings of four cells, one cell shaded in the first
+    il = np.full((5, 3, 4), 9.)
+    il[:, 0, 1] = np.linspace(1., 9., 5)
+    current, voltage = mismatch.device_curves(
+        il, **CELL, breakdown_factor=2e-3, breakdown_voltage=-15.,
+        breakdown_exp=3., ivcurve_pnts=60)
+    sub_i, sub_v = mismatch.combine_series(current, voltage)
+    assert sub_i.shape == (5, 3, 60)
+    mod_i, mod_v = mismatch.combine_series(sub_i, sub_v, bypass_voltage=0.5)
+    assert mod_i.shape == (5, 60)
+    for t in range(5):
+        for i, v, k in zip(sub_i[t], sub_v[t], range(3)):
+            expected_i, expected_v = _series(current[t, k], voltage[t, k])
+            assert_allclose(i, expected_i)
+            # numpy.interp doesn't extrapolate
+            inside = ((i >= current[t, k].min(axis=-1).max()) &
+                      (i <= current[t, k].max(axis=-1).min()))
+            assert_allclose(v[inside], expected_v[inside])
+        expected_i, expected_v = _series(sub_i[t], sub_v[t],
+                                         bypass_voltage=0.5)
+        assert_allclose(mod_i[t], expected_i)
+        inside = ((mod_i[t] >= sub_i[t].min(axis=-1).max()) &
+                  (mod_i[t] <= sub_i[t].max(axis=-1).min()))
+        assert_allclose(mod_v[t][inside], expected_v[inside])
+    # the voltage of a bypassed substring
+    assert (mod_v >= -3 * 0.5 - 1e-12).all()
+    # the shaded module makes less power, down to the power of the other
+    # two substrings when the shaded substring is bypassed
+    p_mp = mismatch.max_power_point(mod_i, mod_v)[2]
+    assert (np.diff(p_mp) >= 0).all()
+    assert_allclose(p_mp[0], p_mp[1])
+    assert p_mp[0] < 0.7 * p_mp[-1]
+
+
+def test_combine_parallel():
+    il = np.array([9., 6.])
+    current, voltage = mismatch.device_curves(il, **CELL, ivcurve_pnts=80)
+    i, v = mismatch.combine_parallel(current, voltage, ivcurve_pnts=120)
+    assert i.shape == v.shape == (120,)
+    assert_allclose(v[[0, -1]], [voltage.min(), voltage.max()])
+    expected = sum(np.interp(v, u, c) for c, u in zip(current, voltage))
+    # numpy.interp doesn't extrapolate
+    inside = (v >= voltage[:, 0].max()) & (v <= voltage[:, -1].min())
+    assert_allclose(i[inside], expected[inside])
+    # current at zero voltage is the sum of the short circuit currents
+    i_sc = pvsystem.i_from_v(CELL['resistance_shunt'],
+                             CELL['resistance_series'], CELL['nNsVth'], 0.,
+                             CELL['saturation_current'], il)
+    assert_allclose(np.interp(0., v, i), i_sc.sum(), rtol=1e-3)
+
+
+def test_max_power_point():
+    photocurrent = np.array([2., 6., 9.])
+    out = pvsystem.singlediode(photocurrent, 1e-9, 0.3, 300., 1.6,
+                               ivcurve_pnts=30)
+    i_mp, v_mp, p_mp = mismatch.max_power_point(out['i'], out['v'])
+    assert i_mp.shape == (3,)
+    assert_allclose(p_mp, out['p_mp'], rtol=1e-2)
+    assert_allclose(v_mp, out['v_mp'], rtol=1e-2)
+    assert_allclose(p_mp, i_mp * v_mp)
+    scalar = mismatch.max_power_point(out['i'][0], out['v'][0])
+    assert np.ndim(scalar[2]) == 0
+    assert_allclose(scalar[2], p_mp[0])
@@ -3,17 +3,21 @@ import sys
 import numpy as np
 import pandas as pd
 
+import pvlib.irradiance
 from pvlib import iam, modelchain, pvsystem, temperature, inverter
-from pvlib.modelchain import ModelChain
+from pvlib.modelchain import (ModelChain, FleetModelChain,
+                              run_model_parallel)
 from pvlib.pvsystem import PVSystem
+from pvlib.singlediode import SingleDiodeCache
 from pvlib.tracking import SingleAxisTracker
-from pvlib.location import Location
+from pvlib.location import Location, SolarPositionCache
 from pvlib._deprecation import pvlibDeprecationWarning
 
 from .conftest import assert_series_equal, assert_frame_equal
+from numpy.testing import assert_allclose
 import pytest
 
-from .conftest import fail_on_pvlib_version
+from .conftest import fail_on_pvlib_version, requires_numba
 
 
 @pytest.fixture(scope='function')
@@ -349,6 +353,315 @@ def test_with_pvwatts(pvwatts_dc_pvwatts_ac_system, location, weather):
     mc.run_model(weather)
 
 
+def _as_tuple(x):
+    return x if isinstance(x, tuple) else (x,)
+
+
+@pytest.mark.parametrize('system, kwargs', [
+    ('sapm_dc_snl_ac_system', {}),
+    ('cec_dc_snl_ac_system', {'aoi_model': 'physical',
+                              'spectral_model': 'no_loss'}),
+    ('pvsyst_dc_snl_ac_system', {'aoi_model': 'physical',
+                                 'spectral_model': 'no_loss'}),
+    ('pvwatts_dc_pvwatts_ac_system', {'aoi_model': 'physical',
+                                      'spectral_model': 'no_loss',
+                                      'losses_model': 'pvwatts'}),
+    ('two_array_system', {}),
+])
+def test_results_format_numpy(request, system, kwargs, location):
+    if system == 'two_array_system':
+        system = request.getfixturevalue(
+            'multi_array_sapm_dc_snl_ac_system')['two_array_system']
+    else:
+        system = request.getfixturevalue(system)
+    times = pd.date_range('20160701 0000-0700', periods=24, freq='H')
+    weather = pd.DataFrame({'ghi': 900 * np.sin(np.linspace(0, np.pi, 24)),
+                            'dni': 800 * np.sin(np.linspace(0, np.pi, 24)),
+                            'dhi': 100., 'temp_air': 25.}, index=times)
+    expected = ModelChain(system, location, **kwargs).run_model(weather)
+    mc = ModelChain(system, location, results_format='numpy', **kwargs)
+    mc.run_model(weather)
+    assert isinstance(mc.results.ac, np.ndarray)
+    assert isinstance(_as_tuple(mc.results.total_irrad)[0], dict)
+    for name in ['solar_position', 'airmass', 'aoi', 'total_irrad',
+                 'effective_irradiance', 'cell_temperature', 'dc', 'ac']:
+        actual = mc.results.to_pandas(name)
+        assert type(actual) is type(getattr(expected.results, name))
+        for a, e in zip(_as_tuple(actual),
+                        _as_tuple(getattr(expected.results, name))):
+            if isinstance(e, pd.DataFrame):
+                assert_frame_equal(a, e[list(a.columns)])
+            else:
+                assert_series_equal(a, e, check_names=False)
+
+
+def test_results_format_numpy_tracker(sapm_dc_snl_ac_system, location,
+                                      weather):
+    with pytest.warns(pvlibDeprecationWarning):
+        system = SingleAxisTracker(
+            module_parameters=sapm_dc_snl_ac_system.arrays[0].module_parameters,  # noqa: E501
+            temperature_model_parameters=(
+                sapm_dc_snl_ac_system.arrays[0].temperature_model_parameters
+            ),
+            inverter_parameters=sapm_dc_snl_ac_system.inverter_parameters)
+    expected = ModelChain(system, location).run_model(weather)
+    mc = ModelChain(system, location, results_format='numpy')
+    mc.run_model(weather)
+    assert_frame_equal(mc.results.to_pandas('tracking'),
+                       expected.results.tracking, check_like=True)
+    assert_series_equal(mc.results.to_pandas('ac'), expected.results.ac)
+
+
+def test_results_format_pandas(sapm_dc_snl_ac_system, location, weather):
+    mc = ModelChain(sapm_dc_snl_ac_system, location).run_model(weather)
+    assert mc.results.to_pandas('ac') is mc.results.ac
+    with pytest.raises(ValueError, match='results_format'):
+        ModelChain(sapm_dc_snl_ac_system, location, results_format='xarray')
+
+
+@pytest.mark.parametrize('results_format', ['pandas', 'numpy'])
+def test_run_model_outputs(sapm_dc_snl_ac_system, location, weather,
+                           results_format):
+    expected = ModelChain(sapm_dc_snl_ac_system, location).run_model(weather)
+    mc = ModelChain(sapm_dc_snl_ac_system, location,
+                    results_format=results_format)
+    mc.run_model(weather)
+    mc.run_model(weather, outputs='ac')
+    assert_series_equal(mc.results.to_pandas('ac'), expected.results.ac)
+    pd.testing.assert_index_equal(mc.results.times, expected.results.times)
+    for name in ['weather', 'solar_position', 'airmass', 'aoi',
+                 'total_irrad', 'aoi_modifier', 'spectral_modifier',
+                 'effective_irradiance', 'cell_temperature', 'dc', 'losses']:
+        assert getattr(mc.results, name) is None
+
+    mc.run_model(weather, outputs=['total_irrad', 'cell_temperature'])
+    assert_frame_equal(mc.results.to_pandas('total_irrad'),
+                       expected.results.total_irrad)
+    assert_series_equal(mc.results.to_pandas('cell_temperature'),
+                        expected.results.cell_temperature)
+    assert mc.results.effective_irradiance is None
+    assert mc.results.ac is None
+
+
+def test_run_model_outputs_stages(sapm_dc_snl_ac_system, location, weather,
+                                  mocker):
+    # results are released as soon as no remaining stage reads them
+    def temperature_model(mc):
+        assert mc.results.aoi is None
+        assert list(mc.results.total_irrad.columns) == ['poa_global']
+        mc.results.cell_temperature = mc.results.weather['temp_air']
+
+    def ac_model(mc):
+        assert mc.results.effective_irradiance is None
+        assert mc.results.total_irrad is None
+        mc.results.ac = mc.results.dc['p_mp']
+
+    mc = ModelChain(sapm_dc_snl_ac_system, location,
+                    temperature_model=temperature_model, ac_model=ac_model)
+    mc.run_model(weather, outputs='ac')
+    assert mc.results.ac is not None
+    assert mc.results.total_irrad is None
+    # stages after the last requested output are not run
+    mc = ModelChain(sapm_dc_snl_ac_system, location)
+    spy = mocker.spy(mc.system, 'sapm')
+    mc.run_model(weather, outputs=['effective_irradiance'])
+    assert spy.call_count == 0
+    assert mc.results.effective_irradiance is not None
+    assert mc.results.cell_temperature is None
+
+
+def test_run_model_outputs_from_poa(sapm_dc_snl_ac_system, location,
+                                    total_irrad):
+    expected = ModelChain(sapm_dc_snl_ac_system, location,
+                          aoi_model='no_loss', spectral_model='no_loss')
+    expected.run_model_from_poa(total_irrad)
+    mc = ModelChain(sapm_dc_snl_ac_system, location, aoi_model='no_loss',
+                    spectral_model='no_loss')
+    mc.run_model_from_poa(total_irrad, outputs=['dc'])
+    assert_frame_equal(mc.results.dc, expected.results.dc)
+    assert mc.results.ac is None
+    data = total_irrad.assign(effective_irradiance=total_irrad['poa_global'])
+    expected.run_model_from_effective_irradiance(data)
+    mc.run_model_from_effective_irradiance(data, outputs=['ac'])
+    assert_series_equal(mc.results.ac, expected.results.ac)
+    assert mc.results.dc is None
+    assert mc.results.total_irrad is None
+
+
+def test_run_model_outputs_invalid(sapm_dc_snl_ac_system, location, weather):
+    mc = ModelChain(sapm_dc_snl_ac_system, location)
+    with pytest.raises(ValueError, match="outputs \\['pac'\\]"):
+        mc.run_model(weather, outputs=['ac', 'pac'])
+
+
+@pytest.fixture
+def day_weather(location):
+    times = pd.date_range('20160601 0000-0700', periods=96, freq='15T')
+    weather = location.get_clearsky(times, model='ineichen',
+                                    linke_turbidity=3.)
+    weather['temp_air'] = np.linspace(15., 30., 96)
+    weather['wind_speed'] = 2.
+    return weather
+
+
+@pytest.mark.parametrize('results_format', ['pandas', 'numpy'])
+def test_run_model_chunks(sapm_dc_snl_ac_system, location, day_weather,
+                          results_format):
+    expected = ModelChain(sapm_dc_snl_ac_system, location)
+    expected.run_model(day_weather)
+    mc = ModelChain(sapm_dc_snl_ac_system, location,
+                    results_format=results_format)
+    mc.run_model_chunks(day_weather, 25, outputs=['ac', 'dc', 'times'])
+    assert_series_equal(mc.results.to_pandas('ac'), expected.results.ac)
+    assert_frame_equal(mc.results.to_pandas('dc'), expected.results.dc)
+    pd.testing.assert_index_equal(mc.results.times, expected.results.times)
+    assert mc.results.weather is None
+
+
+def test_run_model_chunks_fuentes(pvwatts_dc_pvwatts_ac_fuentes_temp_system,
+                                  location, day_weather):
+    # the thermal history is carried between chunks
+    mc = ModelChain(pvwatts_dc_pvwatts_ac_fuentes_temp_system, location,
+                    aoi_model='physical', spectral_model='no_loss',
+                    temperature_model='fuentes')
+    expected = mc.run_model(day_weather).results.cell_temperature
+    chunks = [day_weather.iloc[:40], day_weather.iloc[40:41],
+              day_weather.iloc[41:]]
+    values = []
+    # a list holds chunks, not the weather of each Array
+    mc.run_model_chunks(chunks, outputs='cell_temperature',
+                        sink=lambda name, value: values.append(value))
+    assert len(values) == 3
+    assert_series_equal(pd.concat(values), expected)
+    assert mc._fuentes_state is None
+    mc.run_model_chunks(iter(chunks), outputs='cell_temperature')
+    assert_series_equal(mc.results.cell_temperature, expected)
+    # the first time step is inferred from the second
+    with pytest.raises(ValueError, match='first chunk must have at least'):
+        mc.run_model_chunks([day_weather.iloc[:1], day_weather.iloc[1:]],
+                            outputs='cell_temperature')
+    assert mc._fuentes_state is None
+
+
+def test_run_model_chunks_arrays(sapm_dc_snl_ac_system_Array, location,
+                                 day_weather):
+    expected = ModelChain(sapm_dc_snl_ac_system_Array, location)
+    expected.run_model(day_weather)
+    mc = ModelChain(sapm_dc_snl_ac_system_Array, location)
+    mc.run_model_chunks((day_weather, day_weather), 50,
+                        outputs=['ac', 'cell_temperature'])
+    assert_series_equal(mc.results.ac, expected.results.ac)
+    for tcell, expected_tcell in zip(mc.results.cell_temperature,
+                                     expected.results.cell_temperature):
+        assert_series_equal(tcell, expected_tcell)
+
+
+def test_run_model_cache_stages(sapm_dc_snl_ac_system, location,
+                                day_weather, mocker):
+    mc = ModelChain(sapm_dc_snl_ac_system, location, cache_stages=True)
+    mc.run_model(day_weather.iloc[:60])
+    # rolling update: 8 new timestamps, and new weather for the last 10
+    weather = day_weather.iloc[8:68].copy()
+    weather.iloc[-10:, 0] *= 0.9
+    expected = ModelChain(sapm_dc_snl_ac_system, location).run_model(weather)
+    solar_position = mocker.spy(location, 'get_solarposition')
+    sapm = mocker.spy(sapm_dc_snl_ac_system, 'sapm')
+    mc.run_model(weather)
+    assert len(solar_position.call_args[0][0]) == 8
+    assert len(sapm.call_args[0][0]) == 10
+    for name in ['solar_position', 'airmass', 'aoi', 'total_irrad',
+                 'effective_irradiance', 'cell_temperature', 'dc', 'weather']:
+        assert_frame_equal(pd.DataFrame(getattr(mc.results, name)),
+                           pd.DataFrame(getattr(expected.results, name)))
+    assert_series_equal(mc.results.ac, expected.results.ac)
+    pd.testing.assert_index_equal(mc.results.times, expected.results.times)
+    # unchanged weather doesn't run any model
+    mc.run_model(weather)
+    assert sapm.call_count == 1
+    assert_series_equal(mc.results.ac, expected.results.ac)
+    # every timestamp is calculated again if the models change
+    mc.spectral_model = 'no_loss'
+    mc.run_model(weather)
+    assert sapm.call_count == 2
+    assert len(sapm.call_args[0][0]) == 60
+    assert solar_position.call_count == 1
+    expected.spectral_model = 'no_loss'
+    expected.run_model(weather)
+    assert_series_equal(mc.results.ac, expected.results.ac)
+
+
+def test_run_model_cache_stages_outputs(sapm_dc_snl_ac_system_Array,
+                                        location, day_weather):
+    mc = ModelChain(sapm_dc_snl_ac_system_Array, location, cache_stages=True)
+    expected = ModelChain(sapm_dc_snl_ac_system_Array, location)
+    mc.run_model(day_weather.iloc[:50], outputs=['ac', 'dc'])
+    weather = day_weather.iloc[10:70]
+    mc.run_model(weather, outputs=['ac', 'dc'])
+    expected.run_model(weather)
+    assert_series_equal(mc.results.ac, expected.results.ac)
+    for dc, expected_dc in zip(mc.results.dc, expected.results.dc):
+        assert_frame_equal(dc, expected_dc)
+    assert mc.results.weather is None
+
+
+def test_run_model_cache_stages_numpy(sapm_dc_snl_ac_system, location):
+    with pytest.raises(ValueError, match='cache_stages'):
+        ModelChain(sapm_dc_snl_ac_system, location, results_format='numpy',
+                   cache_stages=True)
+
+
+def test_stage_timings(sapm_dc_snl_ac_system, location, day_weather):
+    mc = ModelChain(sapm_dc_snl_ac_system, location)
+    mc.run_model(day_weather)
+    assert mc.results.stage_timings is None
+    mc = ModelChain(sapm_dc_snl_ac_system, location, stage_timings=True)
+    mc.run_model(day_weather)
+    timings = mc.results.stage_timings
+    assert list(timings.index) == [
+        'solar_position', 'airmass', 'aoi', 'transposition', 'aoi_model',
+        'spectral_model', 'effective_irradiance_model', 'temperature_model',
+        'dc_model', 'dc_ohmic_model', 'losses_model', 'ac_model']
+    assert list(timings.columns) == ['seconds', 'rows', 'nbytes']
+    assert (timings['seconds'] >= 0).all()
+    assert (timings['rows'] == 96).all()
+    assert timings.loc['ac_model', 'nbytes'] == 96 * 8
+    assert timings.loc['dc_model', 'nbytes'] == mc.results.dc.values.nbytes
+    # only the stages that are run are recorded
+    data = day_weather.iloc[:10].assign(effective_irradiance=500.)
+    mc.run_model_from_effective_irradiance(data, outputs='cell_temperature')
+    assert list(mc.results.stage_timings.index) == ['temperature_model']
+
+
+@pytest.mark.parametrize('results_format', ['pandas', 'numpy'])
+def test_solar_position_cache(sapm_dc_snl_ac_system,
+                              sapm_dc_snl_ac_system_Array, location,
+                              day_weather, mocker, results_format):
+    # two systems at one site calculate solar position once
+    expected = ModelChain(sapm_dc_snl_ac_system, location)
+    expected.run_model(day_weather)
+    cache = SolarPositionCache()
+    spy = mocker.spy(location, 'get_solarposition')
+    for system in [sapm_dc_snl_ac_system, sapm_dc_snl_ac_system_Array]:
+        mc = ModelChain(system, location, solar_position_cache=cache,
+                        results_format=results_format)
+        mc.run_model(day_weather)
+    assert spy.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert_frame_equal(mc.results.to_pandas('solar_position'),
+                       expected.results.solar_position)
+    assert_frame_equal(mc.results.to_pandas('airmass'),
+                       expected.results.airmass)
+
+
+def test_run_model_chunks_invalid(sapm_dc_snl_ac_system, location,
+                                  day_weather):
+    mc = ModelChain(sapm_dc_snl_ac_system, location)
+    with pytest.raises(ValueError, match='chunksize'):
+        mc.run_model_chunks(day_weather)
+    with pytest.raises(ValueError, match='outputs must be given'):
+        mc.run_model_chunks(day_weather, 10, outputs=None)
+
+
 def test_run_model_with_irradiance(sapm_dc_snl_ac_system, location):
     mc = ModelChain(sapm_dc_snl_ac_system, location)
     times = pd.date_range('20160101 1200-0700', periods=2, freq='6H')
@@ -497,6 +810,21 @@ def test_prepare_inputs_multi_weather(
     assert len(mc.results.total_irrad) == num_arrays
 
 
+@pytest.mark.parametrize('transposition_model', ['isotropic', 'perez'])
+def test_prepare_inputs_dni_extra_once(
+        sapm_dc_snl_ac_system_Array, location, transposition_model, mocker):
+    times = pd.date_range(start='20160101 1200-0700',
+                          end='20160101 1800-0700', freq='6H')
+    mc = ModelChain(sapm_dc_snl_ac_system_Array, location,
+                    transposition_model=transposition_model)
+    weather = pd.DataFrame({'ghi': 1, 'dhi': 1, 'dni': 1},
+                           index=times)
+    m = mocker.spy(pvlib.irradiance, 'get_extra_radiation')
+    mc.prepare_inputs(weather)
+    assert sapm_dc_snl_ac_system_Array.num_arrays == 2
+    m.assert_called_once()
+
+
 def test_prepare_inputs_no_irradiance(sapm_dc_snl_ac_system, location):
     mc = ModelChain(sapm_dc_snl_ac_system, location)
     weather = pd.DataFrame()
@@ -1305,6 +1633,103 @@ def test_singlediode_dc_arrays(location, dc_model,
         assert isinstance(dc, (pd.Series, pd.DataFrame))
 
 
+@pytest.mark.parametrize('dc_model', ['cec', 'desoto', 'pvsyst'])
+def test_singlediode_table_dc_model(location, dc_model, cec_dc_snl_ac_system,
+                                    pvsyst_dc_snl_ac_system,
+                                    cec_dc_snl_ac_arrays, weather):
+    systems = {'cec': cec_dc_snl_ac_system,
+               'pvsyst': pvsyst_dc_snl_ac_system,
+               'desoto': cec_dc_snl_ac_arrays}
+    temp_model = {'cec': 'sapm', 'desoto': 'sapm', 'pvsyst': 'pvsyst'}
+    temp_model_params = {'sapm': {'a': -3.40641, 'b': -0.0842075,
+                                  'deltaT': 3},
+                         'pvsyst': {'u_c': 29.0, 'u_v': 0}}
+    system = systems[dc_model]
+    for array in system.arrays:
+        array.temperature_model_parameters = \
+            temp_model_params[temp_model[dc_model]]
+    kwargs = dict(aoi_model='no_loss', spectral_model='no_loss',
+                  temperature_model=temp_model[dc_model])
+    mc = ModelChain(system, location, dc_model=dc_model, **kwargs)
+    mc.run_model(weather)
+    mc_table = ModelChain(system, location, dc_model=dc_model + '_table',
+                          **kwargs)
+    assert mc_table.dc_model == getattr(mc_table, dc_model + '_table')
+    mc_table.run_model(weather)
+    assert mc_table.results.diode_params is None
+    if system.num_arrays == 1:
+        expected, actual = (mc.results.dc,), (mc_table.results.dc,)
+    else:
+        expected, actual = mc.results.dc, mc_table.results.dc
+    for exp, act in zip(expected, actual):
+        assert_frame_equal(act, exp, check_exact=False, rtol=1e-4)
+    # the tables are reused
+    tables = mc_table._singlediode_tables
+    mc_table.run_model(weather)
+    assert mc_table._singlediode_tables is tables
+
+
+def test_singlediode_table_dc_model_outside(location, cec_dc_snl_ac_system):
+    # points outside of the table, e.g. cloud enhancement above 1500 W/m2,
+    # are solved rather than reported as 0 W
+    times = pd.date_range('20160601 1200-0700', periods=4, freq='1H')
+    data = pd.DataFrame({'effective_irradiance': [800., 1600., 2000., 0.5],
+                         'cell_temperature': [45., 60., 70., 20.]},
+                        index=times)
+    kwargs = dict(aoi_model='no_loss', spectral_model='no_loss')
+    mc = ModelChain(cec_dc_snl_ac_system, location, dc_model='cec',
+                    **kwargs)
+    mc.run_model_from_effective_irradiance(data)
+    mc_table = ModelChain(cec_dc_snl_ac_system, location,
+                          dc_model='cec_table', **kwargs)
+    mc_table.run_model_from_effective_irradiance(data)
+    assert (mc_table.results.dc['p_mp'] > 0).all()
+    assert_frame_equal(mc_table.results.dc, mc.results.dc,
+                       check_exact=False, rtol=1e-4)
+
+
+@pytest.mark.parametrize('dc_model', ['cec', 'pvsyst'])
+def test_singlediode_cache_dc_model(location, dc_model, cec_dc_snl_ac_arrays,
+                                    pvsyst_dc_snl_ac_system, weather):
+    system = {'cec': cec_dc_snl_ac_arrays,
+              'pvsyst': pvsyst_dc_snl_ac_system}[dc_model]
+    kwargs = dict(dc_model=dc_model, aoi_model='no_loss',
+                  spectral_model='no_loss')
+    if dc_model == 'pvsyst':
+        kwargs['temperature_model'] = 'sapm'
+        for array in system.arrays:
+            array.temperature_model_parameters = {
+                'a': -3.40641, 'b': -0.0842075, 'deltaT': 3}
+    mc = ModelChain(system, location, **kwargs)
+    mc.run_model(weather)
+    cache = SingleDiodeCache(irradiance_resolution=0.01,
+                             temperature_resolution=0.001)
+    mc_cache = ModelChain(system, location, singlediode_cache=cache,
+                          **kwargs)
+    mc_cache.run_model(weather)
+    assert mc_cache.singlediode_cache is cache
+    assert 0 < cache.misses <= system.num_arrays * len(weather)
+    if system.num_arrays == 1:
+        expected, actual = (mc.results.dc,), (mc_cache.results.dc,)
+    else:
+        expected, actual = mc.results.dc, mc_cache.results.dc
+    for exp, act in zip(expected, actual):
+        assert_frame_equal(act, exp, check_exact=False, rtol=1e-4)
+    # the diode parameters are still calculated
+    assert mc_cache.results.diode_params is not None
+    # a second run only hits
+    misses, hits = cache.misses, cache.hits
+    mc_cache.run_model(weather)
+    assert cache.misses == misses
+    assert cache.hits == hits + system.num_arrays * len(weather)
+
+
+def test_singlediode_table_dc_model_missing_params(location,
+                                                   cec_dc_snl_ac_system):
+    with pytest.raises(ValueError, match='pvsyst_table selected for the DC'):
+        ModelChain(cec_dc_snl_ac_system, location, dc_model='pvsyst_table')
+
+
 @pytest.mark.parametrize('dc_model', ['sapm', 'cec', 'cec_native'])
 def test_infer_spectral_model(location, sapm_dc_snl_ac_system,
                               cec_dc_snl_ac_system,
@@ -2040,3 +2465,220 @@ def test__irrad_for_celltemp():
     assert len(poa) == 2
     assert_series_equal(poa[0], effect_irrad)
     assert_series_equal(poa[1], effect_irrad)
+
+
+@pytest.fixture
+def fleet(cec_module_params, cec_inverter_parameters):
+    modules = pd.DataFrame({
+        'cec': cec_module_params,
+        'cec_small': dict(cec_module_params, I_L_ref=5., R_s=0.2),
+        'pvwatts': {'pdc0': 220., 'gamma_pdc': -0.003}})
+    inverters = pd.DataFrame({'snl': cec_inverter_parameters,
+                              'pvwatts': {'pdc0': 250.}})
+    systems = pd.DataFrame({
+        'latitude': [32.2, 40.], 'longitude': [-110.9, -105.],
+        'altitude': [700., 1600.], 'surface_tilt': [30., 20.],
+        'surface_azimuth': [180., 160.], 'module': ['cec', 'cec_small'],
+        'inverter': ['snl', 'snl'], 'modules_per_string': [1, 2],
+        'strings_per_inverter': [2, 1],
+        'a': -3.56, 'b': -0.075, 'deltaT': 3.}, index=['one', 'two'])
+    times = pd.date_range('20160101 0000', periods=24, freq='H', tz='UTC')
+    weather = {
+        'ghi': pd.DataFrame({'one': np.linspace(0, 900, 24),
+                             'two': np.linspace(900, 0, 24)}, index=times),
+        'dni': pd.DataFrame({'one': np.linspace(0, 800, 24),
+                             'two': np.linspace(800, 0, 24)}, index=times),
+        'dhi': pd.Series(100., index=times),
+        'temp_air': pd.Series(np.linspace(10, 30, 24), index=times)}
+    return systems, modules, inverters, weather
+
+
+@pytest.mark.parametrize('dc_model, ac_model', [
+    ('cec', 'sandia'), ('desoto', 'sandia'), ('pvwatts', 'pvwatts')])
+def test_fleet_modelchain(fleet, dc_model, ac_model):
+    systems, modules, inverters, weather = fleet
+    if dc_model == 'pvwatts':
+        systems = systems.assign(module='pvwatts', inverter='pvwatts')
+    mc_fleet = FleetModelChain(systems, modules, inverters,
+                               dc_model=dc_model, ac_model=ac_model)
+    mc_fleet.run_model(weather)
+    results = mc_fleet.results
+    pd.testing.assert_index_equal(results.ac.index, weather['ghi'].index)
+    pd.testing.assert_index_equal(results.ac.columns, systems.index)
+    for name, row in systems.iterrows():
+        system = PVSystem(
+            surface_tilt=row['surface_tilt'],
+            surface_azimuth=row['surface_azimuth'],
+            module_parameters=modules[row['module']].dropna().to_dict(),
+            inverter_parameters=inverters[row['inverter']].dropna().to_dict(),
+            temperature_model_parameters={
+                'a': row['a'], 'b': row['b'], 'deltaT': row['deltaT']},
+            modules_per_string=row['modules_per_string'],
+            strings_per_inverter=row['strings_per_inverter'])
+        location = Location(row['latitude'], row['longitude'],
+                            altitude=row['altitude'])
+        mc = ModelChain(system, location, dc_model=dc_model,
+                        ac_model=ac_model, aoi_model='physical',
+                        spectral_model='no_loss')
+        mc.run_model(pd.DataFrame({
+            key: value[name] if isinstance(value, pd.DataFrame) else value
+            for key, value in weather.items()}))
+        assert_series_equal(results.solar_position['apparent_zenith'][name],
+                            mc.results.solar_position['apparent_zenith'],
+                            check_names=False)
+        assert_series_equal(results.total_irrad['poa_global'][name],
+                            mc.results.total_irrad['poa_global'],
+                            check_names=False)
+        assert_series_equal(results.cell_temperature[name],
+                            mc.results.cell_temperature, check_names=False)
+        dc = mc.results.dc
+        if isinstance(dc, pd.DataFrame):
+            dc = dc['p_mp']
+        assert_series_equal(results.dc['p_mp'][name], dc,
+                            check_names=False)
+        assert_series_equal(results.ac[name], mc.results.ac,
+                            check_names=False)
+
+
+def test_fleet_modelchain_infer(fleet):
+    systems, modules, inverters, weather = fleet
+    mc_fleet = FleetModelChain(systems, modules, inverters)
+    assert (mc_fleet.dc_model, mc_fleet.ac_model) == ('cec', 'sandia')
+    assert 'systems: 2' in repr(mc_fleet)
+
+
+@pytest.mark.parametrize('change, kwargs, match', [
+    ({'drop': 'latitude'}, {}, 'missing required columns'),
+    ({'drop': 'deltaT'}, {}, 'required by the sapm temperature model'),
+    ({}, {'dc_model': 'pvwatts'}, 'required by the pvwatts model'),
+    ({}, {'dc_model': 'sapm'}, 'not a valid DC power model'),
+    ({}, {'ac_model': 'adr'}, 'not a valid AC power model'),
+    ({}, {'aoi_model': 'sapm'}, 'not a valid aoi loss model'),
+    ({}, {'temperature_model': 'fuentes'}, 'not a valid temperature model'),
+])
+def test_fleet_modelchain_invalid(fleet, change, kwargs, match):
+    systems, modules, inverters, weather = fleet
+    if 'drop' in change:
+        systems = systems.drop(columns=change['drop'])
+    with pytest.raises(ValueError, match=match):
+        FleetModelChain(systems, modules, inverters, **kwargs)
+
+
+def test_fleet_modelchain_missing_weather(fleet):
+    systems, modules, inverters, weather = fleet
+    del weather['dhi']
+    with pytest.raises(ValueError, match="missing \\['dhi'\\]"):
+        FleetModelChain(systems, modules, inverters).run_model(weather)
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_run_model_parallel(fleet, processes):
+    systems, modules, inverters, weather = fleet
+    mc_fleet = FleetModelChain(systems, modules, inverters)
+    mc_fleet.run_model(weather)
+    results = run_model_parallel(
+        systems, modules, inverters, weather,
+        outputs=('ac', 'dc', 'cell_temperature'), processes=processes,
+        aoi_model='physical', spectral_model='no_loss')
+    assert_frame_equal(results['ac'], mc_fleet.results.ac)
+    assert_frame_equal(results['cell_temperature'],
+                       mc_fleet.results.cell_temperature)
+    assert set(results['dc']) == set(mc_fleet.results.dc)
+    for key, value in results['dc'].items():
+        assert_frame_equal(value, mc_fleet.results.dc[key],
+                           check_names=False)
+
+
+def test_run_model_parallel_shared_weather(fleet):
+    systems, modules, inverters, weather = fleet
+    weather = pd.DataFrame({key: value.iloc[:, 0]
+                            if isinstance(value, pd.DataFrame) else value
+                            for key, value in weather.items()})
+    results = run_model_parallel(systems, modules, inverters, weather,
+                                 processes=2, chunksize=2,
+                                 aoi_model='no_loss',
+                                 spectral_model='no_loss')
+    assert list(results) == ['ac']
+    ac = results['ac']
+    pd.testing.assert_index_equal(ac.columns, systems.index)
+    assert ac.notnull().all().all()
+    assert (ac['one'] != ac['two']).any()
+
+
+def test_run_model_parallel_invalid(fleet):
+    systems, modules, inverters, weather = fleet
+    with pytest.raises(ValueError, match='missing required columns'):
+        run_model_parallel(systems.drop(columns='module'), modules,
+                           inverters, weather)
+    # configuration errors are raised by the first system
+    with pytest.raises(ValueError, match='could not infer AOI model'):
+        run_model_parallel(systems, modules, inverters, weather,
+                           spectral_model='no_loss')
+
+
+def _pvwatts_chain_inputs(mc, weather):
+    solar_position = mc.results.solar_position
+    return (solar_position['apparent_zenith'], solar_position['azimuth'],
+            weather['dni'], weather['ghi'], weather['dhi'],
+            pvlib.irradiance.get_extra_radiation(weather.index),
+            mc.results.airmass['airmass_relative'], weather['temp_air'],
+            weather['wind_speed'])
+
+
+@pytest.mark.parametrize('how', [
+    'numpy', pytest.param('numba', marks=requires_numba)])
+def test_pvwatts_chain(location, day_weather, how):
+    system = PVSystem(
+        surface_tilt=25, surface_azimuth=200, albedo=0.2,
+        module_parameters={'pdc0': 300, 'gamma_pdc': -0.0035},
+        inverter_parameters={'pdc0': 2800, 'eta_inv_nom': 0.95},
+        temperature_model_parameters=temperature.TEMPERATURE_MODEL_PARAMETERS[
+            'sapm']['open_rack_glass_polymer'],
+        modules_per_string=5, strings_per_inverter=2)
+    mc = ModelChain.with_pvwatts(system, location).run_model(day_weather)
+    dc, ac = modelchain.pvwatts_chain(
+        *_pvwatts_chain_inputs(mc, day_weather), 25, 200, 300, -0.0035,
+        2800, a=-3.56, b=-0.075, deltaT=3, albedo=0.2, modules_per_string=5,
+        strings_per_inverter=2, eta_inv_nom=0.95, how=how)
+    assert_series_equal(dc, mc.results.dc, check_names=False)
+    assert_series_equal(ac, mc.results.ac, check_names=False)
+    assert (ac > 0).any()
+
+
+@pytest.mark.parametrize('how', [
+    'numpy', pytest.param('numba', marks=requires_numba)])
+def test_pvwatts_chain_portfolio(location, day_weather, how):
+    mc = ModelChain.with_pvwatts(
+        PVSystem(module_parameters={'pdc0': 1, 'gamma_pdc': 0},
+                 inverter_parameters={'pdc0': 1},
+                 temperature_model_parameters={'a': 0, 'b': 0,
+                                               'deltaT': 0}),
+        location)
+    mc.prepare_inputs(day_weather)
+    inputs = [np.asarray(x) for x in _pvwatts_chain_inputs(mc, day_weather)]
+    # one system per row, weather shared by all systems
+    surface_tilt = np.array([[0.], [20.], [35.]])
+    surface_azimuth = np.array([[180.], [120.], [250.]])
+    pdc0 = np.array([[250.], [300.], [350.]])
+    kwargs = dict(a=-3.47, b=-0.0594, deltaT=3, losses=10.)
+    dc, ac = modelchain.pvwatts_chain(
+        *inputs, surface_tilt, surface_azimuth, pdc0, -0.004, pdc0,
+        how=how, **kwargs)
+    assert ac.shape == (3, len(day_weather))
+    assert (ac > 0).any(axis=1).all()
+    for row in range(3):
+        expected = modelchain.pvwatts_chain(
+            *inputs, surface_tilt[row, 0], surface_azimuth[row, 0],
+            pdc0[row, 0], -0.004, pdc0[row, 0], **kwargs)
+        assert_allclose(dc[row], expected[0], rtol=1e-10, atol=1e-9)
+        assert_allclose(ac[row], expected[1], rtol=1e-10, atol=1e-9)
+
+
+def test_pvwatts_chain_invalid(location, day_weather):
+    args = (0., 180., 800., 900., 100., 1367., 1., 25., 1., 30., 180., 300.,
+            -0.003, 300., -3.56, -0.075, 3)
+    with pytest.raises(ValueError, match='how must be'):
+        modelchain.pvwatts_chain(*args, how='fast')
+    series = day_weather['ghi']
+    with pytest.raises(ValueError, match='same index'):
+        modelchain.pvwatts_chain(series, series.iloc[1:], *args[2:])
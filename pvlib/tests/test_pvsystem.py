@@ -867,6 +867,39 @@ def test_calcparams_pvsyst(pvsyst_module_params):
         nNsVth.round(decimals=4), pd.Series([1.6186, 1.7961], index=times))
 
 
+@pytest.mark.parametrize('calcparams, params', [
+    (pvsystem.calcparams_desoto, 'cec'), (pvsystem.calcparams_cec, 'cec'),
+    (pvsystem.calcparams_pvsyst, 'pvsyst')])
+def test_calcparams_module_dimension(calcparams, params, cec_module_params,
+                                     pvsyst_module_params):
+    module_params = {'cec': cec_module_params,
+                     'pvsyst': pvsyst_module_params}[params]
+    names = calcparams.__code__.co_varnames[
+        2:calcparams.__code__.co_argcount]
+    kwargs = {k: v for k, v in module_params.items() if k in names}
+    times = pd.date_range(start='2015-01-01', periods=4, freq='6H')
+    effective_irradiance = pd.Series([0.0, 200., 800., 1000.], index=times)
+    temp_cell = pd.Series([20., 25., 40., 50.], index=times)
+    # three modules that differ in their series resistance and photocurrent
+    R_s = np.array([[0.2], [0.5], [1.0]])
+    I_L_ref = np.array([[5.], [6.], [7.]])
+    out = calcparams(effective_irradiance, temp_cell,
+                     **dict(kwargs, R_s=R_s, I_L_ref=I_L_ref))
+    for values in out:
+        assert isinstance(values, np.ndarray)
+        assert values.shape == (3, 4)
+    for m in range(3):
+        expected = calcparams(effective_irradiance, temp_cell,
+                              **dict(kwargs, R_s=R_s[m, 0],
+                                     I_L_ref=I_L_ref[m, 0]))
+        for values, exp in zip(out, expected):
+            assert_allclose(values[m], np.broadcast_to(exp, 4))
+    # the outputs are consumable by singlediode
+    result = pvsystem.singlediode(*out, ivcurve_pnts=5)
+    assert result['p_mp'].shape == (3, 4)
+    assert result['i'].shape == (3, 4, 5)
+
+
 def test_PVSystem_calcparams_desoto(cec_module_params, mocker):
     mocker.spy(pvsystem, 'calcparams_desoto')
     module_parameters = cec_module_params.copy()
@@ -1204,6 +1237,17 @@ def test_i_from_v(fixture_i_from_v, method, atol):
     assert_allclose(I, I_expected, atol=atol)
 
 
+def test_i_from_v_overflow():
+    # the LambertW argument overflows, GH 298
+    V = np.array([400., 1000.])
+    Rsh, Rs, nNsVth, I0, IL = 300., 0.3, 0.5, 1e-9, 7.
+    I = pvsystem.i_from_v(Rsh, Rs, nNsVth, V, I0, IL, method='lambertw')
+    assert np.isfinite(I).all()
+    Vd = V + I * Rs
+    assert_allclose(IL - I0 * np.expm1(Vd / nNsVth) - Vd / Rsh, I,
+                    rtol=1e-12)
+
+
 def test_PVSystem_i_from_v(mocker):
     system = pvsystem.PVSystem()
     m = mocker.patch('pvlib.pvsystem.i_from_v', autospec=True)
@@ -1314,9 +1358,9 @@ def test_singlediode_array():
                               method='lambertw')
 
     expected = np.array([
-        0.        ,  0.54538398,  1.43273966,  2.36328163,  3.29255606,
-        4.23101358,  5.16177031,  6.09368251,  7.02197553,  7.96846051,
-        8.88220557])
+        0.        ,  0.54614799,  1.43502646,  2.36213666,  3.29539683,
+        4.23038694,  5.16552766,  6.10002695,  7.03339961,  7.96530369,
+        8.89547162])
 
     assert_allclose(sd['i_mp'], expected, atol=0.01)
 
@@ -1332,13 +1376,13 @@ def test_singlediode_array():
 
 def test_singlediode_floats():
     out = pvsystem.singlediode(7, 6e-7, .1, 20, .5, method='lambertw')
-    expected = {'i_xx': 4.2498,
-                'i_mp': 6.1275,
+    expected = {'i_xx': 4.2641,
+                'i_mp': 6.1363,
                 'v_oc': 8.1063,
-                'p_mp': 38.1937,
+                'p_mp': 38.1942,
                 'i_x': 6.7558,
                 'i_sc': 6.9651,
-                'v_mp': 6.2331,
+                'v_mp': 6.2243,
                 'i': None,
                 'v': None}
     assert isinstance(out, dict)
@@ -1351,13 +1395,13 @@ def test_singlediode_floats():
 
 def test_singlediode_floats_ivcurve():
     out = pvsystem.singlediode(7, 6e-7, .1, 20, .5, ivcurve_pnts=3, method='lambertw')
-    expected = {'i_xx': 4.2498,
-                'i_mp': 6.1275,
+    expected = {'i_xx': 4.2641,
+                'i_mp': 6.1363,
                 'v_oc': 8.1063,
-                'p_mp': 38.1937,
+                'p_mp': 38.1942,
                 'i_x': 6.7558,
                 'i_sc': 6.9651,
-                'v_mp': 6.2331,
+                'v_mp': 6.2243,
                 'i': np.array([6.965172e+00, 6.755882e+00, 2.575717e-14]),
                 'v': np.array([0., 4.05315, 8.1063])}
     assert isinstance(out, dict)
@@ -1385,11 +1429,11 @@ def test_singlediode_series_ivcurve(cec_module_params):
 
     expected = OrderedDict([('i_sc', array([0., 3.01054475, 6.00675648])),
                             ('v_oc', array([0., 9.96886962, 10.29530483])),
-                            ('i_mp', array([0., 2.65191983, 5.28594672])),
-                            ('v_mp', array([0., 8.33392491, 8.4159707])),
-                            ('p_mp', array([0., 22.10090078, 44.48637274])),
+                            ('i_mp', array([0., 2.65628596, 5.29052564])),
+                            ('v_mp', array([0., 8.32109226, 8.4094138])),
+                            ('p_mp', array([0., 22.10320053, 44.49021934])),
                             ('i_x', array([0., 2.88414114, 5.74622046])),
-                            ('i_xx', array([0., 2.04340914, 3.90007956])),
+                            ('i_xx', array([0., 2.05269155, 3.90967385])),
                             ('v', array([[0., 0., 0.],
                                          [0., 4.98443481, 9.96886962],
                                          [0., 5.14765242, 10.29530483]])),
@@ -1417,6 +1461,57 @@ def test_singlediode_series_ivcurve(cec_module_params):
         assert_allclose(v, expected[k], atol=1e-2)
 
 
+@pytest.mark.parametrize('method', ['lambertw', 'newton'])
+def test_ivcurve_blocks(method):
+    il = np.linspace(0.5, 8., 25)
+    args = (il, 1e-9, 0.3, 300., 1.5)
+    blocks = list(pvsystem.ivcurve_blocks(*args, ivcurve_pnts=11,
+                                          block_size=10, method=method))
+    assert [block for block, _ in blocks] == [
+        slice(0, 10), slice(10, 20), slice(20, 25)]
+    expected = pvsystem.singlediode(*args, ivcurve_pnts=11)
+    for block, out in blocks:
+        assert out['i'].shape == out['v'].shape == (block.stop - block.start,
+                                                    11)
+        for k in ['i_sc', 'v_oc', 'i_mp', 'v_mp', 'p_mp', 'i_x', 'i_xx']:
+            assert_allclose(out[k], expected[k][block], atol=1e-6)
+        assert_allclose(out['v'], expected['v'][block], atol=1e-6)
+        assert_allclose(out['i'], expected['i'][block], atol=1e-6)
+
+
+def test_ivcurve_blocks_knee():
+    args = (pd.Series([2., 8.]), 1e-9, 0.3, 300., 1.5)
+    (block, out), = pvsystem.ivcurve_blocks(*args, ivcurve_pnts=10,
+                                            spacing='knee',
+                                            dtype=np.float32)
+    assert block == slice(0, 2)
+    assert out['i'].dtype == out['v'].dtype == np.float32
+    assert (np.diff(out['v'], axis=1) > 0).all()
+    assert_allclose(out['v'][:, [0, 4, -1]],
+                    np.stack([np.zeros(2), out['v_mp'], out['v_oc']], axis=1),
+                    rtol=1e-6)
+    assert_allclose(out['i'][:, [0, 4, -1]],
+                    np.stack([out['i_sc'], out['i_mp'], np.zeros(2)], axis=1),
+                    rtol=1e-6, atol=1e-6)
+    # all points are on the IV curve
+    current = pvsystem.i_from_v(300., 0.3, 1.5, out['v'].astype(np.float64),
+                                1e-9, args[0].values[:, np.newaxis])
+    assert_allclose(out['i'], current, rtol=1e-5, atol=1e-5)
+    # points get denser towards the maximum power point
+    dv = np.diff(out['v'][:, :5], axis=1)
+    assert (np.diff(dv, axis=1) < 0).all()
+
+
+@pytest.mark.parametrize('kwargs, match', [
+    ({'spacing': 'log'}, 'spacing must be'),
+    ({'ivcurve_pnts': 1}, 'ivcurve_pnts must be'),
+])
+def test_ivcurve_blocks_invalid(kwargs, match):
+    kwargs = {'ivcurve_pnts': 10, **kwargs}
+    with pytest.raises(ValueError, match=match):
+        next(pvsystem.ivcurve_blocks(1., 1e-9, 0.3, 300., 1.5, **kwargs))
+
+
 def test_scale_voltage_current_power():
     data = pd.DataFrame(
         np.array([[2, 1.5, 10, 8, 12, 0.5, 1.5]]),
@@ -1428,6 +1523,11 @@ def test_scale_voltage_current_power():
         index=[0])
     out = pvsystem.scale_voltage_current_power(data, voltage=2, current=3)
     assert_frame_equal(out, expected, check_less_precise=5)
+    out = pvsystem.scale_voltage_current_power(
+        {key: data[key].values for key in data}, voltage=2, current=3)
+    assert list(out) == list(expected.columns)
+    for key, value in out.items():
+        assert_allclose(value, expected[key].values)
 
 
 def test_PVSystem_scale_voltage_current_power(mocker):
@@ -1755,6 +1855,108 @@ def test_PVSystem_multi_array_get_irradiance():
     )
 
 
+@pytest.fixture
+def stacked_system_inputs():
+    location = Location(32.2, -110.9, altitude=700)
+    times = pd.date_range('2020-06-01', periods=48, freq='30T',
+                          tz='Etc/GMT+7')
+    weather = location.get_clearsky(times, model='ineichen',
+                                    linke_turbidity=3)
+    weather['temp_air'] = 25.
+    weather['wind_speed'] = 1.5
+    solar_position = location.get_solarposition(times)
+    return solar_position, weather
+
+
+def _stacked_system(mount=None, num_arrays=4):
+    params = temperature.TEMPERATURE_MODEL_PARAMETERS['sapm'][
+        'open_rack_glass_glass']
+    arrays = [
+        pvsystem.Array(
+            mount or FixedMount(10 + 7 * i, 90 + 40 * i),
+            albedo=0.2 + i / 50,
+            module_parameters={'pdc0': 250 + i, 'gamma_pdc': -0.004,
+                               'b': 0.05},
+            temperature_model_parameters=dict(params, u_c=29, u_v=0,
+                                              u0=25, u1=6.8))
+        for i in range(num_arrays)
+    ]
+    return pvsystem.PVSystem(arrays=arrays)
+
+
+def _assert_each_equal(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        if isinstance(e, pd.DataFrame):
+            assert_frame_equal(a, e)
+        else:
+            assert_series_equal(a, e)
+
+
+@pytest.mark.parametrize('mount', [
+    None, pvsystem.SingleAxisTrackerMount()])
+@pytest.mark.parametrize('model', [
+    'isotropic', 'klucher', 'haydavies', 'reindl', 'king', 'perez'])
+def test_PVSystem_multi_array_get_irradiance_stacked(
+        stacked_system_inputs, mount, model):
+    solar_position, weather = stacked_system_inputs
+    system = _stacked_system(mount)
+    args = (solar_position['apparent_zenith'], solar_position['azimuth'],
+            weather['dni'], weather['ghi'], weather['dhi'])
+    expected = tuple(array.get_irradiance(*args, model=model)
+                     for array in system.arrays)
+    _assert_each_equal(system.get_irradiance(*args, model=model), expected)
+    expected = tuple(array.get_aoi(*args[:2]) for array in system.arrays)
+    _assert_each_equal(system.get_aoi(*args[:2]), expected)
+
+
+def test_PVSystem_multi_array_stacked_models(stacked_system_inputs):
+    solar_position, weather = stacked_system_inputs
+    system = _stacked_system()
+    aoi = system.get_aoi(solar_position['apparent_zenith'],
+                         solar_position['azimuth'])
+    for model in ('physical', 'ashrae', 'martin_ruiz'):
+        expected = tuple(array.get_iam(a, model)
+                         for array, a in zip(system.arrays, aoi))
+        _assert_each_equal(system.get_iam(aoi, model), expected)
+    poa = tuple(irrad['poa_global'] for irrad in system.get_irradiance(
+        solar_position['apparent_zenith'], solar_position['azimuth'],
+        weather['dni'], weather['ghi'], weather['dhi']))
+    for model in ('sapm', 'pvsyst', 'faiman'):
+        expected = tuple(
+            array.get_cell_temperature(p, weather['temp_air'],
+                                       weather['wind_speed'], model)
+            for array, p in zip(system.arrays, poa))
+        _assert_each_equal(
+            system.get_cell_temperature(poa, weather['temp_air'],
+                                        weather['wind_speed'], model),
+            expected)
+    temp_cell = system.get_cell_temperature(
+        poa, weather['temp_air'], weather['wind_speed'], 'sapm')
+    expected = tuple(
+        pvsystem.pvwatts_dc(p, t, array.module_parameters['pdc0'],
+                            array.module_parameters['gamma_pdc'])
+        for array, p, t in zip(system.arrays, poa, temp_cell))
+    _assert_each_equal(system.pvwatts_dc(poa, temp_cell), expected)
+
+
+def test_PVSystem_multi_array_stacked_fallback(stacked_system_inputs):
+    # inputs on different indexes cannot be stacked and are evaluated
+    # one Array at a time
+    solar_position, weather = stacked_system_inputs
+    system = _stacked_system(num_arrays=2)
+    poa = (weather['ghi'], weather['ghi'].iloc[:-1])
+    expected = tuple(
+        array.get_cell_temperature(p, weather['temp_air'],
+                                   weather['wind_speed'], 'sapm')
+        for array, p in zip(system.arrays, poa))
+    _assert_each_equal(
+        system.get_cell_temperature(poa, weather['temp_air'],
+                                    weather['wind_speed'], 'sapm'),
+        expected)
+    assert np.isnan(expected[1].iloc[-1])
+
+
 def test_PVSystem_multi_array_get_irradiance_multi_irrad():
     """Test a system with two identical arrays but different irradiance.
 
@@ -2,11 +2,20 @@
 testing single-diode methods using JW Bishop 1988
 """
 
+from functools import partial
+import pickle
+
 import numpy as np
+import pandas as pd
 from pvlib import pvsystem
 from pvlib.singlediode import (bishop88_mpp, estimate_voc, VOLTAGE_BUILTIN,
-                               bishop88, bishop88_i_from_v, bishop88_v_from_i)
+                               bishop88, bishop88_i_from_v, bishop88_v_from_i,
+                               _bishop88_key_points, SingleDiodeTable,
+                               SingleDiodeCache, _lambertw_of_exp)
+from numpy.testing import assert_allclose
 import pytest
+from scipy.special import lambertw
+from .conftest import requires_numba
 
 POA = 888
 TCELL = 55
@@ -280,3 +289,288 @@ def test_pvsyst_breakdown(method, brk_params, recomb_params, poa, temp_cell,
 
     vsc_88 = bishop88_v_from_i(isc_88, *x, **y, method=method)
     assert np.isclose(vsc_88, 0.0, *tol)
+
+
+@pytest.mark.parametrize('y', [
+    {},
+    {'d2mutau': get_pvsyst_fs_495()['d2mutau'],
+     'NsVbi': VOLTAGE_BUILTIN * get_pvsyst_fs_495()['cells_in_series']},
+    {'breakdown_factor': 1.e-4, 'breakdown_voltage': -5.5,
+     'breakdown_exp': 3.28},
+])
+def test_bishop88_key_points(y):
+    pvsyst_fs_495 = get_pvsyst_fs_495()
+    # more elements than fit in one block, including zero and nan irradiance
+    poa = np.linspace(0, 1200, 5000)
+    poa[10] = np.nan
+    temp_cell = np.linspace(-10, 70, 5000)
+    x = pvsystem.calcparams_pvsyst(
+        effective_irradiance=poa, temp_cell=temp_cell,
+        alpha_sc=pvsyst_fs_495['alpha_sc'],
+        gamma_ref=pvsyst_fs_495['gamma_ref'],
+        mu_gamma=pvsyst_fs_495['mu_gamma'], I_L_ref=pvsyst_fs_495['I_L_ref'],
+        I_o_ref=pvsyst_fs_495['I_o_ref'], R_sh_ref=pvsyst_fs_495['R_sh_ref'],
+        R_sh_0=pvsyst_fs_495['R_sh_0'], R_sh_exp=pvsyst_fs_495['R_sh_exp'],
+        R_s=pvsyst_fs_495['R_s'],
+        cells_in_series=pvsyst_fs_495['cells_in_series'],
+        EgRef=pvsyst_fs_495['EgRef']
+    )
+    out = _bishop88_key_points(*x, **y)
+
+    v_oc = bishop88_v_from_i(0., *x, **y, method='newton')
+    i_mp, v_mp, p_mp = bishop88_mpp(*x, **y, method='newton')
+    expected = (
+        bishop88_i_from_v(0., *x, **y, method='newton'), v_oc,
+        i_mp, v_mp, p_mp,
+        bishop88_i_from_v(v_oc / 2., *x, **y, method='newton'),
+        bishop88_i_from_v((v_oc + v_mp) / 2., *x, **y, method='newton'))
+    for actual, desired in zip(out, expected):
+        assert actual.shape == poa.shape
+        assert_allclose(actual, desired, rtol=1e-6, atol=1e-6)
+    assert np.isnan(out[1][10])
+
+    # scalar inputs give scalar outputs
+    out = _bishop88_key_points(*[v[-1] if np.ndim(v) else v for v in x], **y)
+    for actual, desired in zip(out, expected):
+        assert np.ndim(actual) == 0
+        assert_allclose(actual, desired[-1], rtol=1e-6, atol=1e-6)
+
+
+@pytest.mark.parametrize('resistance_series, resistance_shunt', [
+    (0.5, 300.),
+    (0., 300.),  # explicit solution for current
+    (0.5, np.inf),
+])
+def test_lambertw_mpp(resistance_series, resistance_shunt):
+    photocurrent = np.array([0., 0.5, 2., 5., 7., np.nan])
+    args = (photocurrent, 1e-9, resistance_series, resistance_shunt, 1.6)
+    out = pvsystem.singlediode(*args, method='lambertw')
+    i_mp, v_mp, p_mp = bishop88_mpp(*args, method='newton')
+    assert_allclose(out['v_mp'], v_mp, rtol=1e-6, atol=1e-6)
+    assert_allclose(out['i_mp'], i_mp, rtol=1e-6, atol=1e-6)
+    assert_allclose(out['p_mp'], p_mp, rtol=1e-6, atol=1e-6)
+
+
+def test_lambertw_of_exp():
+    z = np.linspace(-700., 700., 14001)
+    assert_allclose(_lambertw_of_exp(z), lambertw(np.exp(z)).real,
+                    rtol=1e-14, atol=0)
+    # beyond overflow of exp(z), w + log(w) = z
+    z = np.logspace(3, 300, 100)
+    w = _lambertw_of_exp(z)
+    assert_allclose(w + np.log(w), z, rtol=1e-15)
+    assert_allclose(_lambertw_of_exp([-np.inf, 0., np.inf, np.nan]),
+                    [0., lambertw(1.).real, np.inf, np.nan], rtol=1e-15)
+
+
+@requires_numba
+@pytest.mark.parametrize('y', [
+    {},
+    {'d2mutau': get_pvsyst_fs_495()['d2mutau'],
+     'NsVbi': VOLTAGE_BUILTIN * get_pvsyst_fs_495()['cells_in_series']},
+])
+def test_bishop88_brentq_numba(y):
+    pvsyst_fs_495 = get_pvsyst_fs_495()
+    x = pvsystem.calcparams_pvsyst(
+        effective_irradiance=np.linspace(10, 1200, 50),
+        temp_cell=np.linspace(-10, 70, 50),
+        alpha_sc=pvsyst_fs_495['alpha_sc'],
+        gamma_ref=pvsyst_fs_495['gamma_ref'],
+        mu_gamma=pvsyst_fs_495['mu_gamma'], I_L_ref=pvsyst_fs_495['I_L_ref'],
+        I_o_ref=pvsyst_fs_495['I_o_ref'], R_sh_ref=pvsyst_fs_495['R_sh_ref'],
+        R_sh_0=pvsyst_fs_495['R_sh_0'], R_sh_exp=pvsyst_fs_495['R_sh_exp'],
+        R_s=pvsyst_fs_495['R_s'],
+        cells_in_series=pvsyst_fs_495['cells_in_series'],
+        EgRef=pvsyst_fs_495['EgRef']
+    )
+    kwargs = dict(y, method='brentq')
+
+    for how in ['numpy', 'numba']:
+        mpp = bishop88_mpp(*x, **kwargs, how=how)
+        # half of the max power current and voltage, so that all solutions
+        # are bracketed by [0, voc_est]
+        v = bishop88_v_from_i(0.5 * mpp[0], *x, **kwargs, how=how)
+        i = bishop88_i_from_v(0.5 * mpp[1], *x, **kwargs, how=how)
+        if how == 'numpy':
+            expected = mpp + (v, i)
+    for actual, desired in zip(mpp + (v, i), expected):
+        assert_allclose(actual, desired, rtol=1e-9, atol=1e-9)
+
+    # scalars
+    out = bishop88_mpp(*[a[-1] if np.ndim(a) else a for a in x], **kwargs,
+                       how='numba')
+    assert_allclose(out, [e[-1] for e in expected[:3]], rtol=1e-9)
+
+
+@requires_numba
+def test_bishop88_numba_not_bracketed():
+    # the current exceeds the photocurrent, which brentq cannot bracket
+    with pytest.raises(ValueError):
+        bishop88_v_from_i(6., 5., 1e-9, 0.5, 300., 1.6, method='brentq')
+    out = bishop88_v_from_i(np.array([6., 1.]), 5., 1e-9, 0.5, 300., 1.6,
+                            method='brentq', how='numba')
+    assert np.isnan(out[0])
+    assert np.isfinite(out[1])
+
+
+@pytest.mark.parametrize('func', [bishop88_i_from_v, bishop88_v_from_i])
+def test_bishop88_how_invalid(func):
+    with pytest.raises(ValueError, match='how must be'):
+        func(0., 5., 1e-9, 0.5, 300., 1.6, method='brentq', how='cython')
+
+
+@requires_numba
+@pytest.mark.parametrize('func', [bishop88_i_from_v, bishop88_v_from_i])
+def test_bishop88_newton_numba(func):
+    with pytest.raises(NotImplementedError):
+        func(0., 5., 1e-9, 0.5, 300., 1.6, method='newton', how='numba')
+
+
+@pytest.mark.parametrize('func, x', [
+    (bishop88_i_from_v, (5.,)), (bishop88_v_from_i, (3.,)), (bishop88_mpp, ())
+])
+def test_bishop88_warm_start(func, x, cec_module_params):
+    # a smooth time series of irradiance and temperature
+    effective_irradiance = 100 + 900 * np.sin(np.linspace(0, np.pi, 200))
+    temp_cell = 25 + 0.02 * effective_irradiance
+    args = _cec_calcparams(cec_module_params)(effective_irradiance,
+                                              temp_cell)
+    expected = func(*x, *args)
+    cold, cold_info = func(*x, *args, full_output=True)
+    warm, warm_info = func(*x, *args, warm_start=True, full_output=True)
+    assert_allclose(cold, expected, rtol=1e-8)
+    assert_allclose(warm, expected, rtol=1e-8)
+    assert cold_info['iterations'].shape == (200,)
+    assert (warm_info['iterations'] >= 1).all()
+    assert warm_info['iterations'].sum() < cold_info['iterations'].sum()
+
+
+def test_bishop88_warm_start_fallback():
+    # the current exceeds the short circuit current at low irradiance, so
+    # warm starts from the neighbouring solutions don't converge
+    photocurrent = np.linspace(0.5, 6., 40)
+    expected = bishop88_v_from_i(1., photocurrent, 5e-10, 0.3, 300., 1.6)
+    warm = bishop88_v_from_i(1., photocurrent, 5e-10, 0.3, 300., 1.6,
+                             warm_start=True)
+    assert_allclose(warm, expected, rtol=1e-8)
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'warm_start': True}, {'full_output': True}])
+def test_bishop88_warm_start_brentq(kwargs):
+    with pytest.raises(NotImplementedError, match="method='newton'"):
+        bishop88_mpp(5., 1e-9, 0.5, 300., 1.6, method='brentq', **kwargs)
+
+
+def _cec_calcparams(cec_module_params):
+    kwargs = {k: cec_module_params[k] for k in
+              ['alpha_sc', 'a_ref', 'I_L_ref', 'I_o_ref', 'R_sh_ref', 'R_s',
+               'Adjust']}
+    return partial(pvsystem.calcparams_cec, **kwargs)
+
+
+def test_singlediode_table(cec_module_params):
+    calcparams = _cec_calcparams(cec_module_params)
+    table = SingleDiodeTable(calcparams)
+    assert set(table.max_error) == set(SingleDiodeTable.KEY_POINTS)
+    effective_irradiance = pd.Series([0., 0.5, 3., 88.8, 444., 888., 1400.])
+    temp_cell = pd.Series([20., 20., -30., 5., 55., 55., 90.])
+    out = table.evaluate(effective_irradiance, temp_cell)
+    assert isinstance(out, pd.DataFrame)
+    assert_allclose(out.index, effective_irradiance.index)
+    # below the lowest irradiance node
+    assert out.iloc[:2].isna().all(axis=None)
+    expected = pvsystem.singlediode(*calcparams(effective_irradiance[2:],
+                                                temp_cell[2:]))
+    for key in SingleDiodeTable.KEY_POINTS:
+        assert table.max_error[key] < 1e-3
+        assert_allclose(out[key][2:], expected[key],
+                        atol=2 * table.max_error[key])
+
+
+def test_singlediode_table_numeric(cec_module_params):
+    calcparams = _cec_calcparams(cec_module_params)
+    table = SingleDiodeTable(calcparams, irradiance=np.linspace(50, 1000, 20),
+                             temperature=[0., 20., 40., 60., 80.])
+    out = table.evaluate(np.array([[500.], [1200.]]), [25., 45.])
+    assert out['p_mp'].shape == (2, 2)
+    assert np.isnan(out['p_mp'][1]).all()
+    expected = pvsystem.singlediode(*calcparams(500., 25.))
+    for key in SingleDiodeTable.KEY_POINTS:
+        assert_allclose(out[key][0, 0], expected[key], rtol=1e-4)
+    scalar = table.evaluate(500., 25.)
+    assert np.ndim(scalar['p_mp']) == 0
+
+
+@pytest.mark.parametrize('kwargs, match', [
+    ({'irradiance': [0., 100., 200., 300.]}, 'irradiance must be positive'),
+    ({'irradiance': [100., 200., 300.]}, 'irradiance must be a strictly'),
+    ({'temperature': [0., 20., 10., 30.]}, 'temperature must be a strictly'),
+])
+def test_singlediode_table_invalid(cec_module_params, kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        SingleDiodeTable(_cec_calcparams(cec_module_params), **kwargs)
+
+
+def test_singlediode_cache(cec_module_params):
+    calcparams = _cec_calcparams(cec_module_params)
+    cache = SingleDiodeCache(irradiance_resolution=2.,
+                             temperature_resolution=0.5, size=64)
+    assert np.isnan(cache.hit_rate)
+    effective_irradiance = pd.Series([800.4, 799.4, 500., np.nan, 200.])
+    temp_cell = pd.Series([25.1, 24.9, 40., 25., np.nan])
+    out = cache.evaluate(calcparams, cec_module_params, effective_irradiance,
+                         temp_cell)
+    assert isinstance(out, pd.DataFrame)
+    assert out.iloc[3:].isna().all(axis=None)
+    # the key points are solved at the rounded irradiance and temperature
+    expected = pvsystem.singlediode(*calcparams(np.array([800., 800., 500.]),
+                                                np.array([25., 25., 40.])))
+    for key in SingleDiodeCache.KEY_POINTS:
+        assert_allclose(out[key][:3], expected[key])
+    # the first two points share an entry
+    assert (cache.hits, cache.misses) == (1, 2)
+    exact = pvsystem.singlediode(*calcparams(800.4, 25.1))
+    for key in SingleDiodeCache.KEY_POINTS:
+        assert_allclose(cache.max_error[key],
+                        np.abs(exact[key] - expected[key][0]), rtol=1e-8)
+    again = cache.evaluate(calcparams, cec_module_params, 799.5, 25.2)
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert_allclose(again['p_mp'], out['p_mp'][0])
+    assert cache.hit_rate == 0.5
+    # another module doesn't hit the entries of the first one
+    other = dict(cec_module_params, I_L_ref=5.)
+    cache.evaluate(partial(calcparams, I_L_ref=5.), other, 800., 25.)
+    assert (cache.hits, cache.misses) == (2, 3)
+    cache.clear()
+    assert (cache.hits, cache.misses) == (0, 0)
+    assert np.isnan(cache.hit_rate)
+
+
+def test_singlediode_cache_shared(cec_module_params):
+    calcparams = _cec_calcparams(cec_module_params)
+    cache = SingleDiodeCache(size=16, shared=True)
+    out = cache.evaluate(calcparams, cec_module_params,
+                         np.array([[100.], [900.]]), [20., 30., 40.])
+    assert out['p_mp'].shape == (2, 3)
+    assert cache.misses == 6
+    # a copy that isn't shared
+    copy = pickle.loads(pickle.dumps(SingleDiodeCache(size=16)))
+    assert copy.misses == 0
+
+
+def test_singlediode_cache_module_hash(cec_module_params):
+    params = pd.Series(cec_module_params)
+    assert (SingleDiodeCache.module_hash(params) ==
+            SingleDiodeCache.module_hash(dict(reversed(list(params.items())))))
+    assert SingleDiodeCache.module_hash(params) >= 0
+    assert (SingleDiodeCache.module_hash(params) !=
+            SingleDiodeCache.module_hash(params.drop('Adjust')))
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'irradiance_resolution': 0.}, {'temperature_resolution': -1.},
+    {'size': 0}])
+def test_singlediode_cache_invalid(kwargs):
+    with pytest.raises(ValueError):
+        SingleDiodeCache(**kwargs)
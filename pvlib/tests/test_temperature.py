@@ -222,6 +222,13 @@ def test_fuentes_timezone(tz):
                                        name='tmod'))
 
 
+def test_fuentes_one_time():
+    index = pd.date_range('2019-01-01', freq='h', periods=1)
+    poa_global = pd.Series(1000., index)
+    with pytest.raises(ValueError, match='at least two times'):
+        temperature.fuentes(poa_global, 20., 1., noct_installed=45)
+
+
 def test_noct_sam():
     poa_global, temp_air, wind_speed, noct, module_efficiency = (
         1000., 25., 1., 45., 0.2)
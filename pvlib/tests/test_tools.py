@@ -1,6 +1,9 @@
+import numpy as np
 import pytest
+from numpy.testing import assert_allclose
 
 from pvlib import tools
+from .conftest import requires_numba
 
 
 @pytest.mark.parametrize('keys, input_dict, expected', [
@@ -12,3 +15,26 @@ from pvlib import tools
 def test_build_kwargs(keys, input_dict, expected):
     kwargs = tools._build_kwargs(keys, input_dict)
     assert kwargs == expected
+
+
+@pytest.mark.parametrize('func', [tools.cosd, tools.sind])
+def test_cosd_sind_float32(func):
+    angles = np.linspace(-360, 360, 1441, dtype=np.float32)
+    out = func(angles)
+    assert out.dtype == np.float32
+    assert_allclose(out, func(angles.astype(np.float64)), atol=1e-6)
+
+
+@requires_numba
+@pytest.mark.parametrize('module', [
+    '_irradiance_kernels', '_singlediode_kernels', '_modelchain_kernels'])
+def test__use_kernels(module):
+    assert tools._use_kernels('numba', module)
+    assert not tools._use_kernels('numpy', module)
+
+
+def test__use_kernels_fallback():
+    with pytest.warns(UserWarning, match='falling back to numpy'):
+        assert not tools._use_kernels('numba', '_missing_kernels')
+    with pytest.raises(ValueError, match='how must be'):
+        tools._use_kernels('fast', '_irradiance_kernels')
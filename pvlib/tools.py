@@ -3,6 +3,9 @@ Collection of functions used in pvlib_python
 """
 
 import datetime as dt
+import importlib
+import warnings
+
 import numpy as np
 import pandas as pd
 import pytz
@@ -20,7 +23,8 @@ def cosd(angle):
     Returns
     -------
     result : float or array-like
-        Cosine of the angle
+        Cosine of the angle. Floating point inputs keep their dtype, e.g.
+        float32 inputs are not upcast to float64.
     """
 
     res = np.cos(np.radians(angle))
@@ -39,7 +43,8 @@ def sind(angle):
     Returns
     -------
     result : float
-        Sin of the angle
+        Sin of the angle. Floating point inputs keep their dtype, e.g.
+        float32 inputs are not upcast to float64.
     """
 
     res = np.sin(np.radians(angle))
@@ -275,72 +280,38 @@ def _build_args(keys, input_dict, dict_name):
     return args
 
 
-# Created April,2014
-# Author: Rob Andrews, Calama Consulting
-
-def _golden_sect_DataFrame(params, VL, VH, func):
+def _use_kernels(how, module):
     """
-    Vectorized golden section search for finding MPP from a dataframe
-    timeseries.
+    Determine whether the compiled kernels in ``pvlib.<module>`` should be
+    used.
 
     Parameters
     ----------
-    params : dict
-        Dictionary containing scalars or arrays
-        of inputs to the function to be optimized.
-        Each row should represent an independent optimization.
-
-    VL: float
-        Lower bound of the optimization
-
-    VH: float
-        Upper bound of the optimization
-
-    func: function
-        Function to be optimized must be in the form f(array-like, x)
+    how : str
+        ``'numpy'`` or ``'numba'``.
+    module : str
+        Name of the kernel module, e.g. ``'_irradiance_kernels'``.
 
     Returns
     -------
-    func(df,'V1') : DataFrame
-        function evaluated at the optimal point
-
-    df['V1']: Dataframe
-        Dataframe of optimal points
-
-    Notes
-    -----
-    This function will find the MAXIMUM of a function
+    bool
+        True if ``how`` is ``'numba'`` and the module can be imported.
+        If numba is not available, a warning is issued and False returned.
+
+    Raises
+    ------
+    ValueError
+        If ``how`` is not ``'numpy'`` or ``'numba'``.
     """
-
-    df = params
-    df['VH'] = VH
-    df['VL'] = VL
-
-    errflag = True
-    iterations = 0
-
-    while errflag:
-
-        phi = (np.sqrt(5)-1)/2*(df['VH']-df['VL'])
-        df['V1'] = df['VL'] + phi
-        df['V2'] = df['VH'] - phi
-
-        df['f1'] = func(df, 'V1')
-        df['f2'] = func(df, 'V2')
-        df['SW_Flag'] = df['f1'] > df['f2']
-
-        df['VL'] = df['V2']*df['SW_Flag'] + df['VL']*(~df['SW_Flag'])
-        df['VH'] = df['V1']*~df['SW_Flag'] + df['VH']*(df['SW_Flag'])
-
-        err = df['V1'] - df['V2']
+    if how == 'numpy':
+        return False
+    elif how == 'numba':
         try:
-            errflag = (abs(err) > .01).any()
-        except ValueError:
-            errflag = (abs(err) > .01)
-
-        iterations += 1
-
-        if iterations > 50:
-            raise Exception("EXCEPTION:iterations exceeded maximum (50)")
-
-    return func(df, 'V1'), df['V1']
+            importlib.import_module('pvlib.' + module)
+        except ImportError:
+            warnings.warn('Could not import numba, falling back to numpy '
+                          'calculation')
+            return False
+        return True
+    else:
+        raise ValueError("how must be either 'numba' or 'numpy'")